@@ -0,0 +1,204 @@
+"""
+cases.py
+------------------------
+벤치마크 케이스 정의: 같은 합성 데이터로 각 변환 경로(xlsx/pkl ↔ SQLite/MySQL, db2js)를 실행
+"""
+
+import os
+import shutil
+import sqlite3
+
+from sqlalchemy import text
+from sqlalchemy.engine.url import make_url
+
+from mysql.frommysql.mysql2pkl import export_to_pkl as mysql_export_pkl
+from mysql.frommysql.mysql2sqlite import export_to_sqlite as mysql_export_sqlite
+from mysql.frommysql.mysql2xlsx import export_to_xlsx as mysql_export_xlsx
+from mysql.services.engine_factory import create_mysql_engine, dispose_mysql_engine
+from mysql.tomysql.chunked_loader import load_dataframe_in_chunks
+from mysql.tomysql.pkl2mysql import import_from_pkl as mysql_import_pkl
+from mysql.tomysql.sqlite2mysql import import_from_sqlite as mysql_import_sqlite
+from mysql.tomysql.xlsx2mysql import import_from_xlsx as mysql_import_xlsx
+from sqlite.fromsqlite.sqlite2pkl import export_to_pkl as sqlite_export_pkl
+from sqlite.fromsqlite.sqlite2xlsx import export_to_xlsx as sqlite_export_xlsx
+from sqlite.tosqlite.bulk_loader import bulk_load_dataframe
+from sqlite.tosqlite.pkl2sqlite import import_from_pkl as sqlite_import_pkl
+from sqlite.tosqlite.xlsx2sqlite import import_from_xlsx as sqlite_import_xlsx
+from sqlite.utils.convert_db_to_base64 import convert_db_to_js
+from storage.pickle_codec import write_pickle
+
+
+TABLE = "bench_data"
+
+
+# --- Fixtures (prepared once per run, not timed) ---
+
+def prepare_fixtures(df, workdir, case_names, mysql_url=None):
+    """
+    Write the inputs the selected cases read: data.pkl, data.xlsx (only if an
+    xlsx import is selected), fixture.db and the MySQL `bench_data` table.
+
+    Returns:
+        dict: Context passed to every case.
+    """
+    os.makedirs(workdir, exist_ok=True)
+    ctx = {
+        "workdir": workdir,
+        "rows": len(df),
+        "pkl_path": os.path.join(workdir, "data.pkl"),
+        "xlsx_path": os.path.join(workdir, "data.xlsx"),
+        "db_path": os.path.join(workdir, "fixture.db"),
+        "mysql_url": mysql_url,
+    }
+    write_pickle(df, ctx["pkl_path"])
+    if any(CASES[name]["input"] == "xlsx" for name in case_names):
+        df.to_excel(ctx["xlsx_path"], index=False)
+
+    if os.path.exists(ctx["db_path"]):
+        os.remove(ctx["db_path"])
+    conn = sqlite3.connect(ctx["db_path"])
+    try:
+        bulk_load_dataframe(conn, df, TABLE, log=lambda _: None)
+    finally:
+        conn.close()
+
+    if mysql_url and any(CASES[name]["target"] == "mysql" for name in case_names):
+        engine = create_mysql_engine(mysql_url)
+        try:
+            load_dataframe_in_chunks(df, TABLE, engine, "replace", "multi", log=lambda _: None)
+        finally:
+            dispose_mysql_engine(engine)
+    return ctx
+
+
+# --- Cases: each returns {'rows', 'bytes_written'} ---
+
+def _out(ctx, name):
+    """Fresh output directory per case, so multi-file outputs (chunked db2js) are all counted."""
+    folder = os.path.join(ctx["workdir"], "out", os.path.splitext(name)[0])
+    shutil.rmtree(folder, ignore_errors=True)
+    os.makedirs(folder)
+    return os.path.join(folder, name)
+
+
+def _file_result(ctx, path):
+    folder = os.path.dirname(path)
+    size = sum(os.path.getsize(os.path.join(folder, f)) for f in os.listdir(folder))
+    return {"rows": ctx["rows"], "bytes_written": size}
+
+
+def _mysql_config(url):
+    u = make_url(url)
+    return {"user": u.username, "password": u.password, "host": u.host, "port": u.port or 3306, "database": u.database}
+
+
+def _mysql_result(ctx, table):
+    """Row count and on-disk size (data + index) of a MySQL table."""
+    engine = create_mysql_engine(ctx["mysql_url"])
+    try:
+        with engine.connect() as conn:
+            conn.execute(text(f"ANALYZE TABLE `{table}`")).fetchall()
+            rows = conn.execute(text(f"SELECT COUNT(*) FROM `{table}`")).scalar()
+            size = conn.execute(
+                text(
+                    "SELECT DATA_LENGTH + INDEX_LENGTH FROM information_schema.tables "
+                    "WHERE table_schema = DATABASE() AND table_name = :tbl"
+                ),
+                {"tbl": table},
+            ).scalar()
+        return {"rows": rows, "bytes_written": int(size or 0)}
+    finally:
+        dispose_mysql_engine(engine)
+
+
+def pkl2sqlite(ctx):
+    out = _out(ctx, "pkl2sqlite.db")
+    sqlite_import_pkl(out, ctx["pkl_path"], "single", target_table=TABLE)
+    return _file_result(ctx, out)
+
+
+def xlsx2sqlite(ctx):
+    out = _out(ctx, "xlsx2sqlite.db")
+    sqlite_import_xlsx(out, ctx["xlsx_path"], "single", target_table=TABLE)
+    return _file_result(ctx, out)
+
+
+def sqlite2pkl(ctx):
+    out = _out(ctx, "sqlite2pkl.pkl")
+    sqlite_export_pkl(ctx["db_path"], "table", TABLE, output_path=out)
+    return _file_result(ctx, out)
+
+
+def sqlite2xlsx(ctx):
+    out = _out(ctx, "sqlite2xlsx.xlsx")
+    sqlite_export_xlsx(ctx["db_path"], "table", TABLE, output_path=out)
+    return _file_result(ctx, out)
+
+
+def db2js(ctx):
+    out = _out(ctx, "db2js.js")
+    convert_db_to_js(ctx["db_path"], out)
+    return _file_result(ctx, out)
+
+
+def db2js_chunked(ctx):
+    out = _out(ctx, "db2js_chunked.js")
+    convert_db_to_js(ctx["db_path"], out, compression="gzip", output_mode="chunked")
+    return _file_result(ctx, out)
+
+
+def pkl2mysql(ctx):
+    mysql_import_pkl(
+        _mysql_config(ctx["mysql_url"]), ctx["pkl_path"], "single", target_table="bench_pkl",
+        journal_path=os.path.join(ctx["workdir"], "import_journal.json"),
+    )
+    return _mysql_result(ctx, "bench_pkl")
+
+
+def xlsx2mysql(ctx):
+    mysql_import_xlsx(ctx["mysql_url"], ctx["xlsx_path"], "single", target_table="bench_xlsx")
+    return _mysql_result(ctx, "bench_xlsx")
+
+
+def sqlite2mysql(ctx):
+    mysql_import_sqlite(_mysql_config(ctx["mysql_url"]), ctx["db_path"], "single", TABLE, "bench_sqlite")
+    return _mysql_result(ctx, "bench_sqlite")
+
+
+def mysql2pkl(ctx):
+    out = _out(ctx, "mysql2pkl.pkl")
+    mysql_export_pkl(ctx["mysql_url"], "table", TABLE, output_path=out)
+    return _file_result(ctx, out)
+
+
+def mysql2xlsx(ctx):
+    out = _out(ctx, "mysql2xlsx.xlsx")
+    mysql_export_xlsx(ctx["mysql_url"], "table", TABLE, output_path=out)
+    return _file_result(ctx, out)
+
+
+def mysql2sqlite(ctx):
+    out = _out(ctx, "mysql2sqlite.db")
+    engine = create_mysql_engine(ctx["mysql_url"])
+    try:
+        mysql_export_sqlite(engine, "table", TABLE, output_path=out)
+    finally:
+        dispose_mysql_engine(engine)
+    return _file_result(ctx, out)
+
+
+# name -> {'fn', 'input' (fixture read), 'target' ('sqlite' cases always run, 'mysql' needs a URL)}
+CASES = {
+    "pkl2sqlite": {"fn": pkl2sqlite, "input": "pkl", "target": "sqlite"},
+    "xlsx2sqlite": {"fn": xlsx2sqlite, "input": "xlsx", "target": "sqlite"},
+    "sqlite2pkl": {"fn": sqlite2pkl, "input": "db", "target": "sqlite"},
+    "sqlite2xlsx": {"fn": sqlite2xlsx, "input": "db", "target": "sqlite"},
+    "db2js": {"fn": db2js, "input": "db", "target": "sqlite"},
+    "db2js_chunked": {"fn": db2js_chunked, "input": "db", "target": "sqlite"},
+    "pkl2mysql": {"fn": pkl2mysql, "input": "pkl", "target": "mysql"},
+    "xlsx2mysql": {"fn": xlsx2mysql, "input": "xlsx", "target": "mysql"},
+    "sqlite2mysql": {"fn": sqlite2mysql, "input": "db", "target": "mysql"},
+    "mysql2pkl": {"fn": mysql2pkl, "input": "mysql", "target": "mysql"},
+    "mysql2xlsx": {"fn": mysql2xlsx, "input": "mysql", "target": "mysql"},
+    "mysql2sqlite": {"fn": mysql2sqlite, "input": "mysql", "target": "mysql"},
+}
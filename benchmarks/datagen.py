@@ -0,0 +1,139 @@
+"""
+datagen.py
+------------------------
+벤치마크용 합성 DataFrame 생성기 (행/컬럼 수, 타입 구성, 텍스트 길이, 한글 비율, NULL 비율, seed 고정)
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+
+DTYPES = ("int", "float", "text", "datetime", "bool")
+DEFAULT_DTYPE_MIX = "int:3,float:2,text:4,datetime:1,bool:1"
+_HANGUL_FIRST, _HANGUL_LAST = 0xAC00, 0xD7A3
+_ASCII = np.array(list("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 "))
+# Distinct strings generated per text column; values are sampled from this pool
+_TEXT_POOL = 20000
+
+
+def parse_dtype_mix(text):
+    """Parse 'int:3,float:2,text:4' into {'int': 3, 'float': 2, 'text': 4} (relative weights)."""
+    mix = {}
+    for entry in (text or DEFAULT_DTYPE_MIX).split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, _, weight = entry.partition(":")
+        name = name.strip().lower()
+        if name not in DTYPES:
+            raise ValueError(f"지원하지 않는 타입입니다: {name} (지원: {', '.join(DTYPES)})")
+        mix[name] = float(weight or 1)
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError("타입 구성이 비어 있습니다.")
+    return mix
+
+
+def column_kinds(columns, dtype_mix):
+    """Distribute `columns` - 1 data columns over the mix by largest remainder (column 0 is 'id')."""
+    mix = parse_dtype_mix(dtype_mix) if isinstance(dtype_mix, str) else dtype_mix
+    slots = max(0, int(columns) - 1)
+    total = sum(mix.values())
+    exact = {k: slots * w / total for k, w in mix.items()}
+    counts = {k: int(v) for k, v in exact.items()}
+    for k in sorted(exact, key=lambda k: exact[k] - counts[k], reverse=True)[:slots - sum(counts.values())]:
+        counts[k] += 1
+    kinds = []
+    while len(kinds) < slots:  # interleave so every kind appears early
+        for k in mix:
+            if counts[k]:
+                kinds.append(k)
+                counts[k] -= 1
+    return kinds
+
+
+def generate_dataframe(rows=100000, columns=12, dtype_mix=DEFAULT_DTYPE_MIX, text_width=24,
+                       korean_ratio=0.5, null_ratio=0.05, seed=42):
+    """
+    Build a reproducible synthetic DataFrame.
+
+    Column 0 is a unique integer `id` without NULLs; the rest follow
+    `dtype_mix`. Text values average `text_width` characters and a
+    `korean_ratio` share of them are Hangul. Every data column gets
+    `null_ratio` missing values (nullable Int64/boolean, NaN, NaT, None).
+
+    Returns:
+        pd.DataFrame
+    """
+    rng = np.random.default_rng(seed)
+    rows = int(rows)
+    data = {"id": np.arange(1, rows + 1, dtype=np.int64)}
+    for i, kind in enumerate(column_kinds(columns, dtype_mix), start=1):
+        name = f"{kind}_{i}"
+        nulls = rng.random(rows) < null_ratio if null_ratio > 0 else None
+        if kind == "int":
+            values = pd.array(rng.integers(-1_000_000, 1_000_000, rows), dtype="Int64")
+        elif kind == "float":
+            values = np.round(rng.normal(1000, 250, rows), 4)
+        elif kind == "text":
+            pool = _text_pool(rng, min(rows, _TEXT_POOL) or 1, text_width, korean_ratio)
+            values = pool[rng.integers(0, len(pool), rows)]
+        elif kind == "datetime":
+            seconds = rng.integers(0, 5 * 365 * 86400, rows)
+            values = pd.Timestamp("2020-01-01") + pd.to_timedelta(seconds, unit="s")
+        else:
+            values = pd.array(rng.random(rows) < 0.5, dtype="boolean")
+        series = pd.Series(values)
+        if nulls is not None and nulls.any():
+            series = series.mask(nulls)
+        data[name] = series.to_numpy() if kind in ("float", "text") else series
+    return pd.DataFrame(data)
+
+
+def describe(df):
+    kinds = df.dtypes.astype(str).value_counts().to_dict()
+    return f"{len(df):,} rows x {df.shape[1]} columns ({', '.join(f'{k}: {v}' for k, v in kinds.items())})"
+
+
+def _text_pool(rng, size, width, korean_ratio):
+    width = max(1, int(width))
+    lengths = rng.integers(max(1, width // 2), width + width // 2 + 1, size)
+    korean = rng.random(size) < korean_ratio
+    pool = np.empty(size, dtype=object)
+    for i in range(size):
+        if korean[i]:
+            codes = rng.integers(_HANGUL_FIRST, _HANGUL_LAST + 1, lengths[i])
+            # Spaces every few syllables, like real sentences
+            text = "".join(chr(c) for c in codes)
+            pool[i] = " ".join(text[j:j + 4] for j in range(0, len(text), 4))[:lengths[i]]
+        else:
+            pool[i] = "".join(rng.choice(_ASCII, lengths[i]))
+    return pool
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 데이터 생성 (Pickle/Excel)")
+    parser.add_argument("output", help=".pkl 또는 .xlsx 출력 경로")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--columns", type=int, default=12)
+    parser.add_argument("--dtype-mix", default=DEFAULT_DTYPE_MIX)
+    parser.add_argument("--text-width", type=int, default=24)
+    parser.add_argument("--korean-ratio", type=float, default=0.5)
+    parser.add_argument("--null-ratio", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    df = generate_dataframe(args.rows, args.columns, args.dtype_mix, args.text_width,
+                            args.korean_ratio, args.null_ratio, args.seed)
+    if args.output.endswith(".xlsx"):
+        df.to_excel(args.output, index=False)
+    else:
+        df.to_pickle(args.output)
+    print(f"✅ {describe(df)} -> {args.output} ({os.path.getsize(args.output) / 1048576:.2f} MB)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+import datetime
+import os
+import pickle
+import struct
+import sys
+import time
+
+import pandas as pd
+
+from storage.pickle_codec import available_codecs, compress_bytes, decompress_bytes
+
+
+ARCHIVE_EXTENSION = ".delarc"
+
+_MAGIC = b"SQLHARC1"
+_FRAME_HEADER = struct.Struct(">Q")
+
+
+def default_codec():
+    """zstd when installed, else lz4, else gzip (always available)."""
+    codecs = available_codecs()
+    return next(c for c in ("zstd", "lz4", "gzip") if c in codecs)
+
+
+class DeleteArchive:
+    """
+    Append-only archive of rows removed by the cleaner.
+
+    The file is a magic string followed by length-prefixed compressed
+    pickle frames: first a header dict, then one DataFrame per delete batch,
+    so pandas keeps each batch column-wise and restore never needs more than
+    one batch in memory. Every frame is fsync'ed before the batch's DELETE
+    commits; if the transaction fails, `truncate(mark)` drops the frame again
+    so the archive holds exactly the committed deletes.
+    """
+
+    def __init__(self, path, table, key_cols, db_name=None, codec=None):
+        self.path = path
+        self.codec = codec or default_codec()
+        self.rows = 0
+        self.batches = 0
+        self.raw_bytes = 0
+        self.write_s = 0.0
+        self._frames = []  # (offset, rows) of each batch frame, for truncate()
+        self._file = open(path, "wb")
+        self._file.write(_MAGIC)
+        self._write_frame({
+            "table": table,
+            "key_cols": list(key_cols),
+            "db_name": db_name,
+            "codec": self.codec,
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        })
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def append(self, columns, rows):
+        """Write one batch of rows (as returned by SELECT *) as a columnar frame."""
+        if not rows:
+            return
+        started = time.perf_counter()
+        self._frames.append((self.tell(), len(rows)))
+        self._write_frame(pd.DataFrame.from_records(rows, columns=list(columns)))
+        self.rows += len(rows)
+        self.batches += 1
+        self.write_s += time.perf_counter() - started
+
+    def truncate(self, mark: int):
+        """Drop frames written after `mark` (a previous tell()) — used when a batch rolls back."""
+        self._file.seek(mark)
+        self._file.truncate()
+        os.fsync(self._file.fileno())
+        while self._frames and self._frames[-1][0] >= mark:
+            self.rows -= self._frames.pop()[1]
+            self.batches -= 1
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def summary(self) -> str:
+        size = os.path.getsize(self.path)
+        ratio = size / self.raw_bytes if self.raw_bytes else 1.0
+        return (
+            f"{self.rows:,}건 / {self.batches:,}개 배치 | {size / 1048576:.2f} MB "
+            f"({self.codec}, 압축률 {ratio:.2f}) | 기록 {self.write_s:.2f}초"
+        )
+
+    def _write_frame(self, obj):
+        raw = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        self.raw_bytes += len(raw)
+        payload = compress_bytes(raw, self.codec)
+        self._file.write(_FRAME_HEADER.pack(len(payload)))
+        self._file.write(payload)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+
+def read_archive(path):
+    """
+    Open an archive written by DeleteArchive.
+
+    Returns:
+        tuple: (header dict, generator of one DataFrame per archived batch).
+    """
+    f = open(path, "rb")
+    if f.read(len(_MAGIC)) != _MAGIC:
+        f.close()
+        raise ValueError(f"삭제 아카이브 파일이 아닙니다: {path}")
+    header = _read_frame(f)
+
+    def _frames():
+        with f:
+            while True:
+                frame = _read_frame(f)
+                if frame is None:
+                    return
+                yield frame
+
+    return header, _frames()
+
+
+def restore_archive(path, engine, table=None, chunk_size=None, log=print, retry=None):
+    """
+    Re-insert archived rows with the chunked bulk loader.
+
+    Rows whose key already exists are skipped (INSERT IGNORE), so a restore
+    that stopped half-way can simply be run again.
+
+    Args:
+        table (str): Target table; defaults to the table the rows came from.
+
+    Returns:
+        int: Rows sent to the server.
+    """
+    from mysql.tomysql.chunked_loader import DEFAULT_CHUNK_SIZE, load_dataframe_in_chunks
+    from mysql.tomysql.pkl2mysql import _insert_ignore
+
+    header, frames = read_archive(path)
+    table = table or header["table"]
+    log(f"♻️ 아카이브 복원: {os.path.basename(path)} → {table} (원본 {header.get('db_name') or '-'}.{header['table']}, {header['created']})")
+
+    total = 0
+    for batch_no, df in enumerate(frames, 1):
+        total += load_dataframe_in_chunks(
+            df, table, engine, "append", _insert_ignore,
+            chunk_size=chunk_size or DEFAULT_CHUNK_SIZE,
+            log=log,
+            retry=retry,
+        )
+        log(f"  · 배치 {batch_no}: {len(df):,}건, 누적 {total:,}건")
+    log(f"✅ 복원 완료: {total:,}건")
+    return total
+
+
+def _read_frame(f):
+    head = f.read(_FRAME_HEADER.size)
+    if not head:
+        return None
+    if len(head) < _FRAME_HEADER.size:
+        raise ValueError("아카이브 파일이 손상되었습니다 (프레임 헤더가 잘림).")
+    (length,) = _FRAME_HEADER.unpack(head)
+    payload = f.read(length)
+    if len(payload) < length:
+        raise ValueError("아카이브 파일이 손상되었습니다 (프레임이 잘림).")
+    return pickle.loads(decompress_bytes(payload))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 3 and sys.argv[1] == "restore":
+        from mysql.services.engine_factory import create_mysql_engine, dispose_mysql_engine
+
+        db_url = sys.argv[3] if len(sys.argv) > 3 else os.getenv("DB_URL")
+        if not db_url:
+            sys.exit("DB URL을 인자나 DB_URL 환경변수로 지정하세요.")
+        engine = create_mysql_engine(db_url)
+        try:
+            restore_archive(sys.argv[2], engine, table=sys.argv[4] if len(sys.argv) > 4 else None)
+        finally:
+            dispose_mysql_engine(engine)
+    elif len(sys.argv) >= 3 and sys.argv[1] == "info":
+        header, frames = read_archive(sys.argv[2])
+        print(header)
+        print(f"{sum(len(df) for df in frames):,} rows")
+    else:
+        print(f"Usage: python -m cleaner.archive restore <file{ARCHIVE_EXTENSION}> [db_url] [table]")
+        print(f"       python -m cleaner.archive info <file{ARCHIVE_EXTENSION}>")
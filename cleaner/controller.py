@@ -1,23 +1,54 @@
+import datetime
+import os
 import threading
-from tkinter import messagebox
+from concurrent.futures import Future
+from tkinter import filedialog, messagebox
 
 import sqlalchemy
 
+from mysql.services.engine_factory import create_mysql_engine, dispose_mysql_engine
+from .archive import ARCHIVE_EXTENSION, DeleteArchive, restore_archive
+from .delete_engine import (
+    DeleteThrottle,
+    delete_ids_in_batches,
+    delete_matching_in_chunks,
+    replica_lag_probe,
+)
+from .row_count import count_in_key_chunks, estimate_matching_rows
+from .schema_keys import detect_key_columns, explain_warnings, key_compare_sql, key_order_sql
+
 
 class CleanerController:
     def __init__(self, view, connection_manager):
         self._view = view
         self._conn_mgr = connection_manager
-        self._id_col = None
+        self._key_cols = []
         self._columns = []
         self._last_query = None
         self._last_page_max_id = None
         self._current_page_first_id = None
         self._current_page_last_id = None
-
-        view.bind_event("query",      self._on_query)
-        view.bind_event("next_page",  self._on_next_page)
-        view.bind_event("delete_key", self._on_delete_key)
+        self._stop_delete = threading.Event()
+        # (table, where, start_id, end_id, after_id, limit) -> Future of _fetch_page
+        self._prefetch_cache = {}
+        # table -> (key_cols, source); refreshed on every new query
+        self._key_cache = {}
+        # Matching-row total of the current query: estimate first, exact once counted
+        self._count_stop = threading.Event()
+        self._count_gen = 0
+        self._match_total = None
+        self._match_source = ""
+        self._count_status = ""
+        self._count_running = False
+        self._paged_rows = 0
+
+        view.bind_event("query",       self._on_query)
+        view.bind_event("next_page",   self._on_next_page)
+        view.bind_event("delete_key",  self._on_delete_key)
+        view.bind_event("delete_all",  self._on_delete_all)
+        view.bind_event("stop_delete", self._on_stop_delete)
+        view.bind_event("stop_count",  self._on_stop_count)
+        view.bind_event("restore_archive", self._on_restore_archive)
 
         self._refresh_conn_label()
 
@@ -61,6 +92,9 @@ class CleanerController:
         msg += f" LIMIT {limit}"
         self._view.log(msg)
         self._view.set_next_enabled(False)
+        self._invalidate_prefetch()
+        self._key_cache.clear()
+        self._cancel_count()
 
         threading.Thread(
             target=self._do_query,
@@ -79,7 +113,7 @@ class CleanerController:
             messagebox.showwarning("조회 필요", "먼저 첫 조회를 실행하세요.")
             return
 
-        if not self._id_col:
+        if not self._key_cols:
             messagebox.showwarning("키 컬럼 없음", "키 컬럼이 감지된 테이블만 다음 묶음 조회를 지원합니다.")
             return
 
@@ -89,23 +123,78 @@ class CleanerController:
 
         last_query = self._last_query
         self._view.log(
-            f"\n[다음 조회] {last_query['table']} | {self._id_col} > {self._last_page_max_id} LIMIT {last_query['limit']}"
+            f"\n[다음 조회] {last_query['table']} | ({self._key_label()}) > {self._last_page_max_id} LIMIT {last_query['limit']}"
         )
         self._view.set_next_enabled(False)
 
+        args = (
+            last_query["table"],
+            last_query["where"],
+            last_query["limit"],
+            last_query["start_id"],
+            last_query["end_id"],
+            self._last_page_max_id,
+        )
+        prefetched = self._prefetch_cache.pop(self._prefetch_key(*args), None)
         threading.Thread(
             target=self._do_query,
-            args=(
-                last_query["table"],
-                last_query["where"],
-                last_query["limit"],
-                last_query["start_id"],
-                last_query["end_id"],
-                self._last_page_max_id,
-            ),
+            args=args + (prefetched,),
             daemon=True,
         ).start()
 
+    def _fetch_page(self, table, where, limit, start_id, end_id, after_id):
+        """
+        Run one page query; no UI access.
+
+        Returns:
+            dict: {'cols', 'key_cols', 'key_source', 'rows', 'sql', 'warnings'}.
+            'warnings' holds EXPLAIN findings for the first page of a query.
+        """
+        engine = self._conn_mgr.get_engine()
+        with engine.connect() as conn:
+            key_info = self._key_cache.get(table)
+            if key_info is None:
+                meta = conn.execute(sqlalchemy.text(f"SELECT * FROM `{table}` LIMIT 0"))
+                key_info = detect_key_columns(conn, table, list(meta.keys()))
+                self._key_cache[table] = key_info
+            key_cols, key_source = key_info
+
+            if (start_id or end_id or after_id is not None) and not key_cols:
+                raise ValueError("키 컬럼이 감지되지 않아 ID 범위를 사용할 수 없습니다.")
+
+            sql, params = self._build_query(
+                table=table,
+                where=where,
+                limit=limit,
+                key_cols=key_cols,
+                start_id=start_id,
+                end_id=end_id,
+                after_id=after_id,
+            )
+            warnings = []
+            if after_id is None:
+                try:
+                    warnings = explain_warnings(conn, sql, params)
+                except Exception as e:
+                    warnings = [f"⚠️ EXPLAIN 실패: {e}"]
+            if key_source == "heuristic (no index)":
+                warnings.append(
+                    f"⚠️ PK/UNIQUE 인덱스가 없어 '{key_cols[0]}' 컬럼을 키로 사용합니다. "
+                    f"인덱스가 없어 페이지마다 전체 정렬이 발생할 수 있습니다."
+                )
+
+            result = conn.execute(sqlalchemy.text(sql), params)
+            cols = list(result.keys())
+            rows = [tuple(row) for row in result.fetchall()]
+        return {
+            "cols": cols,
+            "key_cols": key_cols,
+            "key_source": key_source,
+            "rows": rows,
+            "sql": sql,
+            "warnings": warnings,
+        }
+
     def _do_query(
         self,
         table: str,
@@ -114,38 +203,28 @@ class CleanerController:
         start_id: str,
         end_id: str,
         after_id,
+        prefetched=None,
     ):
         # All UI writes go through after() — never call tkinter directly here
         schedule = self._view.schedule
 
-        engine = self._conn_mgr.get_engine()
         try:
-            with engine.connect() as conn:
-                meta = conn.execute(sqlalchemy.text(f"SELECT * FROM `{table}` LIMIT 0"))
-                cols = list(meta.keys())
-                id_col = self._detect_id_col(cols)
-
-                if (start_id or end_id or after_id is not None) and not id_col:
-                    raise ValueError("키 컬럼이 감지되지 않아 ID 범위를 사용할 수 없습니다.")
-
-                sql, params = self._build_query(
-                    table=table,
-                    where=where,
-                    limit=limit,
-                    id_col=id_col,
-                    start_id=start_id,
-                    end_id=end_id,
-                    after_id=after_id,
-                )
-                schedule(lambda m=f"  SQL → {sql}": self._view.log(m))
-
-                result = conn.execute(sqlalchemy.text(sql), params)
-                cols = list(result.keys())
-                rows = [tuple(row) for row in result.fetchall()]
+            page = None
+            if prefetched is not None:
+                try:
+                    page = prefetched.result()
+                    schedule(lambda m=f"  SQL → {page['sql']} (미리 불러온 페이지)": self._view.log(m))
+                except Exception:
+                    page = None  # fall back to a fresh query below
+            if page is None:
+                page = self._fetch_page(table, where, limit, start_id, end_id, after_id)
+                schedule(lambda m=f"  SQL → {page['sql']}": self._view.log(m))
+            for warning in page["warnings"]:
+                schedule(lambda m=f"  {warning}": self._view.log(m))
+            cols, key_cols, rows = page["cols"], page["key_cols"], page["rows"]
 
             self._columns = cols
-            self._id_col = id_col
-            id_col = self._id_col
+            self._key_cols = key_cols
             self._last_query = {
                 "table": table,
                 "where": where,
@@ -154,15 +233,16 @@ class CleanerController:
                 "end_id": end_id,
             }
             self._current_page_first_id, self._current_page_last_id = self._get_page_id_bounds(
-                rows, cols, id_col
+                rows, cols, key_cols
             )
             self._last_page_max_id = self._current_page_last_id
 
-            msg = f"  → {len(rows):,}건 조회 완료 | 키 컬럼: {id_col or '감지 실패'}"
-            if rows and self._last_page_max_id is not None and id_col:
+            key_text = f"{self._key_label()} ({page['key_source']})" if key_cols else "감지 실패"
+            msg = f"  → {len(rows):,}건 조회 완료 | 키 컬럼: {key_text}"
+            if rows and self._last_page_max_id is not None and key_cols:
                 msg += f" | 현재 범위: {self._current_page_first_id} ~ {self._last_page_max_id}"
             schedule(lambda m=msg: self._view.log(m))
-            schedule(lambda: self._apply_results(cols, rows))
+            schedule(lambda: self._apply_results(cols, rows, first_page=after_id is None))
 
         except Exception as e:
             self._last_page_max_id = None
@@ -171,52 +251,228 @@ class CleanerController:
             schedule(lambda: self._view.set_next_enabled(False))
             schedule(lambda m=f"[오류] 조회 실패: {e}": self._view.log(m))
 
-    def _apply_results(self, cols, rows):
+    def _apply_results(self, cols, rows, first_page=True):
         self._view.set_columns(cols)
-        self._view.set_id_col_label(self._id_col or "없음")
-        self._view.start_populate(rows)
+        self._view.set_id_col_label(self._key_label() or "없음")
+        self._view.start_populate(rows, key_cols=self._key_cols)
         self._update_page_status(len(rows))
-        self._view.set_next_enabled(bool(rows) and bool(self._id_col))
+        self._view.set_next_enabled(bool(rows) and bool(self._key_cols))
+        self._view.set_delete_all_enabled(bool(self._key_cols))
+        self._schedule_prefetch(len(rows))
+
+        if first_page:
+            self._paged_rows = len(rows)
+            self._start_count()
+        else:
+            self._paged_rows += len(rows)
+        self._refresh_total()
+
+    # ------------------------------------------------------------------
+    # Matching-row total (estimate → exact COUNT in key chunks)
+    # ------------------------------------------------------------------
+    def _start_count(self):
+        last_query = self._last_query
+        conditions, params = self._build_conditions(
+            last_query["where"], self._key_cols, last_query["start_id"], last_query["end_id"]
+        )
+        self._cancel_count()
+        gen = self._count_gen
+        stop = self._count_stop
+        self._match_total = None
+        self._match_source = ""
+        self._count_status = "추정 중..."
+        self._count_running = True
+        self._view.set_count_running(True)
+        threading.Thread(
+            target=self._do_count,
+            args=(gen, stop, last_query["table"], list(self._key_cols), " AND ".join(conditions), params),
+            daemon=True,
+        ).start()
+
+    def _do_count(self, gen, stop, table, key_cols, condition, params):
+        schedule = self._view.schedule
+        engine = self._conn_mgr.get_engine()
+        try:
+            try:
+                with engine.connect() as conn:
+                    estimate, source = estimate_matching_rows(conn, table, condition, params)
+                schedule(lambda: self._set_match_total(gen, estimate, f"{source} 추정", "정확한 건수 계산 중..."))
+            except Exception as e:
+                schedule(lambda m=f"  ⚠️ 건수 추정 실패: {e}": self._view.log(m))
+
+            def _progress(matched, scanned):
+                status = f"정확한 건수 계산 중... {matched:,}건"
+                if scanned:
+                    status += f" (키 {scanned:,}행 검사)"
+                schedule(lambda: self._set_count_status(gen, status))
+
+            matched, completed = count_in_key_chunks(
+                engine, table, key_cols, condition, params,
+                should_stop=stop.is_set,
+                on_progress=_progress,
+            )
+            if completed:
+                schedule(lambda: self._set_match_total(gen, matched, "COUNT", ""))
+            else:
+                schedule(lambda: self._set_count_status(gen, f"카운트 중지됨 ({matched:,}건까지 확인)"))
+
+        except Exception as e:
+            schedule(lambda m=f"[오류] 건수 계산 실패: {e}": self._view.log(m))
+            schedule(lambda: self._set_count_status(gen, "건수 계산 실패"))
+        finally:
+            schedule(lambda: self._count_finished(gen))
+
+    def _set_match_total(self, gen, total, source, status):
+        if gen != self._count_gen:
+            return  # result of a superseded query
+        self._match_total = total
+        self._match_source = source
+        self._count_status = status
+        self._refresh_total()
+
+    def _set_count_status(self, gen, status):
+        if gen != self._count_gen:
+            return
+        self._count_status = status
+        self._refresh_total()
+
+    def _count_finished(self, gen):
+        if gen == self._count_gen:
+            self._count_running = False
+            self._view.set_count_running(False)
+
+    def _cancel_count(self):
+        """Stop the running count (if any) and ignore anything it still reports."""
+        self._count_stop.set()
+        self._count_stop = threading.Event()
+        self._count_gen += 1
+        self._count_running = False
+        self._view.set_count_running(False)
+
+    def _on_stop_count(self):
+        self._count_stop.set()
+        self._view.log("[카운트 중지 요청] 현재 구간 계산 후 중단합니다.")
+
+    def _refresh_total(self):
+        total = self._match_total
+        if total is None:
+            text = "전체 건수: -"
+        elif self._match_source == "COUNT":
+            text = f"전체 {total:,}건 (COUNT)"
+        else:
+            text = f"전체 약 {total:,}건 ({self._match_source})"
+        text += f" | 조회 {self._paged_rows:,}건"
+        if total:
+            text += f" ({min(100.0, self._paged_rows * 100.0 / total):.1f}%)"
+        if self._count_status:
+            text += f"\n{self._count_status}"
+        self._view.set_total_label(text)
+        self._view.set_page_progress(self._paged_rows, total)
+
+    # ------------------------------------------------------------------
+    # Next-page prefetch
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _prefetch_key(table, where, limit, start_id, end_id, after_id):
+        return (table, where, start_id, end_id, after_id, limit)
+
+    def _schedule_prefetch(self, page_rows: int):
+        """Fetch page N+1 in the background once page N is on screen."""
+        last_query = self._last_query
+        if (
+            not last_query
+            or not self._key_cols
+            or self._last_page_max_id is None
+            or page_rows < last_query["limit"]  # short page → nothing after it
+        ):
+            return
+
+        args = (
+            last_query["table"],
+            last_query["where"],
+            last_query["limit"],
+            last_query["start_id"],
+            last_query["end_id"],
+            self._last_page_max_id,
+        )
+        key = self._prefetch_key(*args)
+        if key not in self._prefetch_cache:
+            self._prefetch_cache = {key: self._run_in_background(self._fetch_page, *args)}
+
+    @staticmethod
+    def _run_in_background(fn, *args) -> Future:
+        future = Future()
+
+        def _run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+
+        threading.Thread(target=_run, daemon=True).start()
+        return future
+
+    def _invalidate_prefetch(self):
+        # In-flight fetches finish but their results are never used
+        self._prefetch_cache.clear()
+
+    @staticmethod
+    def _build_query(table, where, limit, key_cols, start_id="", end_id="", after_id=None):
+        conditions, params = CleanerController._build_conditions(where, key_cols, start_id, end_id, after_id)
+        params["limit"] = limit
+
+        sql = f"SELECT * FROM `{table}`"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        if key_cols:
+            sql += f" ORDER BY {key_order_sql(key_cols)}"
+        sql += " LIMIT :limit"
+        return sql, params
 
     @staticmethod
-    def _build_query(table, where, limit, id_col, start_id="", end_id="", after_id=None):
+    def _build_conditions(where, key_cols, start_id="", end_id="", after_id=None):
+        """
+        WHERE parts for a page. Start/End ID apply to the first key column;
+        `after_id` is the full (possibly composite) key of the previous page's
+        last row, compared as `(a, b) > (:after_0, :after_1)`.
+        """
         conditions = []
-        params = {"limit": limit}
+        params = {}
 
         if where:
             conditions.append(f"({where})")
         if start_id:
-            conditions.append(f"`{id_col}` >= :start_id")
+            conditions.append(f"`{key_cols[0]}` >= :start_id")
             params["start_id"] = start_id
         if end_id:
-            conditions.append(f"`{id_col}` <= :end_id")
+            conditions.append(f"`{key_cols[0]}` <= :end_id")
             params["end_id"] = end_id
         if after_id is not None:
-            conditions.append(f"`{id_col}` > :after_id")
-            params["after_id"] = after_id
-
-        sql = f"SELECT * FROM `{table}`"
-        if conditions:
-            sql += " WHERE " + " AND ".join(conditions)
-        if id_col:
-            sql += f" ORDER BY `{id_col}` ASC"
-        sql += " LIMIT :limit"
-        return sql, params
+            condition, after_params = key_compare_sql(key_cols, ">", after_id, "after")
+            conditions.append(condition)
+            params.update(after_params)
+        return conditions, params
 
     @staticmethod
-    def _get_page_id_bounds(rows, cols, id_col):
-        if not rows or not id_col or id_col not in cols:
+    def _get_page_id_bounds(rows, cols, key_cols):
+        if not rows or not key_cols or any(c not in cols for c in key_cols):
             return None, None
-        id_idx = cols.index(id_col)
-        return rows[0][id_idx], rows[-1][id_idx]
+        idx = [cols.index(c) for c in key_cols]
+        if len(idx) == 1:
+            return rows[0][idx[0]], rows[-1][idx[0]]
+        return tuple(rows[0][i] for i in idx), tuple(rows[-1][i] for i in idx)
+
+    def _key_label(self):
+        return ", ".join(self._key_cols)
 
     def _update_page_status(self, count=None):
-        rows = self._view.get_all_row_values()
         if count is None:
-            count = len(rows)
+            count = self._view.get_row_count()
 
-        if self._id_col and self._columns and rows:
-            first_id, last_id = self._get_page_id_bounds(rows, self._columns, self._id_col)
+        if self._key_cols:
+            first_id, last_id = self._view.get_key_bounds()
         else:
             first_id, last_id = None, None
 
@@ -224,36 +480,27 @@ class CleanerController:
         self._current_page_last_id = last_id
         self._view.set_count_label(
             count,
-            id_col=self._id_col,
+            id_col=self._key_label(),
             first_id=first_id,
             last_id=last_id,
         )
 
-    @staticmethod
-    def _detect_id_col(cols: list):
-        lower = [c.lower() for c in cols]
-        if "id" in lower:
-            return cols[lower.index("id")]
-        return cols[0] if cols else None
-
     # ------------------------------------------------------------------
     # Delete
     # ------------------------------------------------------------------
     def _on_delete_key(self, event=None):
-        selected = self._view.get_selected_iids()
-        if not selected:
+        ids = self._view.get_selected_keys()
+        if not ids:
             return
 
         if not self._conn_mgr.is_connected():
             messagebox.showwarning("연결 없음", "'DB 연결' 탭에서 먼저 DB에 연결하세요.")
             return
 
-        if not self._id_col:
+        if not self._key_cols:
             messagebox.showwarning("오류", "키 컬럼이 감지되지 않아 삭제할 수 없습니다.")
             return
 
-        id_idx = self._columns.index(self._id_col)
-        ids = [self._view.get_row_values(iid)[id_idx] for iid in selected]
         table = self._view.get_table_name()
         db_name = self._conn_mgr.db_name
 
@@ -261,7 +508,7 @@ class CleanerController:
         confirmed = messagebox.askyesno(
             "삭제 확인",
             f"[{db_name}.{table}] 에서 {len(ids)}건을 삭제합니다.\n\n"
-            f"키 컬럼 : {self._id_col}\n"
+            f"키 컬럼 : {self._key_label()}\n"
             f"대상 ID : {preview}\n\n"
             f"계속하시겠습니까?"
         )
@@ -269,32 +516,265 @@ class CleanerController:
             self._view.log("[삭제 취소]")
             return
 
+        archive_path = self._ask_archive_path(table)
+        if archive_path is False:
+            return
+
+        batch_size = self._view.get_delete_batch_size()
+        sleep_s = self._view.get_delete_sleep()
+        self._stop_delete.clear()
+        self._invalidate_prefetch()
+        self._stop_count_for_delete()
+        self._view.set_delete_running(True)
         threading.Thread(
-            target=self._do_delete, args=(table, ids, selected), daemon=True
+            target=self._do_delete, args=(table, ids, batch_size, sleep_s, archive_path), daemon=True
         ).start()
 
-    def _do_delete(self, table: str, ids: list, iids: tuple):
+    def _do_delete(self, table: str, ids: list, batch_size: int, sleep_s: float, archive_path=None):
         schedule = self._view.schedule
-        schedule(lambda m=f"\n[삭제 요청] {table}.{self._id_col} IN {ids}": self._view.log(m))
+        log = lambda m: schedule(lambda m=m: self._view.log(m))
+        preview = str(ids[:10]) + ("..." if len(ids) > 10 else "")
+        log(f"\n[삭제 요청] {table}.({self._key_label()}) IN {preview} ({len(ids):,}건, 배치 {batch_size:,})")
 
+        throttle, replica_engine = self._make_throttle(sleep_s, log)
+        archive = None
         try:
-            placeholders = ", ".join(f":id_{i}" for i in range(len(ids)))
-            sql = f"DELETE FROM `{table}` WHERE `{self._id_col}` IN ({placeholders})"
-            params = {f"id_{i}": v for i, v in enumerate(ids)}
+            archive = self._open_archive(archive_path, table, log)
+            affected = delete_ids_in_batches(
+                self._conn_mgr.get_engine(), table, self._key_cols, ids,
+                batch_size=batch_size,
+                throttle=throttle,
+                log=log,
+                should_stop=self._stop_delete.is_set,
+                on_batch=lambda batch: schedule(lambda b=tuple(batch): self._remove_and_update(b)),
+                archive=archive,
+            )
+            log(f"  → 삭제 완료: {affected:,}건")
+
+        except Exception as e:
+            log(f"[오류] 삭제 실패: {e}")
+        finally:
+            self._close_archive(archive, log)
+            dispose_mysql_engine(replica_engine)
+            schedule(lambda: self._view.set_delete_running(False))
+            schedule(lambda: self._view.set_delete_all_enabled(bool(self._key_cols)))
+
+    def _on_delete_all(self):
+        if not self._conn_mgr.is_connected():
+            messagebox.showwarning("연결 없음", "'DB 연결' 탭에서 먼저 DB에 연결하세요.")
+            return
+
+        if not self._last_query or not self._key_cols:
+            messagebox.showwarning("조회 필요", "키 컬럼이 감지된 조회 결과가 있어야 전체 삭제를 할 수 있습니다.")
+            return
+
+        # Delete what the grid was queried with, not what is typed now
+        last_query = self._last_query
+        table = last_query["table"]
+        conditions, params = self._build_conditions(
+            last_query["where"], self._key_cols, last_query["start_id"], last_query["end_id"]
+        )
+        condition = " AND ".join(conditions)
+        db_name = self._conn_mgr.db_name
+
+        confirmed = messagebox.askyesno(
+            "전체 삭제 확인",
+            f"[{db_name}.{table}] 에서 아래 조건에 맞는 모든 행을 삭제합니다.\n"
+            f"(현재 화면에 보이는 행만이 아닙니다)\n\n"
+            f"조건 : {condition or '(조건 없음 — 테이블 전체)'}\n"
+            f"파라미터 : {params or '-'}\n\n"
+            f"계속하시겠습니까?"
+        )
+        if not confirmed:
+            self._view.log("[삭제 취소]")
+            return
+
+        if self._conn_mgr.is_prod and not messagebox.askyesno(
+            "운영환경 삭제 확인", "운영환경 DB입니다. 정말 조건 전체 삭제를 진행하시겠습니까?"
+        ):
+            self._view.log("[삭제 취소]")
+            return
 
-            schedule(lambda m=f"  SQL → {sql}": self._view.log(m))
+        archive_path = self._ask_archive_path(table)
+        if archive_path is False:
+            return
 
-            engine = self._conn_mgr.get_engine()
-            with engine.begin() as conn:
-                result = conn.execute(sqlalchemy.text(sql), params)
-                affected = result.rowcount
+        batch_size = self._view.get_delete_batch_size()
+        sleep_s = self._view.get_delete_sleep()
+        self._stop_delete.clear()
+        self._invalidate_prefetch()
+        self._stop_count_for_delete()
+        self._view.set_delete_running(True)
+        threading.Thread(
+            target=self._do_delete_all,
+            args=(table, condition, params, batch_size, sleep_s, archive_path),
+            daemon=True,
+        ).start()
 
-            schedule(lambda m=f"  → 삭제 완료: {affected}건": self._view.log(m))
-            schedule(lambda: self._remove_and_update(iids))
+    def _do_delete_all(
+        self, table: str, condition: str, params: dict, batch_size: int, sleep_s: float, archive_path=None
+    ):
+        schedule = self._view.schedule
+        log = lambda m: schedule(lambda m=m: self._view.log(m))
+        log(
+            f"\n[조건 전체 삭제] {table} WHERE {condition or '(전체)'} "
+            f"| ({self._key_label()}) 기준 {batch_size:,}건씩"
+        )
+
+        throttle, replica_engine = self._make_throttle(sleep_s, log)
+        archive = None
+        try:
+            archive = self._open_archive(archive_path, table, log)
+            affected = delete_matching_in_chunks(
+                self._conn_mgr.get_engine(), table, self._key_cols,
+                condition=condition,
+                params=params,
+                batch_size=batch_size,
+                throttle=throttle,
+                log=log,
+                should_stop=self._stop_delete.is_set,
+                archive=archive,
+            )
+            log(f"  → 삭제 완료: {affected:,}건")
+            if not self._stop_delete.is_set():
+                schedule(self._clear_and_update)
 
         except Exception as e:
-            schedule(lambda m=f"[오류] 삭제 실패: {e}": self._view.log(m))
+            log(f"[오류] 삭제 실패: {e}")
+        finally:
+            self._close_archive(archive, log)
+            dispose_mysql_engine(replica_engine)
+            schedule(lambda: self._view.set_delete_running(False))
+            schedule(lambda: self._view.set_delete_all_enabled(bool(self._key_cols)))
+
+    def _on_stop_delete(self):
+        self._stop_delete.set()
+        self._view.log("[삭제 중지 요청] 현재 배치 커밋 후 중단합니다.")
+
+    # ------------------------------------------------------------------
+    # Archive before delete / restore
+    # ------------------------------------------------------------------
+    def _ask_archive_path(self, table: str):
+        """
+        Ask where to archive the rows about to be deleted (main thread).
+
+        Returns:
+            str | None | bool: Path, None when archiving is off, False when cancelled.
+        """
+        if not self._view.get_archive_enabled():
+            return None
+        stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = filedialog.asksaveasfilename(
+            title="삭제 아카이브 저장 위치",
+            initialfile=f"{self._conn_mgr.db_name}.{table}.{stamp}{ARCHIVE_EXTENSION}",
+            defaultextension=ARCHIVE_EXTENSION,
+            filetypes=[("삭제 아카이브", f"*{ARCHIVE_EXTENSION}"), ("모든 파일", "*.*")],
+        )
+        if not path:
+            self._view.log("[삭제 취소] 아카이브 파일을 선택하지 않았습니다.")
+            return False
+        return path
+
+    def _open_archive(self, path, table: str, log):
+        if not path:
+            return None
+        archive = DeleteArchive(path, table, self._key_cols, db_name=self._conn_mgr.db_name)
+        log(f"  🗄️ 삭제 전 아카이브: {path} ({archive.codec})")
+        return archive
 
-    def _remove_and_update(self, iids: tuple):
-        self._view.remove_rows(iids)
+    @staticmethod
+    def _close_archive(archive, log):
+        if archive is None:
+            return
+        archive.close()
+        log(f"  🗄️ 아카이브 저장: {archive.summary()}")
+        log(f"     복원: '복원' 버튼 또는 python -m cleaner.archive restore \"{archive.path}\"")
+
+    def _on_restore_archive(self):
+        if not self._conn_mgr.is_connected():
+            messagebox.showwarning("연결 없음", "'DB 연결' 탭에서 먼저 DB에 연결하세요.")
+            return
+
+        path = filedialog.askopenfilename(
+            title="복원할 삭제 아카이브 선택",
+            filetypes=[("삭제 아카이브", f"*{ARCHIVE_EXTENSION}"), ("모든 파일", "*.*")],
+        )
+        if not path:
+            return
+
+        db_name = self._conn_mgr.db_name
+        if not messagebox.askyesno(
+            "복원 확인",
+            f"아카이브의 행을 [{db_name}] 의 원래 테이블에 다시 넣습니다.\n"
+            f"이미 같은 키가 있는 행은 건너뜁니다.\n\n{path}\n\n계속하시겠습니까?"
+        ):
+            return
+        if self._conn_mgr.is_prod and not messagebox.askyesno(
+            "운영환경 복원 확인", "운영환경 DB입니다. 정말 아카이브 복원을 진행하시겠습니까?"
+        ):
+            self._view.log("[복원 취소]")
+            return
+
+        self._view.set_delete_running(True)
+        threading.Thread(target=self._do_restore, args=(path,), daemon=True).start()
+
+    def _do_restore(self, path: str):
+        schedule = self._view.schedule
+        log = lambda m: schedule(lambda m=m: self._view.log(m))
+        log("")
+        try:
+            restore_archive(path, self._conn_mgr.get_engine(), log=log)
+        except Exception as e:
+            log(f"[오류] 복원 실패: {e}")
+        finally:
+            schedule(lambda: self._view.set_delete_running(False))
+            schedule(lambda: self._view.set_delete_all_enabled(bool(self._key_cols)))
+
+    @staticmethod
+    def _make_throttle(sleep_s: float, log):
+        """
+        Build the between-batch throttle. When REPLICA_DB_URL is set, batches
+        also wait while that replica lags more than CLEANER_MAX_REPLICA_LAG
+        seconds (default 5). Returns (throttle, replica_engine_or_None).
+        """
+        replica_engine = None
+        lag_probe = None
+        replica_url = os.getenv("REPLICA_DB_URL")
+        if replica_url:
+            replica_engine = create_mysql_engine(replica_url)
+            lag_probe = replica_lag_probe(replica_engine)
+
+        if not sleep_s and not lag_probe:
+            return None, None
+        throttle = DeleteThrottle(
+            sleep_s=sleep_s,
+            lag_probe=lag_probe,
+            max_lag_s=float(os.getenv("CLEANER_MAX_REPLICA_LAG", 5)),
+            log=log,
+        )
+        return throttle, replica_engine
+
+    def _stop_count_for_delete(self):
+        # A count racing the delete would be neither before nor after; keep the total as-is
+        if self._count_running:
+            self._cancel_count()
+            self._count_status = "삭제로 인해 카운트 중단"
+            self._refresh_total()
+
+    def _remove_and_update(self, keys: tuple):
+        self._invalidate_prefetch()
+        self._view.remove_keys(keys)
+        self._update_page_status()
+        # Grid rows all match the query, so each deleted key leaves the total too
+        if self._match_total is not None:
+            self._match_total = max(0, self._match_total - len(keys))
+        self._paged_rows = max(0, self._paged_rows - len(keys))
+        self._refresh_total()
+
+    def _clear_and_update(self):
+        self._invalidate_prefetch()
+        self._view.clear_rows()
         self._update_page_status()
+        self._match_total, self._match_source, self._count_status = 0, "COUNT", ""
+        self._paged_rows = 0
+        self._refresh_total()
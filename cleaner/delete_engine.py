@@ -0,0 +1,241 @@
+import time
+
+import sqlalchemy
+
+from .schema_keys import key_compare_sql, key_order_sql
+
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class DeleteThrottle:
+    """
+    Pause between delete batches.
+
+    Sleeps `sleep_s` after every batch. With a `lag_probe` (e.g.
+    replica_lag_probe(replica_engine)), it also waits while the replica is
+    more than `max_lag_s` seconds behind, polling every `poll_s`.
+    """
+
+    def __init__(self, sleep_s=0.0, lag_probe=None, max_lag_s=5.0, poll_s=1.0, log=print):
+        self.sleep_s = max(0.0, float(sleep_s or 0))
+        self.lag_probe = lag_probe
+        self.max_lag_s = max_lag_s
+        self.poll_s = poll_s
+        self.log = log
+
+    def wait(self, should_stop=None):
+        if self.sleep_s:
+            time.sleep(self.sleep_s)
+        if not self.lag_probe:
+            return
+
+        warned = False
+        while not (should_stop and should_stop()):
+            lag = self.lag_probe()
+            if lag is None or lag <= self.max_lag_s:
+                return
+            if not warned:
+                self.log(f"  ⏸ 복제 지연 {lag:.0f}초 (> {self.max_lag_s:.0f}초) — 지연이 줄어들 때까지 대기")
+                warned = True
+            time.sleep(self.poll_s)
+
+
+def replica_lag_probe(replica_engine):
+    """Return a callable reading Seconds_Behind_Source from the replica (None if unknown)."""
+
+    def _probe():
+        with replica_engine.connect() as conn:
+            try:
+                row = conn.execute(sqlalchemy.text("SHOW REPLICA STATUS")).mappings().fetchone()
+            except Exception:
+                row = conn.execute(sqlalchemy.text("SHOW SLAVE STATUS")).mappings().fetchone()
+        if not row:
+            return None
+        lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+        return None if lag is None else float(lag)
+
+    return _probe
+
+
+def delete_ids_in_batches(
+    engine,
+    table,
+    key_cols,
+    ids,
+    batch_size=DEFAULT_BATCH_SIZE,
+    throttle=None,
+    log=print,
+    should_stop=None,
+    on_batch=None,
+    archive=None,
+):
+    """
+    DELETE the given key values in batches of `batch_size`, one transaction each.
+
+    Locks are held only for one batch, and a failure leaves earlier batches
+    committed. `on_batch(deleted_ids)` runs after every commit so the caller
+    can drop those rows from the grid. With a composite key, `ids` are tuples
+    and each batch is one `(a, b) IN ((..), ..)` statement. With a
+    DeleteArchive, each batch's rows are read FOR UPDATE and archived inside
+    the same transaction before they are deleted.
+
+    Returns:
+        int: Total rows deleted.
+    """
+    batch_size = max(1, int(batch_size or DEFAULT_BATCH_SIZE))
+    key_cols = _as_list(key_cols)
+    total = 0
+    for start in range(0, len(ids), batch_size):
+        if should_stop and should_stop():
+            log(f"  ⏹ 중지됨: {total:,}건 삭제 후 중단")
+            break
+
+        batch = ids[start:start + batch_size]
+        condition, params = _key_in_condition(key_cols, batch)
+        total += _delete_batch(engine, table, condition, params, archive)
+
+        if on_batch:
+            on_batch(batch)
+        log(f"  · 배치 {start // batch_size + 1}: {min(start + batch_size, len(ids)):,}/{len(ids):,} 처리, 누적 {total:,}건 삭제")
+
+        if throttle and start + batch_size < len(ids):
+            throttle.wait(should_stop)
+    return total
+
+
+def delete_matching_in_chunks(
+    engine,
+    table,
+    key_cols,
+    condition="",
+    params=None,
+    batch_size=DEFAULT_BATCH_SIZE,
+    throttle=None,
+    log=print,
+    should_stop=None,
+    archive=None,
+):
+    """
+    DELETE every row matching `condition` server-side, walking the key in chunks.
+
+    Each round asks the server only for the upper key of the next
+    `batch_size` matching rows, then deletes `condition AND key in (last, upper]`
+    in its own transaction. No row data or key list is sent to the client
+    unless a DeleteArchive is given; then just the rows of each chunk are
+    read FOR UPDATE and archived before that chunk's DELETE.
+    Composite keys are compared as row constructors.
+
+    Args:
+        condition (str): SQL condition without 'WHERE' (may be empty).
+        params (dict): Bind parameters used by `condition`.
+
+    Returns:
+        int: Total rows deleted.
+    """
+    batch_size = max(1, int(batch_size or DEFAULT_BATCH_SIZE))
+    params = dict(params or {})
+    key_cols = _as_list(key_cols)
+    safe_table = _quote(table)
+    key_list = ", ".join(f"`{_quote(c)}`" for c in key_cols)
+    not_null = " AND ".join(f"`{_quote(c)}` IS NOT NULL" for c in key_cols)
+    base = f"({condition}) AND " if condition else ""
+
+    label = ", ".join(key_cols)
+    after = None
+    total = 0
+    rounds = 0
+    while True:
+        if should_stop and should_stop():
+            log(f"  ⏹ 중지됨: {total:,}건 삭제 후 중단 (마지막 키: {after})")
+            break
+
+        lower, lower_params = ("", {}) if after is None else key_compare_sql(key_cols, ">", after, "_after")
+        lower = f"{lower} AND " if lower else ""
+        # Last key of the next chunk, computed on the server
+        upper_sql = sqlalchemy.text(
+            f"SELECT {key_list} FROM (SELECT {key_list} FROM `{safe_table}` "
+            f"WHERE {base}{lower}{not_null} ORDER BY {key_order_sql(key_cols)} LIMIT :_batch) AS chunk "
+            f"ORDER BY {key_order_sql(key_cols, descending=True)} LIMIT 1"
+        )
+        with engine.connect() as conn:
+            row = conn.execute(upper_sql, {**params, **lower_params, "_batch": batch_size}).fetchone()
+        if row is None:
+            break
+        upper = tuple(row) if len(key_cols) > 1 else row[0]
+        upper_cond, upper_params = key_compare_sql(key_cols, "<=", upper, "_upper")
+        deleted = _delete_batch(
+            engine, table, f"{base}{lower}{upper_cond}", {**params, **lower_params, **upper_params}, archive
+        )
+
+        total += deleted
+        rounds += 1
+        after = upper
+        log(f"  · 청크 {rounds}: {label} ≤ {upper} 까지 {deleted:,}건 삭제, 누적 {total:,}건")
+
+        if throttle:
+            throttle.wait(should_stop)
+    return total
+
+
+def _delete_batch(engine, table, condition, params, archive=None):
+    """
+    DELETE `condition` in one transaction; returns the affected row count.
+
+    With an archive, the rows are first locked and read (FOR UPDATE) and
+    written to it in the same transaction. If anything fails before COMMIT
+    is sent, the archive is cut back so it never holds rows that are still
+    in the table. A failure at or after COMMIT (e.g. a dropped tunnel losing
+    the ack) keeps the frame: the rows may already be gone, and restore
+    skips rows that still exist (INSERT IGNORE).
+    """
+    safe_table = _quote(table)
+    delete_sql = _bind_expanding(sqlalchemy.text(f"DELETE FROM `{safe_table}` WHERE {condition}"), params)
+    if archive is None:
+        with engine.begin() as conn:
+            return conn.execute(delete_sql, params).rowcount
+
+    mark = archive.tell()
+    committing = False
+    try:
+        with engine.begin() as conn:
+            select_sql = _bind_expanding(
+                sqlalchemy.text(f"SELECT * FROM `{safe_table}` WHERE {condition} FOR UPDATE"), params
+            )
+            result = conn.execute(select_sql, params)
+            archive.append(list(result.keys()), result.fetchall())
+            deleted = conn.execute(delete_sql, params).rowcount
+            committing = True  # leaving the block sends COMMIT; its outcome is unknown if it raises
+        return deleted
+    except BaseException:
+        if not committing:
+            archive.truncate(mark)
+        raise
+
+
+def _key_in_condition(key_cols, keys):
+    if len(key_cols) == 1:
+        return f"`{_quote(key_cols[0])}` IN :ids", {"ids": list(keys)}
+
+    params = {}
+    tuples = []
+    for i, key in enumerate(keys):
+        names = [f"k{i}_{j}" for j in range(len(key_cols))]
+        params.update(zip(names, key))
+        tuples.append("(" + ", ".join(f":{n}" for n in names) + ")")
+    lhs = ", ".join(f"`{_quote(c)}`" for c in key_cols)
+    return f"({lhs}) IN ({', '.join(tuples)})", params
+
+
+def _bind_expanding(sql, params):
+    if "ids" in params:
+        return sql.bindparams(sqlalchemy.bindparam("ids", expanding=True))
+    return sql
+
+
+def _as_list(key_cols):
+    return [key_cols] if isinstance(key_cols, str) else list(key_cols)
+
+
+def _quote(name):
+    return str(name).replace("`", "``")
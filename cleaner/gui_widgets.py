@@ -1,6 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 
+from ui.log_sink import create_log_sink
+from .virtual_grid import VirtualTreeview
+
 
 class CleanerView:
     _PREVIEW_CHAR_LIMIT = 160
@@ -8,7 +11,7 @@ class CleanerView:
     def __init__(self, notebook, app):
         self._frame = tk.Frame(notebook)
         self._app = app
-        self._full_row_values = {}
+        self._columns = []
         self._build_ui()
 
     def get_tab_frame(self):
@@ -62,7 +65,7 @@ class CleanerView:
         ).grid(row=4, column=0, columnspan=2, sticky="w")
 
         tk.Label(
-            settings, text="ID 범위는 감지된 키 컬럼 기준으로 적용",
+            settings, text="ID 범위는 감지된 키의 첫 컬럼 기준으로 적용",
             fg="gray", font=("Arial", 7)
         ).grid(row=5, column=0, columnspan=2, sticky="w")
 
@@ -73,6 +76,21 @@ class CleanerView:
         self.entry_limit.insert(0, "500")
         self.entry_limit.grid(row=6, column=1, sticky="w", padx=(6, 0), pady=(6, 2))
 
+        tk.Label(settings, text="삭제 배치:").grid(row=7, column=0, sticky="w", pady=2)
+        self.entry_batch_size = tk.Entry(settings, width=8)
+        self.entry_batch_size.insert(0, "1000")
+        self.entry_batch_size.grid(row=7, column=1, sticky="w", padx=(6, 0), pady=2)
+
+        tk.Label(settings, text="배치 간 대기(초):").grid(row=8, column=0, sticky="w", pady=2)
+        self.entry_batch_sleep = tk.Entry(settings, width=8)
+        self.entry_batch_sleep.insert(0, "0")
+        self.entry_batch_sleep.grid(row=8, column=1, sticky="w", padx=(6, 0), pady=2)
+
+        self.var_archive = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            settings, text="삭제 전 아카이브 (복원 가능)", variable=self.var_archive
+        ).grid(row=9, column=0, columnspan=2, sticky="w", pady=(4, 0))
+
         settings.columnconfigure(1, weight=1)
 
         self.lbl_id_col = tk.Label(
@@ -96,9 +114,48 @@ class CleanerView:
         )
         self.btn_next.pack(side="left", padx=(6, 0))
 
+        delete_frame = tk.Frame(parent, bg="#f5f5f5")
+        delete_frame.pack(fill="x", padx=8, pady=(0, 6))
+
+        self.btn_delete_all = tk.Button(
+            delete_frame, text="조건 전체 삭제", width=12,
+            bg="#d9534f", fg="white", relief="flat", cursor="hand2", state="disabled"
+        )
+        self.btn_delete_all.pack(side="left")
+
+        self.btn_stop_delete = tk.Button(
+            delete_frame, text="삭제 중지", width=8,
+            relief="flat", cursor="hand2", state="disabled"
+        )
+        self.btn_stop_delete.pack(side="left", padx=(6, 0))
+
+        self.btn_restore = tk.Button(
+            delete_frame, text="복원", width=5,
+            relief="flat", cursor="hand2"
+        )
+        self.btn_restore.pack(side="left", padx=(6, 0))
+
         self.lbl_count = tk.Label(parent, text="", fg="#555", bg="#f5f5f5")
         self.lbl_count.pack(anchor="w", padx=10)
 
+        self.lbl_total = tk.Label(
+            parent, text="", fg="#555", bg="#f5f5f5",
+            font=("Arial", 8), justify="left", wraplength=240
+        )
+        self.lbl_total.pack(anchor="w", padx=10)
+
+        progress_frame = tk.Frame(parent, bg="#f5f5f5")
+        progress_frame.pack(fill="x", padx=8, pady=(2, 0))
+
+        self.page_progress = ttk.Progressbar(progress_frame, mode="determinate", maximum=100)
+        self.page_progress.pack(side="left", fill="x", expand=True)
+
+        self.btn_stop_count = tk.Button(
+            progress_frame, text="카운트 중지", width=8,
+            relief="flat", cursor="hand2", state="disabled"
+        )
+        self.btn_stop_count.pack(side="left", padx=(6, 0))
+
         log_frame = tk.LabelFrame(parent, text="로그", padx=4, pady=4)
         log_frame.pack(fill="both", expand=True, padx=8, pady=(4, 8))
 
@@ -108,6 +165,7 @@ class CleanerView:
             bg="#1e1e1e", fg="#d4d4d4"
         )
         self.log_text.pack(fill="both", expand=True)
+        self._log_sink = create_log_sink(self.log_text, "cleaner")
 
     # ------------------------------------------------------------------
     # Right panel: Treeview grid
@@ -121,34 +179,22 @@ class CleanerView:
         ).pack(side="left")
         tk.Label(
             header,
-            text="  Del: 선택 삭제 | Ctrl+Click: 다중 선택 | Shift+Click: 범위 선택",
+            text="  Del: 선택 삭제 | Ctrl+Click: 다중 선택 | Shift+Click: 범위 선택 | Ctrl+A: 전체 선택",
             fg="gray", font=("Arial", 8)
         ).pack(side="left")
 
         tree_frame = tk.Frame(parent)
         tree_frame.pack(fill="both", expand=True, padx=6, pady=(0, 8))
 
-        self.tree = ttk.Treeview(tree_frame, selectmode="extended", show="headings")
-
-        self._v_scroll = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
-        self._h_scroll = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(
-            yscrollcommand=self._v_scroll.set,
-            xscrollcommand=self._h_scroll.set,
-        )
-
-        self._v_scroll.pack(side="right", fill="y")
-        self._h_scroll.pack(side="bottom", fill="x")
-        self.tree.pack(fill="both", expand=True)
+        # Only the visible rows (+ margin) live in Tk; the result is kept column-wise
+        self.grid = VirtualTreeview(tree_frame, format_row=self._build_preview_row)
+        self.tree = self.grid.tree
 
     # ------------------------------------------------------------------
     # Public interface (used by controller)
     # ------------------------------------------------------------------
     def log(self, msg: str):
-        self.log_text.configure(state="normal")
-        self.log_text.insert("end", msg + "\n")
-        self.log_text.configure(state="disabled")
-        self.log_text.see("end")
+        self._log_sink.log(msg)
 
     def schedule(self, callback):
         """Run callback safely on the main thread."""
@@ -158,25 +204,12 @@ class CleanerView:
         self.lbl_conn.config(text=text, fg=color)
 
     def set_columns(self, columns: list):
-        self.tree["columns"] = columns
-        for col in columns:
-            self.tree.heading(col, text=col, anchor="w")
-            self.tree.column(col, width=120, minwidth=60, anchor="w")
-
-    def start_populate(self, rows: list, chunk_size: int = 200):
-        """Insert rows in chunks so the event loop stays responsive."""
-        tree = self.tree
-        tree.configure(yscrollcommand="", xscrollcommand="")
-        children = tree.get_children()
-        if children:
-            tree.delete(*children)
-
-        self._pending = rows
-        self._full_row_values = {}
-        self._tk_call = tree.tk.call  # cache to avoid per-row attribute lookup
-        self._w = tree._w
-        self._chunk_size = chunk_size
-        self._insert_chunk(0)
+        self._columns = list(columns)
+        self.grid.set_columns(columns)
+
+    def start_populate(self, rows: list, key_cols: list = None):
+        """Load rows into the virtual grid; selection is tracked by `key_cols` values."""
+        self.grid.load(self._columns, rows, key_cols)
 
     def _format_preview_value(self, value):
         text = "" if value is None else str(value)
@@ -188,53 +221,24 @@ class CleanerView:
     def _build_preview_row(self, row):
         return tuple(self._format_preview_value(value) for value in row)
 
-    def _insert_chunk(self, start: int):
-        rows = self._pending
-        end = min(start + self._chunk_size, len(rows))
-        tk_call, w = self._tk_call, self._w
-
-        for i in range(start, end):
-            iid = f"row_{i}"
-            self._full_row_values[iid] = rows[i]
-            tk_call(
-                w,
-                "insert",
-                "",
-                "end",
-                "-id",
-                iid,
-                "-values",
-                self._build_preview_row(rows[i]),
-            )
-
-        if end < len(rows):
-            # Yield to event loop, then continue
-            self.tree.after(0, lambda: self._insert_chunk(end))
-        else:
-            # All done — reattach scrollbars
-            self.tree.configure(
-                yscrollcommand=self._v_scroll.set,
-                xscrollcommand=self._h_scroll.set,
-            )
-            self._pending = None
+    def remove_keys(self, keys):
+        self.grid.remove_keys(keys)
 
-    def remove_rows(self, iids: tuple):
-        for iid in iids:
-            self._full_row_values.pop(iid, None)
-            if self.tree.exists(iid):
-                self.tree.delete(iid)
+    def clear_rows(self):
+        self.grid.clear()
 
-    def get_selected_iids(self) -> tuple:
-        return self.tree.selection()
+    def get_selected_keys(self) -> list:
+        return self.grid.selected_keys()
 
-    def get_row_values(self, iid) -> tuple:
-        return self._full_row_values.get(iid, self.tree.item(iid, "values"))
+    def get_row_count(self) -> int:
+        return len(self.grid.store)
 
-    def get_all_row_values(self) -> list:
-        return [
-            self._full_row_values.get(iid, self.tree.item(iid, "values"))
-            for iid in self.tree.get_children()
-        ]
+    def get_key_bounds(self):
+        """(first, last) key of the loaded rows, or (None, None) without rows/key column."""
+        store = self.grid.store
+        if not len(store) or not store.has_key:
+            return None, None
+        return store.key(0), store.key(len(store) - 1)
 
     def set_count_label(self, count: int, id_col: str = None, first_id=None, last_id=None):
         text = f"현재 화면 {count:,}건"
@@ -242,12 +246,32 @@ class CleanerView:
             text += f"  |  {id_col}: {first_id} ~ {last_id}"
         self.lbl_count.config(text=text)
 
+    def set_total_label(self, text: str):
+        self.lbl_total.config(text=text)
+
+    def set_page_progress(self, done: int, total):
+        """Share of the matching rows paged through so far (0 when the total is unknown)."""
+        percent = min(100.0, done * 100.0 / total) if total else 0.0
+        self.page_progress.config(value=percent)
+
+    def set_count_running(self, running: bool):
+        self.btn_stop_count.config(state="normal" if running else "disabled")
+
     def set_id_col_label(self, col_name: str):
         self.lbl_id_col.config(text=f"키 컬럼: {col_name}", fg="#2a6496")
 
     def set_next_enabled(self, enabled: bool):
         self.btn_next.config(state="normal" if enabled else "disabled")
 
+    def set_delete_all_enabled(self, enabled: bool):
+        self.btn_delete_all.config(state="normal" if enabled else "disabled")
+
+    def set_delete_running(self, running: bool):
+        self.btn_stop_delete.config(state="normal" if running else "disabled")
+        self.btn_restore.config(state="disabled" if running else "normal")
+        if running:
+            self.btn_delete_all.config(state="disabled")
+
     def bind_event(self, event_name: str, callback):
         if event_name == "query":
             self.btn_query.config(command=callback)
@@ -255,6 +279,14 @@ class CleanerView:
             self.btn_next.config(command=callback)
         elif event_name == "delete_key":
             self.tree.bind("<Delete>", callback)
+        elif event_name == "delete_all":
+            self.btn_delete_all.config(command=callback)
+        elif event_name == "stop_delete":
+            self.btn_stop_delete.config(command=callback)
+        elif event_name == "stop_count":
+            self.btn_stop_count.config(command=callback)
+        elif event_name == "restore_archive":
+            self.btn_restore.config(command=callback)
 
     def get_table_name(self) -> str:
         return self.entry_table.get().strip()
@@ -273,3 +305,18 @@ class CleanerView:
             return int(self.entry_limit.get().strip())
         except ValueError:
             return 500
+
+    def get_delete_batch_size(self) -> int:
+        try:
+            return max(1, int(self.entry_batch_size.get().strip()))
+        except ValueError:
+            return 1000
+
+    def get_delete_sleep(self) -> float:
+        try:
+            return max(0.0, float(self.entry_batch_sleep.get().strip()))
+        except ValueError:
+            return 0.0
+
+    def get_archive_enabled(self) -> bool:
+        return bool(self.var_archive.get())
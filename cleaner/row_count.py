@@ -0,0 +1,127 @@
+import sqlalchemy
+
+from .schema_keys import key_compare_sql, key_order_sql
+
+
+DEFAULT_COUNT_CHUNK = 100000
+
+
+def table_rows_estimate(conn, table: str):
+    """InnoDB's TABLE_ROWS statistic (instant, typically within ±50%)."""
+    value = conn.execute(
+        sqlalchemy.text(
+            "SELECT TABLE_ROWS FROM information_schema.tables "
+            "WHERE table_schema = DATABASE() AND table_name = :tbl"
+        ),
+        {"tbl": table},
+    ).scalar()
+    return None if value is None else int(value)
+
+
+def estimate_matching_rows(conn, table: str, condition: str = "", params=None):
+    """
+    Instant row estimate for `condition`.
+
+    Uses the optimizer's EXPLAIN estimate (rows × filtered) when there is a
+    condition, otherwise information_schema.tables.TABLE_ROWS.
+
+    Returns:
+        tuple: (estimate or None, source) — source is 'EXPLAIN' or 'TABLE_ROWS'.
+    """
+    if not condition:
+        return table_rows_estimate(conn, table), "TABLE_ROWS"
+
+    plan = conn.execute(
+        sqlalchemy.text(f"EXPLAIN SELECT 1 FROM `{_quote(table)}` WHERE {condition}"),
+        params or {},
+    ).mappings().fetchall()
+    if not plan:
+        return None, "EXPLAIN"
+    step = {k.lower(): v for k, v in plan[0].items()}
+    if step.get("rows") is None:
+        return None, "EXPLAIN"
+    filtered = float(step.get("filtered") or 100.0)
+    return int(float(step["rows"]) * filtered / 100.0), "EXPLAIN"
+
+
+def count_in_key_chunks(
+    engine,
+    table: str,
+    key_cols: list,
+    condition: str = "",
+    params=None,
+    chunk_size: int = DEFAULT_COUNT_CHUNK,
+    should_stop=None,
+    on_progress=None,
+):
+    """
+    Exact COUNT(*) of rows matching `condition`, walking the key in ranges.
+
+    Each round finds the key `chunk_size` rows further on (over all rows, so
+    progress tracks the table) and counts the matches in that range, so no
+    single statement runs long and the count can stop between rounds.
+    `on_progress(matched, scanned)` runs after every round, with `scanned`
+    the keys actually walked so far (never past the table). Rows whose key is
+    NULL (only possible with the heuristic key) are not counted. Without a
+    key a single COUNT(*) is issued.
+
+    Returns:
+        tuple: (matched, completed) — completed is False when stopped early.
+    """
+    params = dict(params or {})
+    match = f"({condition})" if condition else "1 = 1"
+    safe_table = _quote(table)
+
+    if not key_cols:
+        with engine.connect() as conn:
+            matched = conn.execute(
+                sqlalchemy.text(f"SELECT COUNT(*) FROM `{safe_table}`" + (f" WHERE {condition}" if condition else "")),
+                params,
+            ).scalar()
+        if on_progress:
+            on_progress(int(matched), None)
+        return int(matched), True
+
+    key_list = ", ".join(f"`{_quote(c)}`" for c in key_cols)
+    not_null = " AND ".join(f"`{_quote(c)}` IS NOT NULL" for c in key_cols)
+
+    matched = 0
+    scanned = 0
+    after = None
+    while True:
+        if should_stop and should_stop():
+            return matched, False
+
+        lower, lower_params = ("", {}) if after is None else key_compare_sql(key_cols, ">", after, "_after")
+        lower = f"{lower} AND " if lower else ""
+        upper_sql = sqlalchemy.text(
+            f"SELECT {key_list} FROM (SELECT {key_list} FROM `{safe_table}` "
+            f"WHERE {lower}{not_null} ORDER BY {key_order_sql(key_cols)} LIMIT :_chunk) AS chunk "
+            f"ORDER BY {key_order_sql(key_cols, descending=True)} LIMIT 1"
+        )
+        with engine.connect() as conn:
+            row = conn.execute(upper_sql, {**lower_params, "_chunk": chunk_size}).fetchone()
+            if row is None:
+                break
+            upper = tuple(row) if len(key_cols) > 1 else row[0]
+            upper_cond, upper_params = key_compare_sql(key_cols, "<=", upper, "_upper")
+            # Keys actually in the range (the last round is usually short) and the matches among them
+            in_range, in_match = conn.execute(
+                sqlalchemy.text(
+                    f"SELECT COUNT(*), SUM(CASE WHEN {match} THEN 1 ELSE 0 END) "
+                    f"FROM `{safe_table}` WHERE {lower}{upper_cond}"
+                ),
+                {**params, **lower_params, **upper_params},
+            ).fetchone()
+            matched += int(in_match or 0)
+
+        scanned += int(in_range)
+        after = upper
+        if on_progress:
+            on_progress(matched, scanned)
+
+    return matched, True
+
+
+def _quote(name):
+    return str(name).replace("`", "``")
@@ -0,0 +1,104 @@
+import sqlalchemy
+
+
+def detect_key_columns(conn, table: str, cols: list):
+    """
+    Pick the paging/delete key of a table from information_schema.STATISTICS.
+
+    Order of preference: PRIMARY KEY, then the unique index with only
+    NOT NULL columns and the fewest columns. Without either, falls back to
+    the old heuristic (a column named 'id', else the first column).
+
+    Returns:
+        tuple: (key_columns, source) — source is 'PRIMARY', 'UNIQUE <name>',
+        'heuristic (indexed)' or 'heuristic (no index)'.
+    """
+    rows = conn.execute(
+        sqlalchemy.text(
+            """
+            SELECT INDEX_NAME, NON_UNIQUE, SEQ_IN_INDEX, COLUMN_NAME, NULLABLE
+            FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :tbl
+            ORDER BY INDEX_NAME, SEQ_IN_INDEX
+            """
+        ),
+        {"tbl": table},
+    ).fetchall()
+
+    indexes = {}
+    for index_name, non_unique, _, column_name, nullable in rows:
+        entry = indexes.setdefault(index_name, {"unique": int(non_unique) == 0, "cols": [], "nullable": False})
+        entry["cols"].append(column_name)
+        entry["nullable"] = entry["nullable"] or nullable == "YES"
+
+    if "PRIMARY" in indexes:
+        return indexes["PRIMARY"]["cols"], "PRIMARY"
+
+    unique = [
+        (len(idx["cols"]), name, idx["cols"])
+        for name, idx in indexes.items()
+        if idx["unique"] and not idx["nullable"]
+    ]
+    if unique:
+        _, name, key_cols = min(unique)
+        return key_cols, f"UNIQUE {name}"
+
+    if not cols:
+        return [], "heuristic (no index)"
+    lower = [c.lower() for c in cols]
+    col = cols[lower.index("id")] if "id" in lower else cols[0]
+    indexed = any(idx["cols"][0] == col for idx in indexes.values())
+    return [col], "heuristic (indexed)" if indexed else "heuristic (no index)"
+
+
+def explain_warnings(conn, sql: str, params: dict) -> list:
+    """Run EXPLAIN on a page query and describe full scans / filesorts it would do."""
+    plan = conn.execute(sqlalchemy.text("EXPLAIN " + sql), params).mappings().fetchall()
+    warnings = []
+    for step in plan:
+        step = {k.lower(): v for k, v in step.items()}
+        table = step.get("table")
+        extra = step.get("extra") or ""
+        if step.get("type") == "ALL":
+            estimate = step.get("rows")
+            estimate = f"{int(estimate):,}" if estimate is not None else "?"
+            warnings.append(
+                f"⚠️ '{table}': 인덱스를 사용하지 않는 전체 스캔입니다 (예상 검사 {estimate}행). "
+                f"WHERE 조건 컬럼에 인덱스가 있는지 확인하세요."
+            )
+        elif step.get("type") == "index" and "Using where" in extra and not step.get("possible_keys"):
+            warnings.append(
+                f"⚠️ '{table}': WHERE 조건에 쓸 수 있는 인덱스가 없어 키 순서대로 행을 읽으며 걸러냅니다. "
+                f"일치하는 행이 드물면 페이지마다 많은 행을 검사합니다."
+            )
+        if "Using filesort" in extra:
+            warnings.append(f"⚠️ '{table}': 키 정렬에 filesort가 필요합니다. 페이지마다 정렬 비용이 발생합니다.")
+    return warnings
+
+
+def key_order_sql(key_cols: list, descending: bool = False) -> str:
+    direction = "DESC" if descending else "ASC"
+    return ", ".join(f"`{_quote(c)}` {direction}" for c in key_cols)
+
+
+def key_compare_sql(key_cols: list, op: str, value, prefix: str):
+    """
+    Build `key op value` for a single or composite key.
+
+    Composite keys use a row constructor, e.g. (`a`, `b`) > (:after_0, :after_1).
+
+    Returns:
+        tuple: (sql, params)
+    """
+    values = value if len(key_cols) > 1 else (value,)
+    names = [f"{prefix}_{i}" for i in range(len(key_cols))]
+    params = dict(zip(names, values))
+    if len(key_cols) == 1:
+        return f"`{_quote(key_cols[0])}` {op} :{names[0]}", params
+    lhs = ", ".join(f"`{_quote(c)}`" for c in key_cols)
+    rhs = ", ".join(f":{n}" for n in names)
+    return f"({lhs}) {op} ({rhs})", params
+
+
+def _quote(name):
+    return str(name).replace("`", "``")
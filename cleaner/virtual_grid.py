@@ -0,0 +1,273 @@
+from tkinter import ttk
+
+import numpy as np
+
+
+class ColumnStore:
+    """
+    Query result held column-wise.
+
+    Integer/float columns become native NumPy arrays; everything else is an
+    object array that references the fetched values without copying them.
+    Rows are only assembled as tuples when asked for (viewport, delete).
+    """
+
+    def __init__(self, columns, rows, key_cols=None):
+        self.columns = list(columns)
+        self._data = [_compact_column([r[i] for r in rows]) for i in range(len(self.columns))]
+        self._length = len(rows)
+        key_cols = [key_cols] if isinstance(key_cols, str) else list(key_cols or [])
+        if key_cols and all(c in self.columns for c in key_cols):
+            self._key_idx = [self.columns.index(c) for c in key_cols]
+        else:
+            self._key_idx = None
+        self._key_pos = None
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def has_key(self) -> bool:
+        return self._key_idx is not None
+
+    def row(self, i: int) -> tuple:
+        return tuple(_scalar(col[i]) for col in self._data)
+
+    def key(self, i: int):
+        """Row key: the key value (a tuple for composite keys), or the row position without a key."""
+        if self._key_idx is None:
+            return i
+        if len(self._key_idx) == 1:
+            return _scalar(self._data[self._key_idx[0]][i])
+        return tuple(_scalar(self._data[k][i]) for k in self._key_idx)
+
+    def position(self, key):
+        if self._key_pos is None:
+            self._key_pos = {self.key(i): i for i in range(self._length)}
+        return self._key_pos.get(key)
+
+    def remove_keys(self, keys) -> int:
+        """Drop rows whose key is in `keys`; returns how many were removed."""
+        keys = set(keys)
+        keep = np.fromiter((self.key(i) not in keys for i in range(self._length)), dtype=bool, count=self._length)
+        removed = self._length - int(keep.sum())
+        if removed:
+            self._data = [col[keep] for col in self._data]
+            self._length -= removed
+            self._key_pos = None
+        return removed
+
+
+class VirtualTreeview:
+    """
+    ttk.Treeview that shows a ColumnStore of any size with a small Tk footprint.
+
+    Only the viewport plus `margin` rows above and below exist as Tk items.
+    Scrolling within that window just moves the Treeview view; leaving it
+    re-fills the window from the store. Selection is kept as a set of row
+    keys, so it survives scrolling and deletions of other rows.
+    """
+
+    def __init__(self, parent, margin=50, format_row=None):
+        self.margin = margin
+        self._format_row = format_row or (lambda row: tuple("" if v is None else str(v) for v in row))
+        self.store = ColumnStore([], [])
+        self._selected = set()
+        self._anchor = None
+        self._top = 0
+        self._window_start = 0
+        self._window_len = 0
+        self._visible = 20
+
+        self.tree = ttk.Treeview(parent, selectmode="extended", show="headings")
+        self._v_scroll = ttk.Scrollbar(parent, orient="vertical", command=self._on_scrollbar)
+        self._h_scroll = ttk.Scrollbar(parent, orient="horizontal", command=self.tree.xview)
+        self.tree.configure(xscrollcommand=self._h_scroll.set)
+
+        self._v_scroll.pack(side="right", fill="y")
+        self._h_scroll.pack(side="bottom", fill="x")
+        self.tree.pack(fill="both", expand=True)
+
+        tree = self.tree
+        tree.bind("<Configure>", self._on_configure)
+        tree.bind("<Button-1>", self._on_click)
+        tree.bind("<Control-Button-1>", lambda e: self._on_click(e, toggle=True))
+        tree.bind("<Shift-Button-1>", lambda e: self._on_click(e, extend=True))
+        tree.bind("<MouseWheel>", lambda e: self.scroll_by(-3 if e.delta > 0 else 3))
+        tree.bind("<Button-4>", lambda e: self.scroll_by(-3))
+        tree.bind("<Button-5>", lambda e: self.scroll_by(3))
+        tree.bind("<Up>", lambda e: self._move_cursor(-1, e))
+        tree.bind("<Down>", lambda e: self._move_cursor(1, e))
+        tree.bind("<Prior>", lambda e: self.scroll_by(-self._visible))
+        tree.bind("<Next>", lambda e: self.scroll_by(self._visible))
+        tree.bind("<Home>", lambda e: self.scroll_to(0))
+        tree.bind("<End>", lambda e: self.scroll_to(len(self.store)))
+        tree.bind("<Control-a>", self._select_all)
+
+    # ------------------------------------------------------------------
+    # Data
+    # ------------------------------------------------------------------
+    def set_columns(self, columns):
+        self.tree["columns"] = columns
+        for col in columns:
+            self.tree.heading(col, text=col, anchor="w")
+            self.tree.column(col, width=120, minwidth=60, anchor="w")
+
+    def load(self, columns, rows, key_cols=None):
+        self.store = ColumnStore(columns, rows, key_cols)
+        self._selected.clear()
+        self._anchor = None
+        self._top = 0
+        self._fill_window(0)
+
+    def remove_keys(self, keys):
+        removed = self.store.remove_keys(keys)
+        self._selected.difference_update(keys)
+        if removed:
+            self._anchor = None
+            self._window_len = 0  # force a refill from the compacted store
+            self.scroll_to(self._top)
+        return removed
+
+    def clear(self):
+        self.load(self.store.columns, [])
+
+    def selected_keys(self) -> list:
+        """Selected keys in grid order."""
+        positions = sorted(p for p in (self.store.position(k) for k in self._selected) if p is not None)
+        return [self.store.key(p) for p in positions]
+
+    # ------------------------------------------------------------------
+    # Scrolling
+    # ------------------------------------------------------------------
+    def scroll_by(self, rows):
+        self.scroll_to(self._top + rows)
+        return "break"
+
+    def scroll_to(self, top):
+        total = len(self.store)
+        top = max(0, min(int(top), max(0, total - self._visible)))
+        self._top = top
+        if top < self._window_start or top + self._visible > self._window_start + self._window_len:
+            self._fill_window(max(0, top - self.margin))
+        else:
+            self._show_top()
+        return "break"
+
+    def _on_scrollbar(self, *args):
+        total = len(self.store)
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = self._visible if args[2] == "pages" else 1
+            self.scroll_by(int(args[1]) * step)
+
+    def _on_configure(self, event):
+        style = ttk.Style()
+        row_height = int(style.lookup("Treeview", "rowheight") or 20)
+        visible = max(1, (event.height - 24) // row_height)
+        if visible != self._visible:
+            self._visible = visible
+            self.scroll_to(self._top)
+
+    def _fill_window(self, start):
+        """Re-create the Tk items for store rows [start, start + viewport + 2 * margin)."""
+        tree = self.tree
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+
+        total = len(self.store)
+        start = max(0, min(start, total))
+        end = min(total, start + self._visible + 2 * self.margin)
+        tk_call, w = tree.tk.call, tree._w
+        for i in range(start, end):
+            tk_call(w, "insert", "", "end", "-id", f"v{i - start}", "-values", self._format_row(self.store.row(i)))
+
+        self._window_start = start
+        self._window_len = end - start
+        self._show_top()
+
+    def _show_top(self):
+        total = len(self.store)
+        if self._window_len:
+            # +0.25 row so Tk's fraction→item rounding lands on the intended row
+            self.tree.yview_moveto((self._top - self._window_start + 0.25) / self._window_len)
+        if total:
+            self._v_scroll.set(self._top / total, min(1.0, (self._top + self._visible) / total))
+        else:
+            self._v_scroll.set(0.0, 1.0)
+        self._sync_selection()
+
+    # ------------------------------------------------------------------
+    # Selection (by key)
+    # ------------------------------------------------------------------
+    def _position_at(self, y):
+        iid = self.tree.identify_row(y)
+        if not iid:
+            return None
+        return self._window_start + int(iid[1:])
+
+    def _on_click(self, event, toggle=False, extend=False):
+        if self.tree.identify_region(event.x, event.y) not in ("cell", "tree"):
+            return None  # headings/separators keep their default behaviour
+        pos = self._position_at(event.y)
+        self.tree.focus_set()
+        if pos is None:
+            return "break"
+
+        key = self.store.key(pos)
+        if extend and self._anchor is not None:
+            lo, hi = sorted((self._anchor, pos))
+            self._selected = {self.store.key(i) for i in range(lo, hi + 1)}
+        elif toggle:
+            self._selected.symmetric_difference_update({key})
+            self._anchor = pos
+        else:
+            self._selected = {key}
+            self._anchor = pos
+        self._sync_selection()
+        return "break"
+
+    def _move_cursor(self, step, event):
+        if self._anchor is None:
+            return "break"
+        pos = max(0, min(self._anchor + step, len(self.store) - 1))
+        self._anchor = pos
+        self._selected = {self.store.key(pos)}
+        if pos < self._top:
+            self.scroll_to(pos)
+        elif pos >= self._top + self._visible:
+            self.scroll_to(pos - self._visible + 1)
+        else:
+            self._sync_selection()
+        return "break"
+
+    def _select_all(self, event=None):
+        self._selected = {self.store.key(i) for i in range(len(self.store))}
+        self._sync_selection()
+        return "break"
+
+    def _sync_selection(self):
+        slots = [
+            f"v{i - self._window_start}"
+            for i in range(self._window_start, self._window_start + self._window_len)
+            if self.store.key(i) in self._selected
+        ]
+        self.tree.selection_set(slots)
+
+
+def _compact_column(values):
+    kinds = {type(v) for v in values}
+    try:
+        if kinds == {int}:
+            return np.array(values, dtype=np.int64)
+        if kinds == {float}:
+            return np.array(values, dtype=np.float64)
+    except OverflowError:
+        pass
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _scalar(value):
+    return value.item() if isinstance(value, np.generic) else value
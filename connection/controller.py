@@ -74,12 +74,30 @@ class ConnectionController:
                     "#2d8a2d",
                 )
                 self._view.log("[연결 성공]")
+                self._log_connect_timing(m.last_connect_timing)
             else:
                 self._view.set_status("✕ 연결 실패", "red")
                 self._view.log("[연결 실패]")
 
         self._view.schedule(_update)
 
+    def _log_connect_timing(self, timing: dict):
+        if not timing:
+            return
+        parts = []
+        if 'tunnel_s' in timing:
+            parts.append(
+                f"SSH 터널 {self._conn_mgr.tunnel_count()}개 {timing['tunnel_s'] * 1000:.0f} ms "
+                f"(준비 확인 {timing['probe_s'] * 1000:.0f} ms, {timing['probe_attempts']}회)"
+            )
+        parts.append(f"DB 연결 {timing['db_s'] * 1000:.0f} ms")
+        self._view.log(f"[연결 시간] 총 {timing['total_s'] * 1000:.0f} ms — " + ", ".join(parts))
+        if not timing.get('byte_stats', True):
+            self._view.log(
+                "[경고] 설치된 pymysql에 _read_bytes/_write_bytes가 없어 "
+                "SSH 터널별 전송량을 집계할 수 없습니다."
+            )
+
     # ------------------------------------------------------------------
     # Release
     # ------------------------------------------------------------------
@@ -2,6 +2,8 @@ import tkinter as tk
 from tkinter import scrolledtext
 import os
 
+from ui.log_sink import create_log_sink
+
 
 class ConnectionView:
     def __init__(self, notebook, app):
@@ -138,6 +140,7 @@ class ConnectionView:
             wrap="word", bg="#1e1e1e", fg="#d4d4d4"
         )
         self.log_text.pack(fill="both", expand=True, padx=8, pady=(0, 8))
+        self._log_sink = create_log_sink(self.log_text, "connection")
 
     # ------------------------------------------------------------------
     # Helpers
@@ -149,10 +152,7 @@ class ConnectionView:
     # Public interface (used by controller)
     # ------------------------------------------------------------------
     def log(self, msg: str):
-        self.log_text.configure(state="normal")
-        self.log_text.insert("end", msg + "\n")
-        self.log_text.configure(state="disabled")
-        self.log_text.see("end")
+        self._log_sink.log(msg)
 
     def schedule(self, callback):
         """Run callback on the main thread."""
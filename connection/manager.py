@@ -1,9 +1,13 @@
 import os
+import threading
 import time
 
 import sqlalchemy
 
 from mysql.services.engine_factory import create_mysql_engine, dispose_mysql_engine
+from mysql.services.tunnel_probe import DEFAULT_READY_TIMEOUT
+
+from .tunnel_pool import TunnelPool
 
 
 class ConnectionManager:
@@ -23,6 +27,9 @@ class ConnectionManager:
         self._tunnel = None
         self._eff_host = ""
         self._eff_port = 3306
+        self._tunnel_required = False
+        self._recover_lock = threading.Lock()
+        self.last_connect_timing = {}
 
     # ------------------------------------------------------------------
     # Configuration
@@ -73,6 +80,8 @@ class ConnectionManager:
     def connect(self, on_error=None) -> bool:
         """Create engine (+ SSH tunnel if prod+SSH configured). Returns True on success."""
         self.release()
+        started = time.perf_counter()
+        timing = {}
 
         if not self.is_configured():
             if on_error:
@@ -82,28 +91,14 @@ class ConnectionManager:
         eff_host, eff_port = self.host, self.port
 
         # SSH tunnel (prod only)
-        if self.is_prod and os.getenv("SSH_HOST"):
+        if self._uses_ssh():
             try:
-                import paramiko
-                if not hasattr(paramiko, "DSSKey"):
-                    class DSSKey:
-                        pass
-                    paramiko.DSSKey = DSSKey
-
-                from sshtunnel import SSHTunnelForwarder
-
-                ssh_bind_port = int(os.getenv("SSH_BIND_PORT", 13306))
-                tunnel = SSHTunnelForwarder(
-                    (os.getenv("SSH_HOST"), 22),
-                    ssh_username=os.getenv("SSH_USER"),
-                    ssh_password=os.getenv("SSH_PASSWORD"),
-                    remote_bind_address=("127.0.0.1", self.port),
-                    local_bind_address=("127.0.0.1", ssh_bind_port),
-                    set_keepalive=10.0,
-                )
-                tunnel.start()
-                time.sleep(1.0)
-                self._tunnel = tunnel
+                self._tunnel, ssh_bind_port, probe = self._start_tunnel()
+                self._tunnel_required = True
+                timing['tunnel_s'] = time.perf_counter() - started
+                timing['probe_s'] = probe['elapsed_s']
+                timing['probe_attempts'] = probe['attempts']
+                timing['byte_stats'] = probe['byte_stats']
                 eff_host, eff_port = "127.0.0.1", ssh_bind_port
 
             except ImportError:
@@ -117,12 +112,16 @@ class ConnectionManager:
         try:
             url = self._build_url(eff_host, eff_port)
             engine = create_mysql_engine(url)
+            db_started = time.perf_counter()
             with engine.connect() as conn:
                 conn.execute(sqlalchemy.text("SELECT 1"))
+            timing['db_s'] = time.perf_counter() - db_started
+            timing['total_s'] = time.perf_counter() - started
 
             self._engine = engine
             self._eff_host = eff_host
             self._eff_port = eff_port
+            self.last_connect_timing = timing
             return True
 
         except Exception as e:
@@ -134,13 +133,80 @@ class ConnectionManager:
                 except Exception:
                     pass
                 self._tunnel = None
+            self._tunnel_required = False
+            return False
+
+    def _uses_ssh(self) -> bool:
+        return bool(self.is_prod and os.getenv("SSH_HOST"))
+
+    def _start_tunnel(self):
+        """
+        Start SSH_TUNNEL_COUNT forwarders (default 1) from SSH_BIND_PORT upward
+        and wait until MySQL answers through each (SSH_READY_TIMEOUT seconds).
+        Returns (tunnel_pool, local_bind_port, probe).
+        """
+        tunnel = TunnelPool(
+            os.getenv("SSH_HOST"),
+            os.getenv("SSH_USER"),
+            os.getenv("SSH_PASSWORD"),
+            remote_port=self.port,
+            base_local_port=int(os.getenv("SSH_BIND_PORT", 13306)),
+            count=int(os.getenv("SSH_TUNNEL_COUNT", 1)),
+            ready_timeout=float(os.getenv("SSH_READY_TIMEOUT", DEFAULT_READY_TIMEOUT)),
+        )
+        probe = tunnel.start()
+        return tunnel, tunnel.local_port, probe
+
+    def tunnel_count(self) -> int:
+        return len(self._tunnel.ports) if self._tunnel else 0
+
+    def tunnel_stats_lines(self, reset=True):
+        """Per-tunnel throughput log lines since the last call (empty without SSH)."""
+        if not self._tunnel:
+            return []
+        lines = self._tunnel.format_stats()
+        if reset:
+            self._tunnel.reset_stats()
+        return lines
+
+    def is_tunnel_alive(self) -> bool:
+        if not self._tunnel:
+            return not self._tunnel_required
+        try:
+            return bool(self._tunnel.is_active)
+        except Exception:
             return False
 
+    def recover(self, on_error=None) -> bool:
+        """
+        Restore connectivity after a transient drop during a transfer.
+
+        Restarts dead SSH forwarders on their local ports and drops pooled
+        connections of the shared engine. Thread-safe: concurrent workers
+        that fail together trigger a single restart.
+        """
+        with self._recover_lock:
+            if self._tunnel_required and not self.is_tunnel_alive():
+                try:
+                    if self._tunnel:
+                        self._tunnel.restart_dead()
+                    else:
+                        self._tunnel, _, _ = self._start_tunnel()
+                except Exception as e:
+                    if on_error:
+                        on_error(f"SSH 터널 재시작 실패: {e}")
+                    return False
+
+            if self._engine is not None:
+                self._engine.dispose()
+            return True
+
     def release(self):
         dispose_mysql_engine(self._engine)
         self._engine = None
         self._eff_host = ""
         self._eff_port = 3306
+        self._tunnel_required = False
         if self._tunnel:
             try:
                 self._tunnel.stop()
@@ -0,0 +1,299 @@
+import itertools
+import threading
+import time
+import weakref
+
+import pymysql
+from pymysql.constants import CLIENT
+
+from mysql.services.engine_factory import register_endpoint_connector, unregister_endpoint_connector
+from mysql.services.tunnel_probe import DEFAULT_READY_TIMEOUT, wait_until_ready
+
+
+# pymysql private hooks _CountingConnection wraps; checked once so a renamed API is reported, not counted as 0
+_BYTE_HOOKS = ("_read_bytes", "_write_bytes")
+BYTE_STATS_AVAILABLE = all(callable(getattr(pymysql.connections.Connection, name, None)) for name in _BYTE_HOOKS)
+
+
+class _TunnelStats:
+    """
+    Byte counters of one tunnel: totals of released connections plus the live ones.
+
+    Connections count their own bytes without locking; the lock is only
+    taken per connection (open / release) and when stats are read.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._live = weakref.WeakSet()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.connections = 0
+            self.bytes_in = 0
+            self.bytes_out = 0
+            self.first_io = None
+            for conn in self._live:
+                conn.reset_counters()
+
+    def opened(self, conn):
+        with self._lock:
+            self.connections += 1
+            self._live.add(conn)
+
+    def release(self, conn):
+        """Fold a closing connection's counters into the totals (once)."""
+        with self._lock:
+            if conn not in self._live:
+                return
+            self._live.discard(conn)
+            self.bytes_in += conn.bytes_in
+            self.bytes_out += conn.bytes_out
+            self.first_io = _earliest(self.first_io, conn.first_io)
+
+    def snapshot(self):
+        """(bytes_in, bytes_out, first_io) including connections still open."""
+        with self._lock:
+            live = list(self._live)
+            bytes_in, bytes_out, first_io = self.bytes_in, self.bytes_out, self.first_io
+        for conn in live:
+            bytes_in += conn.bytes_in
+            bytes_out += conn.bytes_out
+            first_io = _earliest(first_io, conn.first_io)
+        return bytes_in, bytes_out, first_io
+
+
+def _earliest(a, b):
+    return b if a is None else a if b is None else min(a, b)
+
+
+class _CountingConnection(pymysql.connections.Connection):
+    """
+    pymysql connection that counts its wire bytes and reports them to its tunnel on close.
+
+    Counting relies on pymysql's private _read_bytes/_write_bytes; see
+    BYTE_STATS_AVAILABLE.
+    """
+
+    def __init__(self, *args, tunnel_stats=None, **kwargs):
+        self._tunnel_stats = tunnel_stats
+        self.reset_counters()  # set first: __init__ already reads the handshake
+        super().__init__(*args, **kwargs)
+
+    def reset_counters(self):
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.first_io = None
+
+    def _read_bytes(self, num_bytes):
+        data = super()._read_bytes(num_bytes)
+        self.bytes_in += len(data)
+        if self.first_io is None:
+            self.first_io = time.perf_counter()
+        return data
+
+    def _write_bytes(self, data):
+        super()._write_bytes(data)
+        self.bytes_out += len(data)
+        if self.first_io is None:
+            self.first_io = time.perf_counter()
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            self._tunnel_stats.release(self)
+
+    def _force_close(self):
+        try:
+            super()._force_close()
+        finally:
+            self._tunnel_stats.release(self)
+
+
+class TunnelPool:
+    """
+    Several SSH forwarders to the same MySQL port on consecutive local ports.
+
+    One SSH transport encrypts everything on a single thread, so parallel
+    readers/writers are capped by it. Each forwarder here has its own
+    transport; new pooled DB connections are spread round-robin across them
+    through an engine_factory connector registered for the first local port,
+    so any engine built from get_db_url() is balanced automatically.
+    With a single forwarder no connector is registered: connections go
+    straight to the port and carry no byte counting.
+    """
+
+    def __init__(
+        self,
+        ssh_host,
+        ssh_user,
+        ssh_password,
+        remote_port,
+        base_local_port,
+        count=1,
+        ready_timeout=DEFAULT_READY_TIMEOUT,
+    ):
+        self.ssh_host = ssh_host
+        self.ssh_user = ssh_user
+        self.ssh_password = ssh_password
+        self.remote_port = remote_port
+        self.ports = [base_local_port + i for i in range(max(1, int(count)))]
+        self.ready_timeout = ready_timeout
+        self._forwarders = [None] * len(self.ports)
+        self._stats = [_TunnelStats() for _ in self.ports]
+        self._rr = itertools.cycle(range(len(self.ports)))
+        self._rr_lock = threading.Lock()
+
+    @property
+    def local_port(self) -> int:
+        return self.ports[0]
+
+    @property
+    def is_active(self) -> bool:
+        return all(f is not None and f.is_active for f in self._forwarders)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def start(self) -> dict:
+        """
+        Start every forwarder and wait until MySQL answers through each.
+        Returns {'elapsed_s', 'attempts'} summed over the readiness probes and
+        'byte_stats' (False when several tunnels run but pymysql no longer
+        has the hooks byte counting needs).
+        """
+        elapsed, attempts = 0.0, 0
+        try:
+            for i in range(len(self.ports)):
+                probe = self._start_one(i)
+                elapsed += probe['elapsed_s']
+                attempts += probe['attempts']
+        except Exception:
+            self.stop()
+            raise
+
+        if len(self.ports) > 1:
+            register_endpoint_connector("127.0.0.1", self.local_port, self._connector)
+        byte_stats = len(self.ports) == 1 or BYTE_STATS_AVAILABLE
+        return {'elapsed_s': elapsed, 'attempts': attempts, 'byte_stats': byte_stats}
+
+    def restart_dead(self) -> int:
+        """Restart forwarders whose transport dropped. Returns how many were restarted."""
+        restarted = 0
+        for i, forwarder in enumerate(self._forwarders):
+            if forwarder is not None and forwarder.is_active:
+                continue
+            self._stop_one(i)
+            self._start_one(i)
+            restarted += 1
+        return restarted
+
+    def stop(self):
+        unregister_endpoint_connector("127.0.0.1", self.local_port)
+        for i in range(len(self._forwarders)):
+            self._stop_one(i)
+
+    def _start_one(self, index):
+        import paramiko
+        if not hasattr(paramiko, "DSSKey"):
+            class DSSKey:
+                pass
+            paramiko.DSSKey = DSSKey
+
+        from sshtunnel import SSHTunnelForwarder
+
+        forwarder = SSHTunnelForwarder(
+            (self.ssh_host, 22),
+            ssh_username=self.ssh_user,
+            ssh_password=self.ssh_password,
+            remote_bind_address=("127.0.0.1", self.remote_port),
+            local_bind_address=("127.0.0.1", self.ports[index]),
+            set_keepalive=10.0,
+        )
+        forwarder.start()
+        self._forwarders[index] = forwarder
+        return wait_until_ready("127.0.0.1", self.ports[index], timeout=self.ready_timeout)
+
+    def _stop_one(self, index):
+        forwarder = self._forwarders[index]
+        self._forwarders[index] = None
+        if forwarder is not None:
+            try:
+                forwarder.stop()
+            except Exception:
+                pass
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+    def connect(self, user, password, database, charset="utf8mb4"):
+        """Open a DB connection through the next forwarder (round-robin)."""
+        with self._rr_lock:
+            index = next(self._rr)
+        stats = self._stats[index]
+        conn = _CountingConnection(
+            host="127.0.0.1",
+            port=self.ports[index],
+            user=user,
+            password=password,
+            database=database,
+            charset=charset,
+            client_flag=CLIENT.FOUND_ROWS,  # same rowcount semantics as the pymysql dialect
+            tunnel_stats=stats,
+        )
+        stats.opened(conn)
+        return conn
+
+    def _connector(self, url):
+        return self.connect(
+            user=url.username,
+            password=url.password,
+            database=url.database,
+            charset=url.query.get("charset", "utf8mb4"),
+        )
+
+    # ------------------------------------------------------------------
+    # Throughput
+    # ------------------------------------------------------------------
+    def stats(self):
+        """
+        Per-tunnel counters since the last reset_stats():
+        {'port', 'connections', 'bytes_in', 'bytes_out', 'active_s', 'mb_per_s'}.
+
+        active_s runs from the first byte on any of the pool's tunnels to now,
+        so mb_per_s is the tunnel's average over the transfer window.
+        """
+        snapshots = [s.snapshot() for s in self._stats]
+        first_io = None
+        for _, _, first in snapshots:
+            first_io = _earliest(first_io, first)
+        active_s = time.perf_counter() - first_io if first_io is not None else 0.0
+        rows = []
+        for port, s, (bytes_in, bytes_out, _) in zip(self.ports, self._stats, snapshots):
+            rows.append({
+                'port': port,
+                'connections': s.connections,
+                'bytes_in': bytes_in,
+                'bytes_out': bytes_out,
+                'active_s': active_s,
+                'mb_per_s': (bytes_in + bytes_out) / 1048576 / active_s if active_s else 0.0,
+            })
+        return rows
+
+    def reset_stats(self):
+        for s in self._stats:
+            s.reset()
+
+    def format_stats(self):
+        rows = self.stats()
+        if not any(r['bytes_in'] or r['bytes_out'] for r in rows):
+            return []
+        lines = [f"📶 SSH 터널별 처리량 ({len(rows)}개)"]
+        for r in rows:
+            lines.append(
+                f"   - :{r['port']} | 연결 {r['connections']}개 | 수신 {r['bytes_in'] / 1048576:.1f} MB "
+                f"| 송신 {r['bytes_out'] / 1048576:.1f} MB | {r['mb_per_s']:.1f} MB/s"
+            )
+        return lines
@@ -1,14 +1,19 @@
 import os
-import pickle
 import threading
 import pandas as pd
+from connection.manager import ConnectionManager
 from mysql.frommysql.mysql2xlsx import export_to_xlsx
-from mysql.frommysql.mysql2pkl import export_to_pkl
+from mysql.frommysql.mysql2pkl import export_to_pkl, export_incremental_pkl, compact_incremental_pkl
+from mysql.frommysql.mysql2sqlite import export_to_sqlite
 from mysql.tomysql.xlsx2mysql import import_from_xlsx as mysql_import_xlsx
 from mysql.tomysql.pkl2mysql import import_from_pkl as mysql_import_pkl
+from mysql.tomysql.mysql2mysql import copy_tables
+from mysql.tomysql.sqlite2mysql import import_from_sqlite as mysql_import_sqlite, list_sqlite_tables
 from mysql.services.collation_service import fetch_server_collations, fetch_table_collation_info
 from mysql.services.column_service import fetch_table_columns
 from mysql.services.query_safety import validate_read_only_query
+from mysql.services.import_journal import ImportJournal, make_job_key
+from storage.pickle_codec import read_pickle
 
 
 class MySQLController:
@@ -23,7 +28,9 @@ class MySQLController:
         # Bind Events
         self.view.bind_event('run_button', self.run_process)
         self.view.bind_event('release_button', self.release_all)
+        self.view.bind_event('resume_button', self.resume_import)
         self.view.bind_event('mode_change', self.on_mode_change)
+        self.view.bind_event('compact_deltas', self.compact_deltas)
 
         # Initial Setup
         self.update_db_info()
@@ -53,7 +60,7 @@ class MySQLController:
 
         self.view.update_input_widgets(mode, on_query_mode_change)
         
-        if mode in ["xlsx2mysql", "pkl2mysql"]:
+        if mode in ["xlsx2mysql", "pkl2mysql", "sqlite2mysql"]:
             self.view.set_on_file_selected(self.on_file_selected)
             self.populate_collation_dropdown()
             self.attach_collation_ui_handlers()
@@ -72,6 +79,15 @@ class MySQLController:
     def _close_tunnel(self):
         pass  # Tunnel is managed by ConnectionManager — do not close here
 
+    def _log_tunnel_stats(self):
+        for line in self._conn_mgr.tunnel_stats_lines():
+            self.view.log(line)
+
+    def _recover_connection(self):
+        """Retry hook for long transfers: restart a dropped SSH tunnel via ConnectionManager."""
+        self.view.log("🔄 연결 복구 시도 중...")
+        return self._conn_mgr.recover(on_error=self.view.log)
+
     def release_all(self):
         """파일 핸들·캐시·비교 패널 해제 (DB 연결은 ConnectionManager가 관리)"""
         self._cached_source_columns = {}
@@ -97,8 +113,7 @@ class MySQLController:
 
         try:
             if mode == "pkl2mysql":
-                with open(filepath, 'rb') as f:
-                    data = pickle.load(f)
+                data = read_pickle(filepath)
                 if isinstance(data, dict):
                     keys = list(data.keys())
                     help_text = f"(Dictionary: {len(keys)}개 키)"
@@ -117,6 +132,13 @@ class MySQLController:
                     help_text = f"(타입: {type(data).__name__})"
                     self.view.update_source_dropdown([], help_text)
 
+            elif mode == "sqlite2mysql":
+                # Column names only (PRAGMA table_info); rows are streamed at import time
+                tables = list_sqlite_tables(filepath)
+                help_text = f"(테이블: {len(tables)}개)"
+                self.view.update_source_dropdown(list(tables), help_text)
+                self._cached_source_columns = tables
+
             elif mode == "xlsx2mysql":
                 with pd.ExcelFile(filepath) as xls:
                     sheets = xls.sheet_names
@@ -262,7 +284,7 @@ class MySQLController:
             mode = self.view.get_mode()
             self.view.log(f"--- Starting Process: {mode} ---")
 
-            if mode in ["mysql2xlsx", "mysql2pkl"]:
+            if mode in ["mysql2xlsx", "mysql2pkl", "mysql2sqlite"]:
                 params = self.view.get_export_params()
                 if params is None:
                     self.view.show_warning("Warning", "Check input fields.")
@@ -279,9 +301,32 @@ class MySQLController:
                         return
                     validate_read_only_query(query)
 
+                if export_scope == 'incremental':
+                    from tkinter import filedialog
+                    output_dir = filedialog.askdirectory(title="증분 파일 저장 폴더 선택")
+                    if not output_dir:
+                        return
+
+                    self.view.log(f"Incremental export to: {output_dir}")
+                    written = export_incremental_pkl(
+                        db_url, table_name, params['watermark_column'], output_dir,
+                        compression=params.get('compression', 'none'),
+                        recover=self._recover_connection,
+                    )
+                    if written:
+                        self.view.log(f"Export Successful: {written}")
+                        self.view.show_info("Success", f"Export to {written} successful.")
+                    else:
+                        self.view.log("No new rows since last watermark.")
+                        self.view.show_info("Info", "새로 추출할 데이터가 없습니다.")
+                    return
+
                 if mode == "mysql2xlsx":
                     ext = ".xlsx"
                     filetypes = [("Excel files", "*.xlsx")]
+                elif mode == "mysql2sqlite":
+                    ext = ".db"
+                    filetypes = [("SQLite DB", "*.db *.sqlite *.sqlite3")]
                 else:
                     ext = ".pkl"
                     filetypes = [("Pickle files", "*.pkl")]
@@ -303,15 +348,36 @@ class MySQLController:
 
                 self.view.log(f"Exporting to: {save_path}")
                 
-                if mode == "mysql2xlsx":
-                    export_to_xlsx(db_url, export_scope, table_name, query, save_path)
+                workers = params.get('workers', 1)
+                if workers > 1 and mode != "mysql2sqlite":
+                    self.view.log(f"Parallel connections: {workers}")
+
+                if mode == "mysql2sqlite":
+                    # Streams over the shared engine: no intermediate pickle/xlsx file
+                    export_to_sqlite(
+                        self._conn_mgr.get_engine(), export_scope, table_name, query, save_path,
+                        index_spec=self.view.get_sqlite_index_spec(),
+                    )
+                elif mode == "mysql2xlsx":
+                    export_to_xlsx(
+                        db_url, export_scope, table_name, query, save_path,
+                        parallel_workers=workers, recover=self._recover_connection,
+                    )
                 else:
-                    export_to_pkl(db_url, export_scope, table_name, query, save_path)
+                    export_to_pkl(
+                        db_url, export_scope, table_name, query, save_path,
+                        parallel_workers=workers, compression=params.get('compression', 'none'),
+                        recover=self._recover_connection,
+                    )
 
                 self.view.log("Export Successful.")
+                self._log_tunnel_stats()
                 self.view.show_info("Success", f"Export to {save_path} successful.")
 
-            elif mode in ["xlsx2mysql", "pkl2mysql"]:
+            elif mode == "mysql2mysql":
+                self._run_copy()
+
+            elif mode in ["xlsx2mysql", "pkl2mysql", "sqlite2mysql"]:
                 params = self.view.get_import_params()
                 if params is None:
                     self.view.show_warning("Warning", "Select a file.")
@@ -358,6 +424,140 @@ class MySQLController:
         finally:
             self._close_tunnel()
 
+    def _run_copy(self):
+        """Copy tables between the connected env and the other env from .env (PROD <-> DEV)."""
+        params = self.view.get_copy_params()
+        other = ConnectionManager()
+        other.load_env_defaults(use_prod=not self._conn_mgr.is_prod)
+        if not other.is_configured():
+            env = "PROD_MYSQL_*" if other.is_prod else "MYSQL_*"
+            self.view.show_warning("Warning", f"반대 환경 연결 정보가 .env에 없습니다. ({env})")
+            return
+
+        if params['direction'] == "push":
+            source, target = self._conn_mgr, other
+        else:
+            source, target = other, self._conn_mgr
+
+        def _describe(m):
+            return f"{'PROD' if m.is_prod else 'DEV'} {m.user}@{m.host}:{m.port}/{m.db_name}"
+
+        tables_text = ", ".join(params['tables']) if params['tables'] else "전체 테이블"
+        message = (
+            f"원본: {_describe(source)}\n대상: {_describe(target)}\n"
+            f"테이블: {tables_text}\n모드: {params['if_exists']}\n\n진행하시겠습니까?"
+        )
+        if target.is_prod:
+            message = "⚠️ 운영환경에 쓰기 작업입니다.\n\n" + message
+        if not self.view.show_confirm("MySQL 테이블 복사", message):
+            self.view.log("[Copy] 복사가 취소되었습니다.")
+            return
+
+        self.view.log(f"[Copy] {_describe(source)} → {_describe(target)}")
+        if not other.connect(on_error=self.view.log):
+            self.view.show_error("연결 오류", "반대 환경에 연결하지 못했습니다. 로그를 확인하세요.")
+            return
+        try:
+            copy_tables(
+                source.get_engine(), target.get_engine(), params['tables'], params['if_exists'],
+                logger=self.view.log,
+            )
+            self.view.log("Copy Successful.")
+            self._log_tunnel_stats()
+            self.view.show_info("Success", "Copy successful.")
+        finally:
+            other.release()
+
+    def compact_deltas(self):
+        params = self.view.get_compact_params()
+        if params is None:
+            self.view.show_warning("Warning", "테이블명을 입력하세요.")
+            return
+
+        from tkinter import filedialog
+        output_dir = filedialog.askdirectory(title="증분 파일 폴더 선택")
+        if not output_dir:
+            return
+
+        try:
+            merged = compact_incremental_pkl(
+                output_dir, params['table_name'], params['key_column'], params['compression']
+            )
+            self.view.log(f"[Compact] {params['table_name']}: 델타 {merged}개 병합")
+            if merged:
+                self.view.show_info("Success", f"델타 {merged}개를 Base 파일로 병합했습니다.")
+        except Exception as e:
+            self.view.log(f"Error: {str(e)}")
+            self.view.show_error("Error", f"An error occurred:\n{str(e)}")
+
+    def resume_import(self):
+        """Continue an interrupted Pickle → MySQL import from its checkpoint journal."""
+        db_url, db_config = self._get_db_url_and_config()
+        if not db_url:
+            return
+
+        if self.view.get_mode() != "pkl2mysql":
+            self.view.show_warning("Warning", "Resume은 'Pickle -> MySQL' 모드에서만 지원됩니다.")
+            return
+
+        params = self.view.get_import_params()
+        if params is None:
+            self.view.show_warning("Warning", "Select a file.")
+            return
+
+        file_path = params['file_path']
+        journal = ImportJournal(make_job_key(db_config, file_path))
+        if not journal.exists():
+            self.view.show_info("Resume", "이 파일/DB 조합으로 저장된 체크포인트가 없습니다.")
+            return
+
+        entry = journal.get_entry()
+        options = entry['options']
+        progress = []
+        for tbl, t in entry['tables'].items():
+            state = "완료" if t.get('done') else f"{t.get('offset', 0):,}/{t.get('total', 0):,} rows"
+            progress.append(f"  {tbl}: {state}")
+        message = (
+            f"체크포인트 (시작: {entry['started_at']}, 갱신: {entry['updated_at']})\n"
+            f"모드: {options['if_exists']} / 범위: {options['import_scope']}\n"
+            + ("\n".join(progress) if progress else "  (커밋된 청크 없음)")
+            + "\n\n이어서 진행하시겠습니까?"
+        )
+        if not self.view.show_confirm("Import 이어서 진행", message):
+            return
+
+        if self._conn_mgr.is_prod:
+            if not self.view.show_confirm(
+                "운영환경 Import 확인",
+                "운영환경에 대한 Import입니다. 정말 진행하시겠습니까?"
+            ):
+                self.view.log("[Import] 운영환경 Import가 취소되었습니다.")
+                return
+
+        self.view.log(f"--- Resuming Import: {file_path} ---")
+        try:
+            mysql_import_pkl(
+                db_config,
+                file_path,
+                options['import_scope'],
+                options['source_name'],
+                options['target_table'],
+                options['if_exists'],
+                options.get('collation'),
+                options.get('stop_on_mismatch', True),
+                excluded_columns=options.get('excluded_columns'),
+                logger=self.view.log,
+                chunk_size=options.get('chunk_size'),
+                resume=True,
+                recover=self._recover_connection,
+            )
+            self.view.log("Import Successful.")
+            self._log_tunnel_stats()
+            self.view.show_info("Success", "Import successful.")
+        except Exception as e:
+            self.view.log(f"Error: {str(e)}")
+            self.view.show_error("Error", f"An error occurred:\n{str(e)}")
+
     # --- Import Comparison Flow ---
 
     def _refresh_comparison_preview(self):
@@ -590,6 +790,20 @@ class MySQLController:
                     excluded_columns=excluded,
                     logger=self.view.log
                 )
+            elif mode == "sqlite2mysql":
+                mysql_import_sqlite(
+                    db_config,
+                    params['file_path'],
+                    params['import_scope'],
+                    params['source_name'],
+                    params['target_table'],
+                    params['if_exists'],
+                    params.get('collation'),
+                    params.get('stop_on_mismatch', True),
+                    excluded_columns=excluded,
+                    logger=self.view.log,
+                    recover=self._recover_connection,
+                )
             else:
                 mysql_import_pkl(
                     db_config,
@@ -601,10 +815,12 @@ class MySQLController:
                     params.get('collation'),
                     params.get('stop_on_mismatch', True),
                     excluded_columns=excluded,
-                    logger=self.view.log
+                    logger=self.view.log,
+                    recover=self._recover_connection,
                 )
 
             self.view.log("Import Successful.")
+            self._log_tunnel_stats()
             self.view.show_info("Success", "Import successful.")
 
         except Exception as e:
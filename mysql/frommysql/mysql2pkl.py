@@ -1,9 +1,26 @@
+import glob
+import os
+import re
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 import pandas as pd
 from sqlalchemy import text
+from sqlalchemy.engine.url import make_url
 from mysql.services.engine_factory import create_mysql_engine, dispose_mysql_engine
 from mysql.services.query_safety import validate_read_only_query
+from mysql.services.resilience import TransferRetry
+from mysql.services.parallel_reader import format_timing_summary, iter_table_parts, iter_tables_concurrently
+from storage.frame_concat import concat_by_column
+from storage.pickle_codec import read_pickle, write_pickle
+from mysql.services.watermark_state import default_state_path, load_table_state, save_table_state
 
-def export_to_pkl(db_url, export_scope, table_name=None, query=None, output_path=None):
+# Re-read window below the stored watermark: seconds for date/time columns, units for numeric ones
+DEFAULT_WATERMARK_OVERLAP = 300
+# Row hashes kept in the state file; a busier window is narrowed to its newest rows
+MAX_SEEN_ROWS = 100000
+
+def export_to_pkl(db_url, export_scope, table_name=None, query=None, output_path=None, parallel_workers=1, compression="none", recover=None):
     """
     Exports MySQL table(s) to a Pickle file.
     
@@ -13,10 +30,17 @@ def export_to_pkl(db_url, export_scope, table_name=None, query=None, output_path
         table_name (str or None): Name of the table to export.
         query (str or None): Custom SQL query (for 'query' scope).
         output_path (str): Path to save the Pickle file.
+        parallel_workers (int): Connections used to read a single table by PK range ('table' scope)
+            or several tables at once ('database' scope). Each range is its own SELECT, so rows
+            written during the export may show up in some ranges and not others; use 1 for a
+            single consistent snapshot of a table that is being written to.
+        compression (str): 'none', 'zstd', 'lz4' or 'gzip'.
+        recover (callable, optional): Called before re-reading after a connection drop.
     """
     engine = None
+    retry = TransferRetry(recover=recover)
     try:
-        engine = create_mysql_engine(db_url)
+        engine = create_mysql_engine(db_url, pool_size=parallel_workers if parallel_workers > 1 else None)
         print(f"✅ [mysql2pkl] 데이터베이스 연결 성공!")
         
         if export_scope == "query":
@@ -27,11 +51,11 @@ def export_to_pkl(db_url, export_scope, table_name=None, query=None, output_path
             validate_read_only_query(query)
 
             print(f"▶ [mysql2pkl] 사용자 정의 쿼리 실행 중...")
-            df = pd.read_sql(text(query), con=engine)
+            df = retry.run(lambda: pd.read_sql(text(query), con=engine), engine=engine, label="query")
             print(f"✅ [mysql2pkl] 쿼리 실행 완료: {df.shape[0]} rows, {df.shape[1]} columns")
             
-            df.to_pickle(output_path)
-            print(f"🎉 [mysql2pkl] Pickle 파일 저장 완료: {output_path}")
+            write_pickle(df, output_path, compression)
+            print(f"🎉 [mysql2pkl] Pickle 파일 저장 완료: {output_path}{_codec_suffix(compression)}")
 
         elif export_scope == "table":
             if not table_name:
@@ -39,16 +63,22 @@ def export_to_pkl(db_url, export_scope, table_name=None, query=None, output_path
 
             # 특정 테이블만 추출
             print(f"▶ [mysql2pkl] 테이블 '{table_name}' 데이터 조회 중...")
-            safe_table_name = table_name.replace("`", "``")
-            df = pd.read_sql(text(f"SELECT * FROM `{safe_table_name}`"), con=engine)
+            if parallel_workers > 1:
+                df = concat_by_column(iter_table_parts(engine, table_name, parallel_workers, logger=print, retry=retry))
+            else:
+                safe_table_name = table_name.replace("`", "``")
+                df = retry.run(
+                    lambda: pd.read_sql(text(f"SELECT * FROM `{safe_table_name}`"), con=engine),
+                    engine=engine, label=table_name,
+                )
             print(f"✅ [mysql2pkl] 데이터 조회 완료: {df.shape[0]} rows, {df.shape[1]} columns")
             
             if df.empty:
                 print("⚠️ [mysql2pkl] 조회된 데이터가 없습니다.")
                 return False
 
-            df.to_pickle(output_path)
-            print(f"🎉 [mysql2pkl] Pickle 파일 저장 완료: {output_path}")
+            write_pickle(df, output_path, compression)
+            print(f"🎉 [mysql2pkl] Pickle 파일 저장 완료: {output_path}{_codec_suffix(compression)}")
 
         elif export_scope == "database":
             # 전체 데이터베이스 추출 (딕셔너리 형태)
@@ -65,16 +95,30 @@ def export_to_pkl(db_url, export_scope, table_name=None, query=None, output_path
             
             # 딕셔너리 형태로 모든 테이블 저장
             all_tables = {}
-            for table in table_list:
-                print(f"▶ [mysql2pkl] 테이블 '{table}' 추출 중...")
-                df = pd.read_sql(text(f"SELECT * FROM `{table}`"), con=engine)
-                all_tables[table] = df
-                print(f"   ✅ {df.shape[0]} rows, {df.shape[1]} columns")
+            if parallel_workers > 1:
+                print(f"▶ [mysql2pkl] {parallel_workers}개 연결로 테이블 동시 추출 중...")
+                started = time.perf_counter()
+                timings = []
+                for table, df, read_s in iter_tables_concurrently(engine, table_list, parallel_workers, retry=retry):
+                    all_tables[table] = df
+                    timings.append((table, df.shape[0], read_s, 0.0))
+                    print(f"   ✅ '{table}': {df.shape[0]} rows, {df.shape[1]} columns")
+                for line in format_timing_summary(timings, time.perf_counter() - started):
+                    print(line)
+            else:
+                for table in table_list:
+                    print(f"▶ [mysql2pkl] 테이블 '{table}' 추출 중...")
+                    df = retry.run(
+                        lambda: pd.read_sql(text(f"SELECT * FROM `{table}`"), con=engine),
+                        engine=engine, label=table,
+                    )
+                    all_tables[table] = df
+                    print(f"   ✅ {df.shape[0]} rows, {df.shape[1]} columns")
             
             # 딕셔너리를 pickle로 저장
-            pd.to_pickle(all_tables, output_path)
-            print(f"🎉 [mysql2pkl] 전체 데이터베이스 Pickle 파일 저장 완료: {output_path}")
-            print(f"   💡 불러올 때: data = pd.read_pickle('{output_path}'); df = data['테이블명']")
+            write_pickle(all_tables, output_path, compression)
+            print(f"🎉 [mysql2pkl] 전체 데이터베이스 Pickle 파일 저장 완료: {output_path}{_codec_suffix(compression)}")
+            print(f"   💡 불러올 때: data = {_read_hint(output_path, compression)}; df = data['테이블명']")
         
         return True
 
@@ -83,3 +127,219 @@ def export_to_pkl(db_url, export_scope, table_name=None, query=None, output_path
         raise e
     finally:
         dispose_mysql_engine(engine, logger=print, label="mysql2pkl")
+
+
+def export_incremental_pkl(db_url, table_name, watermark_column, output_dir, state_path=None, compression="none", recover=None, overlap=DEFAULT_WATERMARK_OVERLAP):
+    """
+    Exports only rows newer than the last exported watermark of a table.
+
+    The first run writes '<table>.base.pkl'; later runs write numbered
+    '<table>.delta.<seq>.pkl' files. The last watermark is kept per table in a
+    small JSON state file (default: '<output_dir>/.mysql2pkl_state.json').
+
+    Later runs read `watermark >= last - overlap`, so rows committed late
+    with an equal or lower watermark (same updated_at, out-of-order
+    auto-increment commits) are still picked up. Rows of that window that
+    were already exported unchanged are recognised by a row hash kept in the
+    state file and skipped; anything else re-read is merged away by
+    compact_incremental_pkl.
+
+    Args:
+        db_url (str): SQLAlchemy database URL.
+        table_name (str): Name of the table to export.
+        watermark_column (str): Monotonic column (auto-increment id or updated_at).
+        output_dir (str): Directory holding the base/delta files.
+        state_path (str, optional): Path of the watermark state file.
+        compression (str): 'none', 'zstd', 'lz4' or 'gzip'.
+        recover (callable, optional): Called before re-reading after a connection drop.
+        overlap (int): Re-read window below the last watermark, in seconds for
+            date/datetime columns and in column units for numeric ones.
+
+    Returns:
+        str or None: Path of the written file, or None if there were no new rows.
+    """
+    if not table_name:
+        raise ValueError("증분 추출에는 'table_name' 인자가 필수입니다.")
+    if not watermark_column:
+        raise ValueError("증분 추출에는 'watermark_column' 인자가 필수입니다.")
+    if not output_dir:
+        raise ValueError("증분 추출에는 'output_dir' 인자가 필수입니다.")
+
+    os.makedirs(output_dir, exist_ok=True)
+    state_path = state_path or default_state_path(output_dir)
+    db_name = make_url(db_url).database or ""
+
+    engine = None
+    try:
+        engine = create_mysql_engine(db_url)
+        print(f"✅ [mysql2pkl] 데이터베이스 연결 성공!")
+        retry = TransferRetry(recover=recover)
+
+        state = load_table_state(state_path, db_name, table_name)
+        if state and state['column'] != watermark_column:
+            raise ValueError(
+                f"저장된 Watermark 컬럼('{state['column']}')과 입력한 컬럼('{watermark_column}')이 다릅니다."
+            )
+
+        safe_table_name = table_name.replace("`", "``")
+        safe_column = watermark_column.replace("`", "``")
+        sql = f"SELECT * FROM `{safe_table_name}`"
+        params = {}
+        if state:
+            start = state['since'] if state['since'] is not None else _overlap_start(state['value'], overlap)
+            sql += f" WHERE `{safe_column}` >= :watermark"
+            params['watermark'] = start
+            print(f"▶ [mysql2pkl] 테이블 '{table_name}' 증분 조회 중... ({watermark_column} >= {start}, 마지막 {state['value']})")
+        else:
+            print(f"▶ [mysql2pkl] 테이블 '{table_name}' 저장된 Watermark 없음: 전체 조회 후 Base 파일 생성")
+        sql += f" ORDER BY `{safe_column}` ASC"
+
+        df = retry.run(lambda: pd.read_sql(text(sql), con=engine, params=params), engine=engine, label=table_name)
+        print(f"✅ [mysql2pkl] 데이터 조회 완료: {df.shape[0]} rows, {df.shape[1]} columns")
+
+        if not df.empty and watermark_column not in df.columns:
+            raise ValueError(f"Watermark 컬럼 '{watermark_column}'이 결과에 없습니다.")
+        hashes = _row_hashes(df)
+        new_rows = df
+        if state and state['seen']:
+            # Identical rows are legitimate (keyless log tables): skip only as many
+            # copies of each row as the previous run exported
+            occurrence = hashes.groupby(hashes).cumcount()
+            exported = hashes.map(state['seen']).fillna(0)
+            new_rows = df[(occurrence >= exported).to_numpy()].reset_index(drop=True)
+            if len(new_rows) < len(df):
+                print(f"   ⏭️ 이전에 추출한 겹침 구간 {len(df) - len(new_rows):,} rows 제외")
+
+        if new_rows.empty:
+            print("⚠️ [mysql2pkl] 새로 추가/변경된 데이터가 없습니다.")
+            return None
+
+        last_seq = state['last_seq'] if state else 0
+        if state:
+            last_seq += 1
+            output_path = _delta_path(output_dir, table_name, last_seq)
+        else:
+            output_path = _base_path(output_dir, table_name)
+
+        _write_pickle_atomic(new_rows, output_path, compression)
+        # Late rows may sit below the stored watermark: never move it backwards
+        new_watermark = new_rows[watermark_column].max()
+        if state and not new_watermark > state['value']:
+            new_watermark = state['value']
+        # Rows inside the next run's window, so it can skip them if unchanged
+        since = _overlap_start(new_watermark, overlap)
+        window = df[watermark_column] >= since
+        if window.sum() > MAX_SEEN_ROWS:
+            since = df.loc[window, watermark_column].sort_values().iloc[-MAX_SEEN_ROWS]
+            window = df[watermark_column] >= since
+            print(f"   ⚠️ 겹침 구간 행이 {MAX_SEEN_ROWS:,}건을 넘어 다음 재조회 시작을 {since}(으)로 좁힙니다.")
+        seen = {int(h): int(n) for h, n in hashes[window.to_numpy()].value_counts().items()}
+        save_table_state(state_path, db_name, table_name, watermark_column, new_watermark, last_seq, seen, since)
+
+        print(f"🎉 [mysql2pkl] 증분 Pickle 파일 저장 완료: {output_path}")
+        print(f"   💡 다음 Watermark: {watermark_column} >= {since} (겹침 {overlap})")
+        return output_path
+
+    except Exception as e:
+        print(f"❌ [mysql2pkl] 오류 발생: {e}")
+        raise e
+    finally:
+        dispose_mysql_engine(engine, logger=print, label="mysql2pkl")
+
+
+def compact_incremental_pkl(output_dir, table_name, key_column=None, compression="none"):
+    """
+    Merges '<table>.delta.*.pkl' files into '<table>.base.pkl' and removes the deltas.
+
+    Args:
+        output_dir (str): Directory holding the base/delta files.
+        table_name (str): Table whose files should be compacted.
+        key_column (str, optional): If given, keep only the latest row per key
+            (for 'updated_at' watermarks where changed rows are re-exported).
+            Without it all rows are kept: deltas never repeat a row of the
+            overlap window, so identical rows are genuine (keyless log tables).
+        compression (str): Codec of the merged base file. Inputs are auto-detected.
+
+    Returns:
+        int: Number of delta files merged.
+    """
+    base_path = _base_path(output_dir, table_name)
+    delta_paths = _list_delta_paths(output_dir, table_name)
+    if not delta_paths:
+        print(f"⚠️ [mysql2pkl] 병합할 델타 파일이 없습니다: {table_name}")
+        return 0
+
+    print(f"▶ [mysql2pkl] '{table_name}' 델타 {len(delta_paths)}개 병합 중...")
+    frames = []
+    if os.path.isfile(base_path):
+        frames.append(read_pickle(base_path))
+    for path in delta_paths:
+        frames.append(read_pickle(path))
+
+    merged = pd.concat(frames, ignore_index=True)
+    if key_column:
+        if key_column not in merged.columns:
+            raise ValueError(f"키 컬럼 '{key_column}'이 데이터에 없습니다.")
+        merged = merged.drop_duplicates(subset=[key_column], keep="last").reset_index(drop=True)
+
+    _write_pickle_atomic(merged, base_path, compression)
+    for path in delta_paths:
+        os.remove(path)
+
+    print(f"🎉 [mysql2pkl] 병합 완료: {base_path} ({merged.shape[0]} rows)")
+    return len(delta_paths)
+
+
+def _overlap_start(value, overlap):
+    """Lower bound of the re-read window: `overlap` seconds (date/time) or units (numeric) below value."""
+    if not overlap:
+        return value
+    if hasattr(value, "item") and not isinstance(value, datetime):  # numpy scalar from Series.max()
+        value = value.item()
+    if isinstance(value, datetime):
+        return value - timedelta(seconds=overlap)
+    if isinstance(value, date):
+        return value - timedelta(days=max(1, -(-int(overlap) // 86400)))
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        return value - overlap
+    return value  # strings: no arithmetic, the >= bound alone re-reads equal values
+
+
+def _row_hashes(df):
+    """Stable per-row hash (values only) used to recognise rows already exported."""
+    if df.empty:
+        return pd.Series([], dtype="uint64")
+    return pd.util.hash_pandas_object(df.astype(str), index=False)
+
+
+def _base_path(output_dir, table_name):
+    return os.path.join(output_dir, f"{table_name}.base.pkl")
+
+
+def _delta_path(output_dir, table_name, seq):
+    return os.path.join(output_dir, f"{table_name}.delta.{seq:06d}.pkl")
+
+
+def _list_delta_paths(output_dir, table_name):
+    pattern = os.path.join(glob.escape(output_dir), f"{glob.escape(table_name)}.delta.*.pkl")
+    seq_re = re.compile(r"\.delta\.(\d+)\.pkl$")
+    paths = [p for p in glob.glob(pattern) if seq_re.search(p)]
+    return sorted(paths, key=lambda p: int(seq_re.search(p).group(1)))
+
+
+def _write_pickle_atomic(obj, output_path, compression="none"):
+    tmp_path = output_path + ".tmp"
+    write_pickle(obj, tmp_path, compression)
+    os.replace(tmp_path, output_path)
+
+
+def _codec_suffix(compression):
+    return f" (압축: {compression})" if compression and compression != "none" else ""
+
+
+def _read_hint(output_path, compression):
+    if compression in ("zstd", "gzip"):
+        return f"pd.read_pickle('{output_path}', compression='{compression}')"
+    if compression == "lz4":
+        return f"storage.pickle_codec.read_pickle('{output_path}')"
+    return f"pd.read_pickle('{output_path}')"
@@ -0,0 +1,202 @@
+import os
+import sqlite3
+import time
+from sqlalchemy import text
+from mysql.services.query_safety import validate_read_only_query
+from sqlite.tosqlite.bulk_loader import DEFAULT_CHUNK_SIZE, bulk_load_pragmas, bulk_load_rows
+from sqlite.tosqlite.index_builder import build_indexes
+
+# MySQL DATA_TYPE -> SQLite column affinity. Dates/times stay TEXT (ISO strings),
+# DECIMAL keeps NUMERIC affinity (values are bound as text, so integers that fit
+# 64 bits land as exact INTEGERs); wider DECIMALs become TEXT, see sqlite_affinity.
+SQLITE_AFFINITY = {
+    "tinyint": "INTEGER", "smallint": "INTEGER", "mediumint": "INTEGER", "int": "INTEGER",
+    "integer": "INTEGER", "bigint": "INTEGER", "year": "INTEGER", "bool": "INTEGER", "boolean": "INTEGER",
+    "float": "REAL", "double": "REAL", "real": "REAL",
+    "decimal": "NUMERIC", "numeric": "NUMERIC",
+    "char": "TEXT", "varchar": "TEXT", "tinytext": "TEXT", "text": "TEXT", "mediumtext": "TEXT",
+    "longtext": "TEXT", "enum": "TEXT", "set": "TEXT", "json": "TEXT",
+    "date": "TEXT", "datetime": "TEXT", "timestamp": "TEXT", "time": "TEXT",
+    "binary": "BLOB", "varbinary": "BLOB", "tinyblob": "BLOB", "blob": "BLOB", "mediumblob": "BLOB",
+    "longblob": "BLOB", "bit": "BLOB", "geometry": "BLOB",
+}
+
+# pymysql FIELD_TYPE names (cursor.description type codes) -> MySQL DATA_TYPE, for query results.
+# The BLOB codes are shared by TEXT columns, so they map to 'text' (bytes still stay BLOBs).
+_FIELD_TYPE_NAMES = {
+    "TINY": "tinyint", "SHORT": "smallint", "INT24": "mediumint", "LONG": "int", "LONGLONG": "bigint",
+    "YEAR": "year", "FLOAT": "float", "DOUBLE": "double", "DECIMAL": "decimal", "NEWDECIMAL": "decimal",
+    "DATE": "date", "NEWDATE": "date", "DATETIME": "datetime", "TIMESTAMP": "timestamp", "TIME": "time",
+    "VARCHAR": "varchar", "VAR_STRING": "varchar", "STRING": "char", "JSON": "json", "ENUM": "enum",
+    "SET": "set", "TINY_BLOB": "text", "MEDIUM_BLOB": "text", "LONG_BLOB": "text", "BLOB": "text",
+    "BIT": "bit", "GEOMETRY": "geometry",
+}
+
+# Digits a REAL (double) holds exactly; NUMERIC affinity turns wider decimals into REAL
+_EXACT_REAL_DIGITS = 15
+
+
+def export_to_sqlite(engine, export_scope, table_name=None, query=None, output_path=None, if_exists="replace",
+                     chunk_size=DEFAULT_CHUNK_SIZE, index_spec=None):
+    """
+    Streams MySQL table(s) straight into a SQLite database, without an intermediate file.
+
+    Rows are read through a server-side cursor (stream_results) and handed to
+    the SQLite bulk loader `chunk_size` rows at a time, so memory stays
+    bounded by one chunk regardless of the table size. Tables are created
+    with SQLite affinities mapped from the MySQL column types.
+
+    Args:
+        engine: SQLAlchemy engine (the shared ConnectionManager engine; not disposed here).
+        export_scope (str): 'table', 'database', or 'query'.
+        table_name (str or None): Table to export ('table' scope), or the target table name ('query' scope).
+        query (str or None): Custom SQL query (for 'query' scope).
+        output_path (str): Path of the SQLite database file.
+        if_exists (str): 'replace' or 'append'.
+        chunk_size (int): Rows fetched and inserted per transaction.
+        index_spec (str): Indexes to build after the load (see index_builder.parse_index_spec);
+            None skips indexing and ANALYZE.
+
+    Returns:
+        bool: True if at least one table was written.
+    """
+    if not output_path:
+        raise ValueError("'output_path' 인자는 필수입니다.")
+    if engine is None:
+        raise ValueError("DB에 연결되어 있지 않습니다.")
+
+    conn = None
+    try:
+        conn = sqlite3.connect(output_path)
+        tables = []
+        with bulk_load_pragmas(conn):
+            if export_scope == "query":
+                if not query:
+                    raise ValueError("쿼리 스코프를 선택했을 경우, 'query' 인자는 필수입니다.")
+                validate_read_only_query(query)
+                target = table_name or "query_result"
+                print(f"▶ [mysql2sqlite] 사용자 정의 쿼리 실행 중... -> 테이블 '{target}'")
+                _transfer(engine, conn, text(query), target, None, if_exists, chunk_size)
+                tables.append(target)
+
+            elif export_scope == "table":
+                if not table_name:
+                    raise ValueError("테이블 스코프를 선택했을 경우, 'table_name' 인자는 필수입니다.")
+                _transfer_table(engine, conn, table_name, if_exists, chunk_size)
+                tables.append(table_name)
+
+            elif export_scope == "database":
+                print(f"▶ [mysql2sqlite] 데이터베이스의 모든 테이블 조회 중...")
+                with engine.connect() as mysql_conn:
+                    table_list = [row[0] for row in mysql_conn.execute(text("SHOW FULL TABLES WHERE Table_type = 'BASE TABLE'"))]
+                if not table_list:
+                    print("⚠️ [mysql2sqlite] 데이터베이스에 테이블이 없습니다.")
+                    return False
+                print(f"✅ [mysql2sqlite] {len(table_list)}개의 테이블 발견: {', '.join(table_list)}")
+                for table in table_list:
+                    _transfer_table(engine, conn, table, if_exists, chunk_size)
+                    tables.append(table)
+
+            else:
+                raise ValueError(f"지원하지 않는 추출 범위입니다: {export_scope}")
+
+            if index_spec is not None:
+                build_indexes(conn, tables, index_spec)
+
+        print(f"🎉 [mysql2sqlite] SQLite 파일 저장 완료: {output_path} ({os.path.getsize(output_path) / 1048576:.2f} MB)")
+        return True
+
+    except Exception as e:
+        print(f"❌ [mysql2sqlite] 오류 발생: {e}")
+        raise e
+    finally:
+        if conn:
+            conn.close()
+
+
+def sqlite_affinity(mysql_type, precision=None):
+    """
+    SQLite affinity for a MySQL DATA_TYPE (e.g. 'varchar', 'bigint'); unknown types become TEXT.
+
+    A DECIMAL with more than 15 digits of `precision` gets TEXT affinity:
+    under NUMERIC SQLite would convert such values to REAL and round them.
+    """
+    affinity = SQLITE_AFFINITY.get((mysql_type or "").lower(), "TEXT")
+    if affinity == "NUMERIC" and precision and int(precision) > _EXACT_REAL_DIGITS:
+        return "TEXT"
+    return affinity
+
+
+def _transfer_table(engine, conn, table_name, if_exists, chunk_size):
+    print(f"▶ [mysql2sqlite] 테이블 '{table_name}' 전송 중...")
+    schema = _table_schema(engine, table_name)
+    if not schema:
+        raise ValueError(f"테이블 '{table_name}'을(를) 찾을 수 없습니다.")
+    safe_table_name = table_name.replace("`", "``")
+    _transfer(engine, conn, text(f"SELECT * FROM `{safe_table_name}`"), table_name, schema, if_exists, chunk_size)
+
+
+def _transfer(engine, conn, statement, table_name, schema, if_exists, chunk_size):
+    """Stream `statement` from MySQL into `table_name`; schema=None derives types from the cursor."""
+    chunk_size = max(1, int(chunk_size or DEFAULT_CHUNK_SIZE))
+    started = time.perf_counter()
+    with engine.connect().execution_options(stream_results=True, max_row_buffer=chunk_size) as mysql_conn:
+        result = mysql_conn.execute(statement)
+        if schema is None:
+            schema = _cursor_schema(result.cursor.description)
+        _create_table(conn, table_name, schema, if_exists)
+        rows = bulk_load_rows(conn, table_name, [col["name"] for col in schema], result.partitions(chunk_size))
+    elapsed = time.perf_counter() - started
+    rate = f", {rows / elapsed:,.0f} rows/s" if elapsed and rows else ""
+    print(f"   ✅ '{table_name}': {rows:,} rows, {len(schema)} columns ({elapsed:.1f}s{rate})")
+    return rows
+
+
+def _table_schema(engine, table_name):
+    """[{'name', 'affinity', 'pk'}] from information_schema, in column order."""
+    with engine.connect() as mysql_conn:
+        rows = mysql_conn.execute(
+            text(
+                """
+                SELECT COLUMN_NAME, DATA_TYPE, COLUMN_KEY, NUMERIC_PRECISION
+                FROM information_schema.columns
+                WHERE table_schema = DATABASE() AND table_name = :tbl
+                ORDER BY ORDINAL_POSITION
+                """
+            ),
+            {"tbl": table_name},
+        ).fetchall()
+    return [{"name": r[0], "affinity": sqlite_affinity(r[1], r[3]), "pk": r[2] == "PRI"} for r in rows]
+
+
+def _cursor_schema(description):
+    from pymysql.constants import FIELD_TYPE
+
+    names = {getattr(FIELD_TYPE, n): n for n in _FIELD_TYPE_NAMES if hasattr(FIELD_TYPE, n)}
+    return [
+        {"name": d[0], "affinity": sqlite_affinity(_FIELD_TYPE_NAMES.get(names.get(d[1])), _decimal_digits(d)), "pk": False}
+        for d in description
+    ]
+
+
+def _decimal_digits(column):
+    """Upper bound of a DECIMAL's digits from a cursor description (length counts sign and point)."""
+    length, scale = column[4], column[5]
+    return length - (1 if scale else 0) if length else None
+
+
+def _create_table(conn, table_name, schema, if_exists):
+    table = _quote(table_name)
+    if if_exists == "replace":
+        conn.execute(f"DROP TABLE IF EXISTS {table}")
+        print(f"   - 기존 테이블 '{table_name}' 삭제됨 (Replace 모드)")
+    columns = [f"{_quote(col['name'])} {col['affinity']}" for col in schema]
+    pk = [_quote(col["name"]) for col in schema if col["pk"]]
+    if pk:
+        columns.append(f"PRIMARY KEY ({', '.join(pk)})")
+    conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(columns)})")
+    conn.commit()
+
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
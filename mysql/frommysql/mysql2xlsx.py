@@ -1,9 +1,13 @@
+import os
+import time
 import pandas as pd
 from sqlalchemy import text
 from mysql.services.engine_factory import create_mysql_engine, dispose_mysql_engine
 from mysql.services.query_safety import validate_read_only_query
+from mysql.services.resilience import TransferRetry
+from mysql.services.parallel_reader import format_timing_summary, iter_table_parts, iter_tables_concurrently
 
-def export_to_xlsx(db_url, export_scope, table_name=None, query=None, output_path=None):
+def export_to_xlsx(db_url, export_scope, table_name=None, query=None, output_path=None, parallel_workers=1, recover=None):
     """
     Exports MySQL data to an Excel file.
     
@@ -13,10 +17,14 @@ def export_to_xlsx(db_url, export_scope, table_name=None, query=None, output_pat
         table_name (str, optional): Name of the table to export (for 'table' scope).
         query (str, optional): Custom SQL query (for 'query' scope).
         output_path (str): Path to save the Excel file.
+        parallel_workers (int): Connections used to read a single table by PK range ('table' scope)
+            or several tables at once ('database' scope).
+        recover (callable, optional): Called before re-reading after a connection drop.
     """
     engine = None
+    retry = TransferRetry(recover=recover)
     try:
-        engine = create_mysql_engine(db_url)
+        engine = create_mysql_engine(db_url, pool_size=parallel_workers if parallel_workers > 1 else None)
         print(f"✅ [mysql2xlsx] 데이터베이스 연결 성공!")
         
         if export_scope == "query":
@@ -38,7 +46,7 @@ def export_to_xlsx(db_url, export_scope, table_name=None, query=None, output_pat
             # pd.read_sql 내부나 다른 라이브러리(pymysql/sqlalchemy) 연동 과정에서의 이슈일 가능성 높음.
             # 가장 확실한 해결책은 sqlalchemy의 text() 객체로 감싸는 것.
             
-            df = pd.read_sql(text(query), con=engine)
+            df = retry.run(lambda: pd.read_sql(text(query), con=engine), engine=engine, label="query")
             print(f"✅ [mysql2xlsx] 쿼리 실행 완료: {df.shape[0]} rows, {df.shape[1]} columns")
             
             if df.empty:
@@ -56,10 +64,13 @@ def export_to_xlsx(db_url, export_scope, table_name=None, query=None, output_pat
                 raise ValueError("테이블 스코프를 선택했을 경우, 'output_path' 인자는 필수입니다.")
                 
             print(f"▶ [mysql2xlsx] 테이블 '{table_name}' 데이터 조회 중...")
+            if parallel_workers > 1:
+                return _export_table_parallel(engine, table_name, output_path, parallel_workers, retry)
+
             # 간단한 SQL Injection 방지: 백틱 이스케이프
             safe_table_name = table_name.replace("`", "``")
             table_query = text(f"SELECT * FROM `{safe_table_name}`")
-            df = pd.read_sql(table_query, con=engine)
+            df = retry.run(lambda: pd.read_sql(table_query, con=engine), engine=engine, label=table_name)
             print(f"✅ [mysql2xlsx] 데이터 조회 완료: {df.shape[0]} rows, {df.shape[1]} columns")
             
             if df.empty:
@@ -85,12 +96,17 @@ def export_to_xlsx(db_url, export_scope, table_name=None, query=None, output_pat
             
             print(f"✅ [mysql2xlsx] {len(table_list)}개의 테이블 발견: {', '.join(table_list)}")
             
+            if parallel_workers > 1:
+                _export_database_concurrently(engine, table_list, output_path, parallel_workers, retry)
+                print(f"🎉 [mysql2xlsx] 전체 데이터베이스 엑셀 파일 저장 완료: {output_path}")
+                return True
+
             # ExcelWriter로 여러 시트 작성
             with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
                 for table in table_list:
                     print(f"▶ [mysql2xlsx] 테이블 '{table}' 추출 중...")
                     query = f"SELECT * FROM `{table}`"
-                    df = pd.read_sql(query, con=engine)
+                    df = retry.run(lambda: pd.read_sql(query, con=engine), engine=engine, label=table)
                     
                     # 시트 이름은 31자로 제한 (Excel 제약)
                     sheet_name = table[:31]
@@ -106,3 +122,49 @@ def export_to_xlsx(db_url, export_scope, table_name=None, query=None, output_pat
         raise e
     finally:
         dispose_mysql_engine(engine, logger=print, label="mysql2xlsx")
+
+
+def _export_table_parallel(engine, table_name, output_path, workers, retry=None):
+    """Write key-range partitions to one sheet in key order as they arrive."""
+    total_rows = 0
+    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+        for df in iter_table_parts(engine, table_name, workers, logger=print, retry=retry):
+            if df.empty:
+                continue
+            df.to_excel(
+                writer,
+                sheet_name="Sheet1",
+                index=False,
+                header=(total_rows == 0),
+                startrow=0 if total_rows == 0 else total_rows + 1,
+            )
+            total_rows += df.shape[0]
+        if total_rows == 0:
+            pd.DataFrame().to_excel(writer, sheet_name="Sheet1", index=False)
+
+    print(f"✅ [mysql2xlsx] 데이터 조회 완료: {total_rows} rows")
+    if total_rows == 0:
+        os.remove(output_path)
+        print("⚠️ [mysql2xlsx] 조회된 데이터가 없습니다.")
+        return False
+
+    print(f"🎉 [mysql2xlsx] 엑셀 파일 저장 완료: {output_path}")
+    return True
+
+
+def _export_database_concurrently(engine, table_list, output_path, workers, retry=None):
+    """Read tables on a worker pool; this thread is the only ExcelWriter user."""
+    print(f"▶ [mysql2xlsx] {workers}개 연결로 테이블 동시 추출 중...")
+    started = time.perf_counter()
+    timings = []
+    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+        for table, df, read_s in iter_tables_concurrently(engine, table_list, workers, retry=retry):
+            write_started = time.perf_counter()
+            # 시트 이름은 31자로 제한 (Excel 제약)
+            df.to_excel(writer, sheet_name=table[:31], index=False)
+            write_s = time.perf_counter() - write_started
+            timings.append((table, df.shape[0], read_s, write_s))
+            print(f"   ✅ '{table}': {df.shape[0]} rows, {df.shape[1]} columns")
+
+    for line in format_timing_summary(timings, time.perf_counter() - started):
+        print(line)
@@ -1,6 +1,8 @@
 import tkinter as tk
 from tkinter import filedialog, ttk, scrolledtext, messagebox
 import os
+from storage.pickle_codec import CODECS
+from ui.log_sink import create_log_sink
 
 class MySQLView:
     def __init__(self, notebook, app_instance):
@@ -17,6 +19,7 @@ class MySQLView:
         self._comparison_on_confirm = None
         self._comparison_on_refresh = None
         self._trace_bindings = {}
+        self._on_compact_deltas = None
 
         # Initialize persistent variables here so they don't get overwritten/garbage collected
         self._init_variables()
@@ -29,6 +32,13 @@ class MySQLView:
 
         # Export vars
         self.widgets['var_export_scope'] = tk.StringVar(value="table")
+        self.widgets['var_parallel_workers'] = tk.IntVar(value=1)
+        self.widgets['var_compression'] = tk.StringVar(value="none")
+        self.widgets['var_sqlite_indexes'] = tk.StringVar(value="auto")
+
+        # Copy vars
+        self.widgets['var_copy_direction'] = tk.StringVar(value="pull")
+        self.widgets['var_copy_mode'] = tk.StringVar(value="replace")
 
         # Import vars
         self.widgets['var_import_scope'] = tk.StringVar(value="all")
@@ -66,8 +76,11 @@ class MySQLView:
         modes = [
             ("MySQL -> Excel", "mysql2xlsx"),
             ("MySQL -> Pickle", "mysql2pkl"),
+            ("MySQL -> SQLite", "mysql2sqlite"),
             ("Excel -> MySQL", "xlsx2mysql"),
             ("Pickle -> MySQL", "pkl2mysql"),
+            ("SQLite -> MySQL", "sqlite2mysql"),
+            ("MySQL -> MySQL (Copy)", "mysql2mysql"),
         ]
 
         for text, value in modes:
@@ -83,6 +96,7 @@ class MySQLView:
         
         self.widgets['log_text'] = scrolledtext.ScrolledText(lb_log_frame, height=15, state='disabled', wrap='word')
         self.widgets['log_text'].pack(fill="both", expand=True)
+        self._log_sink = create_log_sink(self.widgets['log_text'], "mysql")
         
         # --- Action Buttons (Left Panel) ---
         btn_frame = tk.Frame(left_panel)
@@ -91,6 +105,9 @@ class MySQLView:
         self.widgets['btn_run'] = tk.Button(btn_frame, text="RUN", height=2, bg="#dddddd")
         self.widgets['btn_run'].pack(side="left", fill="x", expand=True, padx=(0, 5))
 
+        self.widgets['btn_resume'] = tk.Button(btn_frame, text="Resume", height=2, bg="#fff2cc")
+        self.widgets['btn_resume'].pack(side="left", fill="x", expand=True, padx=5)
+
         self.widgets['btn_release'] = tk.Button(btn_frame, text="Release", height=2, bg="#ffcccc")
         self.widgets['btn_release'].pack(side="left", fill="x", expand=True, padx=(5, 0))
 
@@ -110,10 +127,7 @@ class MySQLView:
         return self.tab
 
     def log(self, message):
-        self.widgets['log_text'].configure(state='normal')
-        self.widgets['log_text'].insert(tk.END, message + "\n")
-        self.widgets['log_text'].see(tk.END)
-        self.widgets['log_text'].configure(state='disabled')
+        self._log_sink.log(message)
 
     def toggle_query_panel(self, show):
         if show:
@@ -130,10 +144,12 @@ class MySQLView:
         for widget in self.lb_input_frame.winfo_children():
             widget.destroy() 
         
-        if mode in ["mysql2xlsx", "mysql2pkl"]:
+        if mode in ["mysql2xlsx", "mysql2pkl", "mysql2sqlite"]:
             self._create_export_widgets(mode, on_query_mode_change)
-        elif mode in ["xlsx2mysql", "pkl2mysql"]:
+        elif mode in ["xlsx2mysql", "pkl2mysql", "sqlite2mysql"]:
             self._create_import_widgets(mode)
+        elif mode == "mysql2mysql":
+            self._create_copy_widgets()
 
     def _create_export_widgets(self, mode, on_query_mode_change):
         # Export scope selection
@@ -148,26 +164,115 @@ class MySQLView:
                        value="database", command=lambda: self._toggle_export_entry(on_query_mode_change)).pack(side="left", padx=5)
         tk.Radiobutton(frame_scope, text="사용자 정의 쿼리", variable=self.widgets['var_export_scope'], 
                        value="query", command=lambda: self._toggle_export_entry(on_query_mode_change)).pack(side="left", padx=5)
+        if mode == "mysql2pkl":
+            tk.Radiobutton(frame_scope, text="증분 (Watermark)", variable=self.widgets['var_export_scope'],
+                           value="incremental", command=lambda: self._toggle_export_entry(on_query_mode_change)).pack(side="left", padx=5)
+        elif self.widgets['var_export_scope'].get() == "incremental":
+            self.widgets['var_export_scope'].set("table")
         
         # Table name input
         tk.Label(self.lb_input_frame, text="테이블명:").grid(row=1, column=0, sticky="e", padx=5, pady=5)
         self.widgets['entry_table_name'] = tk.Entry(self.lb_input_frame, width=30)
         self.widgets['entry_table_name'].grid(row=1, column=1, sticky="w", padx=5, pady=5)
+
+        # Incremental export (watermark) - conditional
+        self.widgets['lbl_watermark_col'] = tk.Label(self.lb_input_frame, text="Watermark 컬럼:")
+        self.widgets['entry_watermark_col'] = tk.Entry(self.lb_input_frame, width=30)
+        self.widgets['lbl_watermark_help'] = tk.Label(self.lb_input_frame, text="(auto_increment id 또는 updated_at)", fg="gray", font=("", 8))
+        self.widgets['lbl_key_col'] = tk.Label(self.lb_input_frame, text="병합 키 컬럼:")
+        self.widgets['entry_key_col'] = tk.Entry(self.lb_input_frame, width=30)
+        self.widgets['btn_compact'] = tk.Button(self.lb_input_frame, text="델타 병합", command=self._on_compact_clicked)
+
+        # Parallel read connections
+        if mode != "mysql2sqlite":
+            tk.Label(self.lb_input_frame, text="병렬 연결 수:").grid(row=4, column=0, sticky="e", padx=5, pady=5)
+            self.widgets['spn_parallel_workers'] = tk.Spinbox(
+                self.lb_input_frame, from_=1, to=16, width=5, textvariable=self.widgets['var_parallel_workers']
+            )
+            self.widgets['spn_parallel_workers'].grid(row=4, column=1, sticky="w", padx=5, pady=5)
+            tk.Label(self.lb_input_frame, text="(테이블: PK 구간 병렬 / 전체 DB: 테이블 동시 조회)", fg="gray", font=("", 8)).grid(
+                row=4, column=2, sticky="w", padx=5, pady=5
+            )
+
+        # SQLite indexes built after the transfer
+        if mode == "mysql2sqlite":
+            tk.Label(self.lb_input_frame, text="인덱스:").grid(row=4, column=0, sticky="e", padx=5, pady=5)
+            tk.Entry(self.lb_input_frame, textvariable=self.widgets['var_sqlite_indexes'], width=30).grid(
+                row=4, column=1, sticky="w", padx=5, pady=5
+            )
+            tk.Label(self.lb_input_frame, text="(auto; 테이블: a, b+c / 비우면 생략)", fg="gray", font=("", 8)).grid(
+                row=4, column=2, sticky="w", padx=5, pady=5
+            )
+
+        # Pickle compression codec
+        if mode == "mysql2pkl":
+            tk.Label(self.lb_input_frame, text="압축:").grid(row=5, column=0, sticky="e", padx=5, pady=5)
+            self.widgets['cmb_compression'] = ttk.Combobox(
+                self.lb_input_frame, textvariable=self.widgets['var_compression'],
+                values=list(CODECS), state="readonly", width=10
+            )
+            self.widgets['cmb_compression'].grid(row=5, column=1, sticky="w", padx=5, pady=5)
+            tk.Label(self.lb_input_frame, text="(Import 시 자동 감지)", fg="gray", font=("", 8)).grid(
+                row=5, column=2, sticky="w", padx=5, pady=5
+            )
         
         # Initial state
         self._toggle_export_entry(on_query_mode_change)
 
     def _toggle_export_entry(self, on_query_mode_change):
         scope = self.widgets['var_export_scope'].get()
-        if scope == "table":
+        if scope in ("table", "incremental"):
             self.widgets['entry_table_name'].config(state="normal")
         else:
             self.widgets['entry_table_name'].delete(0, tk.END)
             self.widgets['entry_table_name'].config(state="disabled")
+
+        if scope == "incremental":
+            self.widgets['lbl_watermark_col'].grid(row=2, column=0, sticky="e", padx=5, pady=5)
+            self.widgets['entry_watermark_col'].grid(row=2, column=1, sticky="w", padx=5, pady=5)
+            self.widgets['lbl_watermark_help'].grid(row=2, column=2, sticky="w", padx=5, pady=5)
+            self.widgets['lbl_key_col'].grid(row=3, column=0, sticky="e", padx=5, pady=5)
+            self.widgets['entry_key_col'].grid(row=3, column=1, sticky="w", padx=5, pady=5)
+            self.widgets['btn_compact'].grid(row=3, column=2, sticky="w", padx=5, pady=5)
+        else:
+            for key in ('lbl_watermark_col', 'entry_watermark_col', 'lbl_watermark_help',
+                        'lbl_key_col', 'entry_key_col', 'btn_compact'):
+                self.widgets[key].grid_forget()
             
         if on_query_mode_change:
             on_query_mode_change(scope == "query")
 
+    def _on_compact_clicked(self):
+        if self._on_compact_deltas:
+            self._on_compact_deltas()
+
+    def _create_copy_widgets(self):
+        # Direction between the connected env and the other env from .env
+        tk.Label(self.lb_input_frame, text="복사 방향:").grid(row=0, column=0, sticky="e", padx=5, pady=5)
+        frame_direction = tk.Frame(self.lb_input_frame)
+        frame_direction.grid(row=0, column=1, sticky="w", padx=5, pady=5, columnspan=2)
+        tk.Radiobutton(frame_direction, text="반대 환경 → 현재 연결", variable=self.widgets['var_copy_direction'],
+                       value="pull").pack(side="left", padx=5)
+        tk.Radiobutton(frame_direction, text="현재 연결 → 반대 환경", variable=self.widgets['var_copy_direction'],
+                       value="push").pack(side="left", padx=5)
+        tk.Label(self.lb_input_frame, text="(반대 환경: 현재가 DEV면 .env의 PROD_MYSQL_*, PROD면 MYSQL_*)",
+                 fg="gray", font=("", 8)).grid(row=1, column=1, sticky="w", padx=5, columnspan=2)
+
+        tk.Label(self.lb_input_frame, text="테이블:").grid(row=2, column=0, sticky="e", padx=5, pady=5)
+        self.widgets['entry_copy_tables'] = tk.Entry(self.lb_input_frame, width=30)
+        self.widgets['entry_copy_tables'].grid(row=2, column=1, sticky="w", padx=5, pady=5)
+        tk.Label(self.lb_input_frame, text="(쉼표로 구분, 비우면 전체)", fg="gray", font=("", 8)).grid(
+            row=2, column=2, sticky="w", padx=5, pady=5
+        )
+
+        tk.Label(self.lb_input_frame, text="복사 모드:").grid(row=3, column=0, sticky="e", padx=5, pady=5)
+        frame_mode = tk.Frame(self.lb_input_frame)
+        frame_mode.grid(row=3, column=1, sticky="w", padx=5, pady=5, columnspan=2)
+        tk.Radiobutton(frame_mode, text="Replace (DDL·인덱스 포함 재생성)", variable=self.widgets['var_copy_mode'],
+                       value="replace").pack(side="left", padx=5)
+        tk.Radiobutton(frame_mode, text="Append (추가)", variable=self.widgets['var_copy_mode'],
+                       value="append").pack(side="left", padx=5)
+
     def _create_import_widgets(self, mode):
         self._on_file_selected = None  # callback set by controller
         # File path selection
@@ -197,7 +302,12 @@ class MySQLView:
         )
 
         # Help text for source
-        help_text = "(Dictionary 키 또는 시트명)" if mode == "pkl2mysql" else "(시트명, 비워두면 첫 시트)"
+        if mode == "pkl2mysql":
+            help_text = "(Dictionary 키 또는 시트명)"
+        elif mode == "sqlite2mysql":
+            help_text = "(SQLite 테이블명)"
+        else:
+            help_text = "(시트명, 비워두면 첫 시트)"
         self.widgets['lbl_source_help'] = tk.Label(self.lb_input_frame, text=help_text, fg="gray", font=("", 8))
         
         # Target table name - conditional
@@ -289,7 +399,9 @@ class MySQLView:
         if mode == "xlsx2xlsx":
             filetypes = [("Excel files", "*.xlsx *.xls")]
         elif mode == "pkl2mysql":
-            filetypes = [("Pickle files", "*.pkl")]
+            filetypes = [("Pickle files", "*.pkl *.pkl.zst *.pkl.lz4 *.pkl.gz"), ("All Files", "*.*")]
+        elif mode == "sqlite2mysql":
+            filetypes = [("SQLite DB", "*.db *.sqlite *.sqlite3"), ("All Files", "*.*")]
         elif mode == "xlsx2mysql":
             filetypes = [("Excel files", "*.xlsx *.xls")]
 
@@ -312,16 +424,64 @@ class MySQLView:
     def get_query_text(self):
         return self.widgets['txt_query'].get("1.0", tk.END).strip()
 
+    def get_parallel_workers(self):
+        try:
+            return max(1, int(self.widgets['var_parallel_workers'].get()))
+        except (tk.TclError, ValueError):
+            return 1
+
     def get_export_params(self):
         scope = self.widgets['var_export_scope'].get()
         if scope == "table":
             table_name = self.widgets['entry_table_name'].get().strip()
             if not table_name: return None
-            return {'scope': 'table', 'table_name': table_name}
+            return {
+                'scope': 'table', 'table_name': table_name,
+                'workers': self.get_parallel_workers(), 'compression': self.get_compression(),
+            }
         elif scope == "database":
-            return {'scope': 'database', 'table_name': None}
+            return {
+                'scope': 'database', 'table_name': None,
+                'workers': self.get_parallel_workers(), 'compression': self.get_compression(),
+            }
+        elif scope == "incremental":
+            table_name = self.widgets['entry_table_name'].get().strip()
+            watermark_column = self.widgets['entry_watermark_col'].get().strip()
+            if not table_name or not watermark_column: return None
+            return {
+                'scope': 'incremental',
+                'table_name': table_name,
+                'watermark_column': watermark_column,
+                'key_column': self.widgets['entry_key_col'].get().strip() or None,
+                'compression': self.get_compression(),
+            }
         else:
-            return {'scope': 'query', 'table_name': None}
+            return {'scope': 'query', 'table_name': None, 'compression': self.get_compression()}
+
+    def get_compression(self):
+        return self.widgets['var_compression'].get() or "none"
+
+    def get_copy_params(self):
+        tables = [t.strip() for t in self.widgets['entry_copy_tables'].get().split(",") if t.strip()]
+        return {
+            'direction': self.widgets['var_copy_direction'].get(),
+            'tables': tables,
+            'if_exists': self.widgets['var_copy_mode'].get(),
+        }
+
+    def get_sqlite_index_spec(self):
+        return self.widgets['var_sqlite_indexes'].get().strip() or None
+
+    def get_compact_params(self):
+        if 'entry_table_name' not in self.widgets:
+            return None
+        table_name = self.widgets['entry_table_name'].get().strip()
+        if not table_name: return None
+        return {
+            'table_name': table_name,
+            'key_column': self.widgets['entry_key_col'].get().strip() or None,
+            'compression': self.get_compression(),
+        }
 
     def get_import_params(self):
         file_path = self.widgets['entry_file_path'].get().strip()
@@ -391,8 +551,12 @@ class MySQLView:
             if 'btn_run' in self.widgets: self.widgets['btn_run'].config(command=handler)
         elif key == 'release_button':
             if 'btn_release' in self.widgets: self.widgets['btn_release'].config(command=handler)
+        elif key == 'resume_button':
+            if 'btn_resume' in self.widgets: self.widgets['btn_resume'].config(command=handler)
         elif key == 'mode_change':
              self.widgets['var_mode'].trace_add('write', handler)
+        elif key == 'compact_deltas':
+            self._on_compact_deltas = handler
         
         # Collation related triggers
         elif key == 'target_table_change':
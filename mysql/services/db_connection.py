@@ -1,7 +1,8 @@
 import os
-import time
 from typing import Callable, Optional, Tuple
 
+from mysql.services.tunnel_probe import DEFAULT_READY_TIMEOUT, wait_until_ready
+
 
 def get_db_url_and_config(
     db_name: str,
@@ -56,7 +57,15 @@ def get_db_url_and_config(
                 set_keepalive=10.0
             )
             tunnel.start()
-            time.sleep(1.0)
+            try:
+                probe = wait_until_ready(
+                    '127.0.0.1', ssh_bind_port,
+                    timeout=float(env_getter("SSH_READY_TIMEOUT", DEFAULT_READY_TIMEOUT)),
+                )
+            except Exception:
+                tunnel.stop()
+                raise
+            print(f"✅ SSH 터널 준비 완료: {probe['elapsed_s'] * 1000:.0f} ms ({probe['attempts']}회 확인)")
 
             config['host'] = '127.0.0.1'
             config['port'] = ssh_bind_port
@@ -1,8 +1,35 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine.url import make_url
 
 
-def create_mysql_engine(db_url):
-    return create_engine(db_url)
+# (host, port) -> connector(url) returning a DBAPI connection. Lets a
+# multi-forwarder SSH tunnel spread connections of any engine built for its
+# local endpoint (see connection.tunnel_pool.TunnelPool).
+_ENDPOINT_CONNECTORS = {}
+
+
+def register_endpoint_connector(host, port, connector):
+    _ENDPOINT_CONNECTORS[(host, int(port))] = connector
+
+
+def unregister_endpoint_connector(host, port):
+    _ENDPOINT_CONNECTORS.pop((host, int(port)), None)
+
+
+def create_mysql_engine(db_url, pool_size=None):
+    """
+    Create an engine; pool_size sizes the pool for parallel readers/writers.
+    pool_pre_ping replaces connections that died with a dropped tunnel.
+    """
+    kwargs = {"pool_pre_ping": True}
+    if pool_size:
+        kwargs.update(pool_size=pool_size, max_overflow=0)
+
+    url = make_url(db_url)
+    connector = _ENDPOINT_CONNECTORS.get((url.host, url.port or 3306))
+    if connector:
+        kwargs["creator"] = lambda: connector(url)
+    return create_engine(url, **kwargs)
 
 
 def dispose_mysql_engine(engine, logger=None, label=None):
@@ -0,0 +1,141 @@
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Optional
+
+
+DEFAULT_JOURNAL_PATH = os.path.join(os.path.expanduser("~"), ".sqlhandler", "import_journal.json")
+
+
+# Bytes hashed from the start, middle and end of the file by file_fingerprint()
+_SAMPLE_BYTES = 1024 * 1024
+
+
+def file_fingerprint(path: str, sample_bytes: int = _SAMPLE_BYTES) -> str:
+    """
+    Cheap identity of a file for resume checks: size, mtime and a SHA-256
+    of three sampled blocks (start / middle / end) instead of the whole file.
+    """
+    stat = os.stat(path)
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for offset in sorted({0, max(0, stat.st_size // 2 - sample_bytes // 2), max(0, stat.st_size - sample_bytes)}):
+            f.seek(offset)
+            digest.update(f.read(sample_bytes))
+    return f"{stat.st_size}:{stat.st_mtime_ns}:{digest.hexdigest()}"
+
+
+def make_job_key(db_config: dict, file_path: str) -> str:
+    return (
+        f"{db_config['host']}:{int(db_config['port'])}/{db_config['database']}"
+        f"|{os.path.abspath(file_path)}"
+    )
+
+
+class ImportJournal:
+    """
+    Per-chunk checkpoints of a file → MySQL import, kept in a local JSON file.
+
+    One entry per (target DB, source file). Each table records the row offset
+    of the last committed chunk; an entry is removed once the import finishes.
+    """
+
+    def __init__(self, job_key: str, journal_path: Optional[str] = None):
+        self.job_key = job_key
+        self.path = journal_path or DEFAULT_JOURNAL_PATH
+        self._entry = self._read_all().get(job_key)
+        self._pending = None
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def exists(self) -> bool:
+        return self._entry is not None
+
+    def get_entry(self) -> Optional[dict]:
+        return self._entry
+
+    def get_offset(self, table_name: str) -> int:
+        if not self._entry:
+            return 0
+        return int(self._entry['tables'].get(table_name, {}).get('offset', 0))
+
+    def is_table_done(self, table_name: str) -> bool:
+        if not self._entry:
+            return False
+        return bool(self._entry['tables'].get(table_name, {}).get('done', False))
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+    def begin(self, file_fingerprint: str, options: dict) -> None:
+        """
+        Start a fresh entry, discarding any previous checkpoints for this job.
+
+        The entry is only written with the first checkpoint, so an import
+        that fails before committing anything leaves no journal behind.
+        """
+        if self._entry is not None:
+            self._entry = None
+            self._flush()
+        self._pending = {
+            'file_fingerprint': file_fingerprint,
+            'options': options,
+            'tables': {},
+            'started_at': _now(),
+            'updated_at': _now(),
+        }
+
+    def matches(self, file_fingerprint: str) -> bool:
+        return bool(self._entry) and self._entry.get('file_fingerprint') == file_fingerprint
+
+    def record_chunk(self, table_name: str, offset: int, total: int) -> None:
+        self._activate()
+        table = self._entry['tables'].setdefault(table_name, {})
+        table.update({'offset': int(offset), 'total': int(total), 'done': False})
+        self._entry['updated_at'] = _now()
+        self._flush()
+
+    def mark_table_done(self, table_name: str, total: int) -> None:
+        self._activate()
+        table = self._entry['tables'].setdefault(table_name, {})
+        table.update({'offset': int(total), 'total': int(total), 'done': True})
+        self._entry['updated_at'] = _now()
+        self._flush()
+
+    def finish(self) -> None:
+        self._pending = None
+        if self._entry is not None:
+            self._entry = None
+            self._flush()
+
+    def _activate(self) -> None:
+        if self._entry is None and self._pending is not None:
+            self._entry, self._pending = self._pending, None
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+    def _read_all(self) -> dict:
+        if not os.path.isfile(self.path):
+            return {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _flush(self) -> None:
+        data = self._read_all()
+        if self._entry is None:
+            data.pop(self.job_key, None)
+        else:
+            data[self.job_key] = self._entry
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec='seconds')
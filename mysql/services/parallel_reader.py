@@ -0,0 +1,195 @@
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+import pandas as pd
+from sqlalchemy import text
+
+
+INTEGER_TYPES = ("tinyint", "smallint", "mediumint", "int", "integer", "bigint")
+
+
+def detect_range_key(engine, table_name: str) -> Tuple[Optional[str], bool]:
+    """
+    Return (key_column, is_primary_key) usable for range partitioning.
+
+    Prefers a single-column integer PRIMARY KEY. Falls back to the
+    CleanerController heuristic (a column named 'id', else the first column)
+    when that column is an integer type. Returns (None, False) otherwise.
+    """
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(
+                """
+                SELECT COLUMN_NAME, DATA_TYPE, COLUMN_KEY
+                FROM information_schema.columns
+                WHERE table_schema = DATABASE() AND table_name = :tbl
+                ORDER BY ORDINAL_POSITION
+                """
+            ),
+            {"tbl": table_name},
+        ).fetchall()
+
+    if not rows:
+        return None, False
+
+    pk_cols = [r for r in rows if r[2] == "PRI"]
+    if len(pk_cols) == 1 and pk_cols[0][1].lower() in INTEGER_TYPES:
+        return pk_cols[0][0], True
+
+    lower = [r[0].lower() for r in rows]
+    candidate = rows[lower.index("id")] if "id" in lower else rows[0]
+    if candidate[1].lower() in INTEGER_TYPES:
+        return candidate[0], candidate[2] == "PRI"
+    return None, False
+
+
+def compute_key_ranges(engine, table_name: str, key_column: str, partitions: int) -> List[Tuple[int, int]]:
+    """Split [MIN(key), MAX(key)] into at most `partitions` inclusive integer ranges."""
+    safe_table = table_name.replace("`", "``")
+    safe_key = key_column.replace("`", "``")
+    with engine.connect() as conn:
+        lo, hi = conn.execute(
+            text(f"SELECT MIN(`{safe_key}`), MAX(`{safe_key}`) FROM `{safe_table}`")
+        ).fetchone()
+
+    if lo is None or hi is None:
+        return []
+
+    lo, hi = int(lo), int(hi)
+    span = hi - lo + 1
+    partitions = max(1, min(int(partitions), span))
+    step = -(-span // partitions)  # ceil
+
+    ranges = []
+    start = lo
+    while start <= hi:
+        end = min(start + step - 1, hi)
+        ranges.append((start, end))
+        start = end + 1
+    return ranges
+
+
+def iter_partitioned_table(
+    engine,
+    table_name: str,
+    key_column: str,
+    workers: int,
+    partitions: Optional[int] = None,
+    include_null_keys: bool = False,
+    logger=print,
+    retry=None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Read a table as key-range partitions on `workers` pooled connections.
+
+    Partitions are fetched concurrently but yielded strictly in key order, so
+    callers can write them sequentially. At most 2 * workers partitions are
+    in flight, which bounds memory to a few partitions instead of the table.
+    With a TransferRetry, a partition read that hits a dropped connection is
+    re-read after reconnecting.
+    """
+    workers = max(1, int(workers))
+    ranges = compute_key_ranges(engine, table_name, key_column, partitions or workers * 4)
+    safe_table = table_name.replace("`", "``")
+    safe_key = key_column.replace("`", "``")
+
+    range_sql = text(
+        f"SELECT * FROM `{safe_table}` WHERE `{safe_key}` BETWEEN :lo AND :hi ORDER BY `{safe_key}` ASC"
+    )
+    tasks = [(range_sql, {"lo": lo, "hi": hi}) for lo, hi in ranges]
+    if include_null_keys:
+        tasks.append((text(f"SELECT * FROM `{safe_table}` WHERE `{safe_key}` IS NULL"), {}))
+
+    if ranges:
+        logger(f"   ▶ 키 '{key_column}' 범위 {ranges[0][0]} ~ {ranges[-1][1]}를 {len(ranges)}개 구간으로 분할 ({workers}개 연결)")
+
+    def _read(task):
+        sql, params = task
+        return _run(retry, lambda: pd.read_sql(sql, con=engine, params=params), engine, table_name)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        task_iter = iter(tasks)
+        for task in task_iter:
+            pending.append(pool.submit(_read, task))
+            if len(pending) >= workers * 2:
+                break
+
+        while pending:
+            df = pending.popleft().result()
+            next_task = next(task_iter, None)
+            if next_task is not None:
+                pending.append(pool.submit(_read, next_task))
+            yield df
+
+
+def iter_table_parts(engine, table_name: str, workers: int, logger=print, retry=None) -> Iterator[pd.DataFrame]:
+    """
+    Yield a table's rows as DataFrames in key order.
+
+    Uses iter_partitioned_table when an integer range key is found; otherwise
+    falls back to a single SELECT * so callers never need a second code path.
+    """
+    key_column, is_pk = detect_range_key(engine, table_name)
+    if not key_column:
+        logger(f"   ⚠️ '{table_name}': 정수형 키 컬럼이 없어 단일 연결로 조회합니다.")
+        safe_table = table_name.replace("`", "``")
+        yield _run(retry, lambda: pd.read_sql(text(f"SELECT * FROM `{safe_table}`"), con=engine), engine, table_name)
+        return
+
+    if not is_pk:
+        logger(f"   ⚠️ '{table_name}': '{key_column}'은 PK가 아닙니다. 인덱스가 없으면 구간마다 전체 스캔이 발생할 수 있습니다.")
+
+    yield from iter_partitioned_table(
+        engine, table_name, key_column, workers,
+        include_null_keys=not is_pk, logger=logger, retry=retry,
+    )
+
+
+def iter_tables_concurrently(
+    engine, table_names: List[str], workers: int, retry=None
+) -> Iterator[Tuple[str, pd.DataFrame, float]]:
+    """
+    Read whole tables on a bounded worker pool; yield (table, df, read_seconds).
+
+    Results are yielded in the order of `table_names` regardless of which read
+    finishes first, so the single consumer (the writer) produces a
+    deterministic sheet/key order. At most 2 * workers tables are held.
+    """
+    workers = max(1, int(workers))
+
+    def _read(table_name):
+        started = time.perf_counter()
+        safe_table = table_name.replace("`", "``")
+        df = _run(retry, lambda: pd.read_sql(text(f"SELECT * FROM `{safe_table}`"), con=engine), engine, table_name)
+        return df, time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        name_iter = iter(table_names)
+        for table_name in name_iter:
+            pending.append((table_name, pool.submit(_read, table_name)))
+            if len(pending) >= workers * 2:
+                break
+
+        while pending:
+            table_name, future = pending.popleft()
+            df, elapsed = future.result()
+            next_name = next(name_iter, None)
+            if next_name is not None:
+                pending.append((next_name, pool.submit(_read, next_name)))
+            yield table_name, df, elapsed
+
+
+def _run(retry, fn, engine, label):
+    return retry.run(fn, engine=engine, label=label) if retry else fn()
+
+
+def format_timing_summary(timings: List[Tuple[str, int, float, float]], wall_seconds: float) -> List[str]:
+    """Format [(table, rows, read_s, write_s), ...] as log lines, slowest reads first."""
+    lines = [f"⏱️ 테이블별 소요 시간 (총 {wall_seconds:.2f}s, 읽기 합계 {sum(t[2] for t in timings):.2f}s)"]
+    for table_name, rows, read_s, write_s in sorted(timings, key=lambda t: t[2], reverse=True):
+        lines.append(f"   - {table_name}: {rows} rows | 읽기 {read_s:.2f}s | 쓰기 {write_s:.2f}s")
+    return lines
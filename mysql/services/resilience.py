@@ -0,0 +1,121 @@
+import random
+import socket
+import time
+from typing import Callable, Optional
+
+import pymysql
+
+
+CONNECTION_ERROR_CODES = {
+    1040,  # Too many connections
+    2003,  # Can't connect to MySQL server
+    2006,  # MySQL server has gone away
+    2013,  # Lost connection to MySQL server during query
+    2055,  # Lost connection to MySQL server at '...', system error
+}
+
+LOCK_ERROR_CODES = {
+    1205,  # Lock wait timeout exceeded
+    1213,  # Deadlock found when trying to get lock
+}
+
+TRANSIENT_ERROR_CODES = CONNECTION_ERROR_CODES | LOCK_ERROR_CODES
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """True for connection/tunnel loss and lock timeouts worth retrying."""
+    return is_connection_error(exc) or is_lock_error(exc)
+
+
+def is_connection_error(exc: BaseException) -> bool:
+    """True when the connection (or SSH tunnel) itself was lost and must be re-established."""
+    for e in _error_chain(exc):
+        if getattr(e, "connection_invalidated", False):
+            return True
+        if isinstance(e, (ConnectionError, TimeoutError, socket.timeout)):
+            return True
+        if isinstance(e, pymysql.err.InterfaceError):
+            return True  # operation on a closed connection
+        if _mysql_error_code(e) in CONNECTION_ERROR_CODES:
+            return True
+    return False
+
+
+def is_lock_error(exc: BaseException) -> bool:
+    """True for lock wait timeouts and deadlocks: the connection is fine, only the transaction failed."""
+    return any(_mysql_error_code(e) in LOCK_ERROR_CODES for e in _error_chain(exc))
+
+
+def _error_chain(exc):
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        yield exc
+        exc = getattr(exc, "orig", None) or exc.__cause__ or exc.__context__
+
+
+def _mysql_error_code(exc):
+    if isinstance(exc, (pymysql.err.OperationalError, pymysql.err.InternalError)):
+        args = getattr(exc, "args", ())
+        if args:
+            return args[0]
+    return None
+
+
+class TransferRetry:
+    """
+    Retries one unit of transfer work (a chunk or a read) on transient errors.
+
+    After a lost connection it calls `recover()` (e.g. ConnectionManager.recover,
+    which restarts a dead SSH tunnel) and disposes the given engine's pool so
+    the next attempt gets fresh connections. Lock wait timeouts and deadlocks
+    only re-run the unit: the failed transaction is already rolled back and
+    the pool (possibly shared with other threads) is left alone. Units must
+    be idempotent: chunk writes run in their own transaction, so a failed
+    attempt is rolled back.
+    """
+
+    def __init__(
+        self,
+        recover: Optional[Callable[[], object]] = None,
+        attempts: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        log=print,
+        sleep=time.sleep,
+    ):
+        self.recover = recover
+        self.attempts = max(1, int(attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.log = log
+        self._sleep = sleep
+
+    def run(self, fn: Callable[[], object], engine=None, label: str = ""):
+        for attempt in range(1, self.attempts + 1):
+            try:
+                return fn()
+            except Exception as e:
+                lost = is_connection_error(e)
+                if attempt >= self.attempts or not (lost or is_lock_error(e)):
+                    raise
+                delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+                delay *= 0.5 + random.random() / 2
+                target = f" ({label})" if label else ""
+                kind = "연결 오류" if lost else "잠금 충돌"
+                self.log(
+                    f"  ⚠️ {kind}{target}: {e.__class__.__name__} — "
+                    f"{delay:.1f}초 후 재시도 ({attempt}/{self.attempts - 1})"
+                )
+                self._sleep(delay)
+                if lost:
+                    self._reconnect(engine)
+
+    def _reconnect(self, engine):
+        if self.recover:
+            try:
+                self.recover()
+            except Exception as e:
+                self.log(f"  ⚠️ 재연결 실패: {e}")
+        if engine is not None:
+            engine.dispose()
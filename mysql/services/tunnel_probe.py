@@ -0,0 +1,81 @@
+import socket
+import struct
+import time
+
+
+DEFAULT_READY_TIMEOUT = 10.0
+POLL_INTERVAL = 0.05
+
+
+class TunnelNotReadyError(TimeoutError):
+    pass
+
+
+def read_server_greeting(host: str, port: int, timeout: float) -> str:
+    """
+    Open a TCP connection and read the MySQL initial handshake packet.
+
+    No credentials are sent. Through an SSH forward, the local port accepts
+    as soon as the forwarder binds, but the greeting only arrives once the
+    remote channel to mysqld is actually open, so this is the readiness signal.
+
+    Returns:
+        str: Server version from the greeting (e.g. '8.0.36').
+    """
+    with socket.create_connection((host, port), timeout=timeout) as sock:
+        sock.settimeout(timeout)
+        header = _recv_exact(sock, 4)
+        length = struct.unpack("<I", header[:3] + b"\x00")[0]
+        payload = _recv_exact(sock, length)
+
+    if payload[:1] == b"\xff":
+        code = struct.unpack("<H", payload[1:3])[0]
+        raise ConnectionError(f"MySQL 서버가 연결을 거부했습니다 ({code}): {payload[3:].decode('utf-8', 'replace')}")
+    if payload[:1] != b"\x0a":
+        raise ConnectionError(f"MySQL 핸드셰이크가 아닙니다 (protocol={payload[:1]!r})")
+    return payload[1:payload.index(b"\x00", 1)].decode("ascii", "replace")
+
+
+def wait_until_ready(host: str, port: int, timeout: float = DEFAULT_READY_TIMEOUT, interval: float = POLL_INTERVAL) -> dict:
+    """
+    Poll host:port until it accepts and a MySQL greeting is read, or the deadline passes.
+
+    Returns:
+        dict: {'elapsed_s', 'attempts', 'server_version'}.
+
+    Raises:
+        TunnelNotReadyError: Not ready within `timeout` seconds (last error attached).
+    """
+    started = time.perf_counter()
+    deadline = started + timeout
+    attempts = 0
+    last_error = None
+
+    while True:
+        attempts += 1
+        remaining = deadline - time.perf_counter()
+        try:
+            version = read_server_greeting(host, port, timeout=max(0.1, min(remaining, 2.0)))
+            return {
+                'elapsed_s': time.perf_counter() - started,
+                'attempts': attempts,
+                'server_version': version,
+            }
+        except (OSError, ConnectionError) as e:
+            last_error = e
+
+        if time.perf_counter() + interval >= deadline:
+            raise TunnelNotReadyError(
+                f"{host}:{port} 가 {timeout:.1f}초 안에 준비되지 않았습니다 ({attempts}회 시도): {last_error}"
+            )
+        time.sleep(interval)
+
+
+def _recv_exact(sock, size: int) -> bytes:
+    buf = b""
+    while len(buf) < size:
+        part = sock.recv(size - len(buf))
+        if not part:
+            raise ConnectionError("핸드셰이크 수신 중 연결이 닫혔습니다.")
+        buf += part
+    return buf
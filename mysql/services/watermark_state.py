@@ -0,0 +1,97 @@
+import json
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+
+
+STATE_FILENAME = ".mysql2pkl_state.json"
+
+
+def default_state_path(output_dir: str) -> str:
+    return os.path.join(output_dir, STATE_FILENAME)
+
+
+def load_table_state(state_path: str, db_name: str, table_name: str) -> Optional[dict]:
+    """
+    Return the stored incremental-export state for a table, or None.
+    The returned dict has keys 'column', 'value' (decoded), 'last_seq',
+    'seen' ({row hash: count} of the last overlap window) and 'since'
+    (decoded start of the next re-read window, or None for the default).
+    """
+    entry = _read_state(state_path).get(db_name, {}).get(table_name)
+    if not entry:
+        return None
+    seen = {}
+    for item in entry.get('seen', []):
+        # [hash, count] pairs; older state files stored a plain hash per row
+        row_hash, count = (item[0], item[1]) if isinstance(item, list) else (item, 1)
+        seen[int(row_hash)] = seen.get(int(row_hash), 0) + int(count)
+    return {
+        'column': entry['column'],
+        'value': _decode_value(entry['value']),
+        'last_seq': int(entry.get('last_seq', 0)),
+        'seen': seen,
+        'since': _decode_value(entry['since']) if entry.get('since') else None,
+    }
+
+
+def save_table_state(state_path: str, db_name: str, table_name: str, column: str, value, last_seq: int,
+                     seen: Optional[dict] = None, since=None) -> None:
+    """Persist the last exported watermark (and overlap-window row hash counts) for a table (atomic replace)."""
+    state = _read_state(state_path)
+    state.setdefault(db_name, {})[table_name] = {
+        'column': column,
+        'value': _encode_value(value),
+        'last_seq': int(last_seq),
+        'seen': [[int(h), int(n)] for h, n in (seen or {}).items()],
+        'since': _encode_value(since) if since is not None else None,
+        'updated_at': datetime.now().isoformat(timespec='seconds'),
+    }
+    tmp_path = state_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, state_path)
+
+
+def _read_state(state_path: str) -> dict:
+    if not state_path or not os.path.isfile(state_path):
+        return {}
+    with open(state_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _encode_value(value) -> dict:
+    if hasattr(value, 'to_pydatetime'):
+        value = value.to_pydatetime()
+    elif hasattr(value, 'item'):
+        value = value.item()
+
+    if isinstance(value, bool):
+        return {'type': 'int', 'value': int(value)}
+    if isinstance(value, int):
+        return {'type': 'int', 'value': value}
+    if isinstance(value, float):
+        return {'type': 'float', 'value': value}
+    if isinstance(value, Decimal):
+        return {'type': 'decimal', 'value': str(value)}
+    if isinstance(value, datetime):
+        return {'type': 'datetime', 'value': value.isoformat()}
+    if isinstance(value, date):
+        return {'type': 'date', 'value': value.isoformat()}
+    return {'type': 'str', 'value': str(value)}
+
+
+def _decode_value(encoded: dict):
+    kind, raw = encoded['type'], encoded['value']
+    if kind == 'int':
+        return int(raw)
+    if kind == 'float':
+        return float(raw)
+    if kind == 'decimal':
+        return Decimal(raw)
+    if kind == 'datetime':
+        return datetime.fromisoformat(raw)
+    if kind == 'date':
+        return date.fromisoformat(raw)
+    return raw
@@ -0,0 +1,113 @@
+from sqlalchemy import inspect, text
+
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def load_dataframe_in_chunks(
+    df,
+    table_name,
+    engine,
+    if_exists,
+    method,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    start_offset=0,
+    on_table_ready=None,
+    on_chunk_committed=None,
+    log=print,
+    retry=None,
+    dtype=None,
+    stored_rows=None,
+):
+    """
+    Write a DataFrame with pandas.to_sql, one transaction per chunk.
+
+    The first chunk written in this call uses `if_exists` (so 'replace'
+    creates the table); the rest append. `on_table_ready()` runs once after
+    the first commit (e.g. collation ALTER) and `on_chunk_committed(offset)`
+    after every commit with the number of rows now stored, which callers use
+    as a checkpoint to resume from `start_offset` later. `dtype` is passed
+    to to_sql for column types of a newly created table. With a
+    TransferRetry, a chunk that fails on a dropped connection is rolled back
+    and re-sent after reconnecting. Plain INSERTs (method None/'multi') are
+    not idempotent: if the connection drops while committing, the row count
+    is checked before re-sending so a chunk that did land is not duplicated
+    (a count that matches neither outcome, e.g. another session writing to
+    the table, stops the load instead of guessing).
+    A first chunk in 'replace' mode is simply re-run, since it recreates the
+    table anyway. Custom methods (INSERT IGNORE) are re-sent as they are.
+    Callers that load one table over several calls pass `stored_rows` (rows
+    already in the table) so the baseline COUNT(*) runs only once.
+
+    Returns:
+        int: Number of rows written in this call.
+    """
+    total = len(df)
+    chunk_size = max(1, int(chunk_size or DEFAULT_CHUNK_SIZE))
+
+    if start_offset >= total:
+        if total == 0 and start_offset == 0:
+            # Keep previous behaviour for empty frames: the table is still created/replaced
+            with engine.begin() as conn:
+                df.to_sql(name=table_name, con=conn, index=False, if_exists=if_exists, method=method, dtype=dtype)
+            if on_table_ready:
+                on_table_ready()
+        return 0
+
+    # Rows expected in the table before the current chunk (only tracked for non-idempotent retries)
+    verify = retry is not None and method in (None, "multi")
+    if stored_rows is not None:
+        stored = stored_rows
+    else:
+        stored = _count_rows(engine, table_name) if verify and if_exists != "replace" else 0
+
+    written = 0
+    first = True
+    for offset in range(start_offset, total, chunk_size):
+        chunk = df.iloc[offset:offset + chunk_size]
+        mode = if_exists if first else "append"
+        attempt = {'committing': False}
+
+        def _write_chunk(chunk=chunk, mode=mode, attempt=attempt, offset=offset):
+            if attempt['committing'] and mode != "replace":
+                current = _count_rows(engine, table_name)
+                if current == stored + len(chunk):
+                    log(f"  ♻️ 커밋 확인: {table_name} @ {offset:,} 청크는 이미 저장되어 재전송하지 않습니다.")
+                    return
+                if current != stored:
+                    raise ValueError(
+                        f"커밋 여부를 확인할 수 없습니다: '{table_name}' 행 수 {current:,} "
+                        f"(예상 {stored:,} 또는 {stored + len(chunk):,}). 다른 세션의 쓰기가 있었는지 확인하세요."
+                    )
+            attempt['committing'] = False
+            with engine.begin() as conn:
+                chunk.to_sql(name=table_name, con=conn, index=False, if_exists=mode, method=method, dtype=dtype)
+                # Leaving the block commits; a failure from here on is ambiguous
+                attempt['committing'] = True
+
+        if retry:
+            retry.run(_write_chunk, engine=engine, label=f"{table_name} @ {offset:,}")
+        else:
+            _write_chunk()
+        if first and on_table_ready:
+            on_table_ready()
+        first = False
+
+        stored = len(chunk) if mode == "replace" else stored + len(chunk)
+        written += len(chunk)
+        committed = offset + len(chunk)
+        if on_chunk_committed:
+            on_chunk_committed(committed)
+        if total > chunk_size:
+            log(f"    · {committed:,}/{total:,} rows ({committed * 100 // total}%)")
+
+    return written
+
+
+def _count_rows(engine, table_name):
+    """Row count of the target table (0 if it does not exist yet)."""
+    with engine.connect() as conn:
+        if not inspect(conn).has_table(table_name):
+            return 0
+        safe_table = table_name.replace("`", "``")
+        return conn.execute(text(f"SELECT COUNT(*) FROM `{safe_table}`")).scalar()
@@ -0,0 +1,254 @@
+import queue
+import re
+import threading
+import time
+from sqlalchemy import inspect, text
+from mysql.tomysql.chunked_loader import DEFAULT_CHUNK_SIZE
+
+DEFAULT_QUEUE_CHUNKS = 4
+
+# Secondary index lines of SHOW CREATE TABLE ("  KEY `ix` (...)", "  UNIQUE KEY ...")
+_SECONDARY_KEY = re.compile(r"^\s+(?:UNIQUE |FULLTEXT |SPATIAL )?KEY `")
+_DONE = object()
+
+
+def copy_tables(source_engine, target_engine, tables=None, if_exists="replace", chunk_size=DEFAULT_CHUNK_SIZE,
+                queue_chunks=DEFAULT_QUEUE_CHUNKS, logger=None):
+    """
+    Copies MySQL tables from one connection to another without an intermediate file.
+
+    For every table a reader thread streams rows from the source through a
+    server-side cursor into a bounded queue of `queue_chunks` chunks while
+    the calling thread bulk-inserts them into the target, so reading and
+    writing overlap and the copy takes about as long as the slower side.
+    The table is created from SHOW CREATE TABLE; its secondary indexes are
+    added after the rows are loaded.
+
+    Args:
+        source_engine: SQLAlchemy engine to read from.
+        target_engine: SQLAlchemy engine to write to.
+        tables (list, optional): Tables to copy. None or empty copies every base table.
+        if_exists (str): 'replace' to recreate the target table, 'append' to add rows
+            (INSERT IGNORE into an existing table).
+        chunk_size (int): Rows per fetched/committed chunk.
+        queue_chunks (int): Chunks the reader may run ahead of the writer.
+        logger (callable, optional): Logging function. Defaults to print.
+
+    Returns:
+        list: (table, rows, read_s, write_s, elapsed_s) per copied table.
+    """
+    log = logger or print
+    try:
+        if _same_database(source_engine, target_engine):
+            raise ValueError("원본과 대상이 같은 데이터베이스입니다. (Replace 시 원본 테이블이 삭제됨)")
+        if not tables:
+            with source_engine.connect() as conn:
+                tables = [row[0] for row in conn.execute(text("SHOW FULL TABLES WHERE Table_type = 'BASE TABLE'"))]
+        if not tables:
+            log("⚠️ [mysql2mysql] 복사할 테이블이 없습니다.")
+            return []
+        log(f"▶ [mysql2mysql] {len(tables)}개 테이블 복사 시작 ({if_exists} 모드)")
+
+        started = time.perf_counter()
+        target_tables = set(inspect(target_engine).get_table_names())
+        results = []
+        for table in tables:
+            results.append(_copy_table(
+                source_engine, target_engine, table, if_exists, table in target_tables, chunk_size, queue_chunks, log,
+            ))
+
+        elapsed = time.perf_counter() - started
+        read_s = sum(r[2] for r in results)
+        write_s = sum(r[3] for r in results)
+        log(
+            f"🎉 [mysql2mysql] {len(results)}개 테이블, {sum(r[1] for r in results):,} rows 복사 완료: "
+            f"{elapsed:.1f}s (읽기 {read_s:.1f}s / 쓰기 {write_s:.1f}s, 순차 실행 시 약 {read_s + write_s:.1f}s)"
+        )
+        return results
+
+    except Exception as e:
+        log(f"❌ [mysql2mysql] 오류 발생: {e}")
+        raise e
+
+
+def split_secondary_indexes(create_sql):
+    """
+    Split SHOW CREATE TABLE output into (create_sql_without_secondary_indexes, [index_definitions]).
+
+    Tables with foreign keys are returned unchanged: MySQL needs the
+    referencing index while the constraint exists.
+    """
+    lines = create_sql.split("\n")
+    close = max((i for i, line in enumerate(lines) if line.startswith(")")), default=None)
+    if close is None or "FOREIGN KEY" in create_sql:
+        return create_sql, []
+    body = lines[1:close]
+    if not all(line.startswith("  ") for line in body):
+        return create_sql, []  # unexpected layout (multi-line definition): keep as-is
+
+    kept, deferred = [], []
+    for line in body:
+        (deferred if _SECONDARY_KEY.match(line) else kept).append(line.rstrip().rstrip(","))
+    if not deferred or not kept:
+        return create_sql, []
+    return "\n".join([lines[0], ",\n".join(kept)] + lines[close:]), [d.strip() for d in deferred]
+
+
+def _copy_table(source_engine, target_engine, table, if_exists, table_existed, chunk_size, queue_chunks, log):
+    started = time.perf_counter()
+    safe_table = table.replace("`", "``")
+    columns = _insertable_columns(source_engine, table)
+    if not columns:
+        raise ValueError(f"원본 테이블 '{table}'을(를) 찾을 수 없습니다.")
+    log(f"\n▶ [mysql2mysql] 테이블 '{table}' 복사 중... ({len(columns)} columns)")
+
+    column_list = ", ".join(f"`{c.replace('`', '``')}`" for c in columns)
+    select_sql = f"SELECT {column_list} FROM `{safe_table}`"
+    deferred = []
+    with target_engine.connect() as target:
+        # Foreign keys may reference tables that are copied later (or not at all)
+        target.exec_driver_sql("SET SESSION foreign_key_checks = 0")
+        try:
+            if if_exists == "replace" or not table_existed:
+                with source_engine.connect() as source:
+                    create_sql = source.exec_driver_sql(f"SHOW CREATE TABLE `{safe_table}`").fetchone()[1]
+                create_sql, deferred = split_secondary_indexes(create_sql)
+                target.exec_driver_sql(f"DROP TABLE IF EXISTS `{safe_table}`")
+                target.exec_driver_sql(create_sql)
+                target.commit()
+                log(f"  🗑️ 대상 테이블 재생성 (SHOW CREATE TABLE, 보조 인덱스 {len(deferred)}개는 적재 후 생성)")
+                insert_verb = "INSERT"
+            else:
+                log(f"  ✅ 기존 테이블 '{table}'에 데이터 추가 (중복 키 Skip)")
+                insert_verb = "INSERT IGNORE"
+
+            # pymysql uses the 'format' paramstyle: literal % in identifiers must be doubled
+            insert_sql = (
+                f"{insert_verb} INTO `{safe_table}` ({column_list.replace('%', '%%')}) "
+                f"VALUES ({', '.join(['%s'] * len(columns))})"
+            )
+
+            def _write(rows):
+                target.exec_driver_sql(insert_sql, [tuple(row) for row in rows])
+                target.commit()
+
+            rows, read_s, write_s = _pipe_rows(source_engine, select_sql, _write, chunk_size, queue_chunks, log)
+
+            if deferred:
+                index_started = time.perf_counter()
+                for definitions in _alter_batches(deferred):
+                    target.exec_driver_sql(
+                        f"ALTER TABLE `{safe_table}` " + ", ".join(f"ADD {d}" for d in definitions)
+                    )
+                log(f"  🔎 보조 인덱스 {len(deferred)}개 생성 ({time.perf_counter() - index_started:.1f}s)")
+        finally:
+            _restore_foreign_key_checks(target)
+
+    elapsed = time.perf_counter() - started
+    log(f"  ✅ '{table}': {rows:,} rows ({elapsed:.1f}s, 읽기 {read_s:.1f}s / 쓰기 {write_s:.1f}s)")
+    return table, rows, read_s, write_s, elapsed
+
+
+def _pipe_rows(source_engine, select_sql, write, chunk_size, queue_chunks, log):
+    """
+    Run a streaming reader thread and feed its chunks to `write` in the calling thread.
+
+    Returns:
+        tuple: (rows, read_s, write_s) — read_s excludes time the reader spent waiting on a full queue.
+    """
+    chunk_size = max(1, int(chunk_size or DEFAULT_CHUNK_SIZE))
+    buffer = queue.Queue(maxsize=max(1, int(queue_chunks)))
+    stop = threading.Event()
+    timing = {"read_s": 0.0}
+
+    def _put(item):
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _read():
+        try:
+            with source_engine.connect().execution_options(stream_results=True, max_row_buffer=chunk_size) as conn:
+                fetch_started = time.perf_counter()
+                partitions = conn.exec_driver_sql(select_sql).partitions(chunk_size)
+                while True:
+                    rows = next(partitions, None)
+                    timing["read_s"] += time.perf_counter() - fetch_started
+                    if rows is None:
+                        break
+                    if not _put(rows):
+                        conn.invalidate()  # writer failed: drop the stream instead of draining it
+                        break
+                    fetch_started = time.perf_counter()
+            _put(_DONE)
+        except Exception as e:
+            _put(e)
+
+    reader = threading.Thread(target=_read, daemon=True)
+    reader.start()
+    written = 0
+    write_s = 0.0
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                break
+            if isinstance(item, Exception):
+                raise item
+            write_started = time.perf_counter()
+            write(item)
+            write_s += time.perf_counter() - write_started
+            written += len(item)
+            log(f"    · {written:,} rows (대기 중인 청크 {buffer.qsize()}개)")
+    finally:
+        stop.set()
+        reader.join()
+    return written, timing["read_s"], write_s
+
+
+def _restore_foreign_key_checks(conn):
+    """
+    Turn FK checks back on before the connection returns to the pool.
+
+    In the pull direction the target is the shared engine, which the cleaner
+    reuses for deletes; if the reset fails the connection is discarded.
+    """
+    try:
+        if conn.in_transaction():
+            conn.rollback()
+        conn.exec_driver_sql("SET SESSION foreign_key_checks = 1")
+    except Exception:
+        conn.invalidate()
+
+
+def _insertable_columns(engine, table_name):
+    """Column names in table order, without generated columns (which cannot be inserted)."""
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(
+                """
+                SELECT COLUMN_NAME, EXTRA
+                FROM information_schema.columns
+                WHERE table_schema = DATABASE() AND table_name = :tbl
+                ORDER BY ORDINAL_POSITION
+                """
+            ),
+            {"tbl": table_name},
+        ).fetchall()
+    return [r[0] for r in rows if "GENERATED" not in (r[1] or "").upper()]
+
+
+def _same_database(a, b):
+    return (a.url.host, a.url.port or 3306, a.url.database) == (b.url.host, b.url.port or 3306, b.url.database)
+
+
+def _alter_batches(definitions):
+    """One ALTER for regular indexes; InnoDB builds FULLTEXT indexes one per statement."""
+    regular = [d for d in definitions if not d.startswith("FULLTEXT ")]
+    batches = [regular] if regular else []
+    batches.extend([d] for d in definitions if d.startswith("FULLTEXT "))
+    return batches
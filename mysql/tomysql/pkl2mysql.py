@@ -2,8 +2,12 @@ import pandas as pd
 from sqlalchemy import inspect, text, event
 import os
 from mysql.services.engine_factory import create_mysql_engine, dispose_mysql_engine
+from mysql.services.resilience import TransferRetry
+from mysql.services.import_journal import ImportJournal, file_fingerprint, make_job_key
+from mysql.tomysql.chunked_loader import DEFAULT_CHUNK_SIZE, load_dataframe_in_chunks
+from storage.pickle_codec import read_pickle
 
-def import_from_pkl(db_config, file_path, import_scope="all", source_name=None, target_table=None, if_exists="replace", collation="server_default", stop_on_mismatch=True, excluded_columns=None, logger=None):
+def import_from_pkl(db_config, file_path, import_scope="all", source_name=None, target_table=None, if_exists="replace", collation="server_default", stop_on_mismatch=True, excluded_columns=None, logger=None, chunk_size=DEFAULT_CHUNK_SIZE, resume=False, journal_path=None, recover=None):
     """
     Imports a Pickle file to MySQL. Supports both single table and full import.
 
@@ -18,9 +22,17 @@ def import_from_pkl(db_config, file_path, import_scope="all", source_name=None,
         stop_on_mismatch (bool): Stop import when collation mismatch is detected.
         excluded_columns (dict, optional): {table_name: [col_names_to_exclude]}.
         logger (callable, optional): Logging function. Defaults to print.
+        chunk_size (int): Rows per committed chunk (each chunk is checkpointed).
+        resume (bool): Continue from the checkpoint journal of the same file (verified by size,
+            mtime and a sampled SHA-256).
+        journal_path (str, optional): Checkpoint journal path. Defaults to ~/.sqlhandler/import_journal.json.
+        recover (callable, optional): Called before retrying a chunk after a connection drop
+            (e.g. ConnectionManager.recover to restart the SSH tunnel).
     """
     log = logger or print
     engine = None
+    journal = None
+    retry = TransferRetry(recover=recover, log=log)
     try:
         db_url = (
             f"mysql+pymysql://{db_config['user']}:{db_config['password']}"
@@ -37,8 +49,29 @@ def import_from_pkl(db_config, file_path, import_scope="all", source_name=None,
             log(f"ℹ️ [pkl2mysql] 선택 콜레이션: {selected_text}")
         log(f"✅ [pkl2mysql] 데이터베이스 연결 성공!")
 
-        # Load pickle file
-        data = pd.read_pickle(file_path)
+        # Checkpoint journal (verified against the file's size/mtime/sampled hash on resume)
+        fingerprint = file_fingerprint(file_path)
+        journal = ImportJournal(make_job_key(db_config, file_path), journal_path)
+        if resume:
+            if not journal.exists():
+                raise ValueError("이어서 진행할 체크포인트가 없습니다.")
+            if not journal.matches(fingerprint):
+                raise ValueError("체크포인트 이후 파일이 변경되어 이어서 진행할 수 없습니다. (크기/수정 시각/해시 불일치)")
+            log(f"♻️ [pkl2mysql] 체크포인트에서 이어서 진행합니다. (시작: {journal.get_entry()['started_at']})")
+        else:
+            journal.begin(fingerprint, {
+                'import_scope': import_scope,
+                'source_name': source_name,
+                'target_table': target_table,
+                'if_exists': if_exists,
+                'collation': collation,
+                'stop_on_mismatch': stop_on_mismatch,
+                'excluded_columns': excluded_columns,
+                'chunk_size': chunk_size,
+            })
+
+        # Load pickle file (codec auto-detected)
+        data = read_pickle(file_path)
 
         # Determine tables to import based on scope
         if import_scope == "single":
@@ -84,6 +117,12 @@ def import_from_pkl(db_config, file_path, import_scope="all", source_name=None,
         for tbl_name, df in tables_to_import.items():
             log(f"\n▶ [pkl2mysql] 테이블 '{tbl_name}' 처리 중... ({df.shape[0]} rows, {df.shape[1]} columns)")
 
+            if resume and journal.is_table_done(tbl_name):
+                log(f"  ⏭️ 체크포인트: 이미 완료된 테이블")
+                imported_count += 1
+                continue
+            resume_offset = journal.get_offset(tbl_name) if resume else 0
+
             # Clean column names
             df.columns = [col.strip().replace(" ", "_").lower() for col in df.columns]
 
@@ -111,6 +150,11 @@ def import_from_pkl(db_config, file_path, import_scope="all", source_name=None,
             if preserve_existing_schema:
                 effective_if_exists = "append"
 
+            # Resumed table: already created by the interrupted run → append remaining chunks
+            if resume_offset > 0 and not preserve_existing_schema:
+                effective_if_exists = "append"
+                log(f"  ♻️ 체크포인트: {resume_offset:,}/{len(df):,} rows 이후부터 재개")
+
             # Import based on if_exists mode using pandas.to_sql
             _import_single_table(
                 df,
@@ -121,16 +165,24 @@ def import_from_pkl(db_config, file_path, import_scope="all", source_name=None,
                 table_existed,
                 log,
                 preserve_existing_schema=preserve_existing_schema,
+                chunk_size=chunk_size,
+                start_offset=resume_offset,
+                on_chunk_committed=lambda n, t=tbl_name, total=len(df): journal.record_chunk(t, n, total),
+                retry=retry,
             )
+            journal.mark_table_done(tbl_name, len(df))
 
             imported_count += 1
 
+        journal.finish()
         scope_text = f"'{target_table}'" if import_scope == "single" else f"{imported_count}개 테이블"
         log(f"\n🎉 [pkl2mysql] {scope_text} Import 완료!")
         return True
 
     except Exception as e:
         log(f"❌ [pkl2mysql] 오류 발생: {e}")
+        if journal and journal.exists():
+            log("💾 [pkl2mysql] 체크포인트가 저장되었습니다. 'Resume' 버튼으로 이어서 진행할 수 있습니다.")
         raise e
     finally:
         dispose_mysql_engine(engine, logger=log, label="pkl2mysql")
@@ -153,8 +205,12 @@ def _import_single_table(
     table_existed,
     log=print,
     preserve_existing_schema=False,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    start_offset=0,
+    on_chunk_committed=None,
+    retry=None,
 ):
-    """Import a single DataFrame to MySQL table using pandas.to_sql."""
+    """Import a single DataFrame to MySQL table using pandas.to_sql, one transaction per chunk."""
     # Clean column names
     df.columns = [col.strip().replace(" ", "_").lower() for col in df.columns]
 
@@ -180,12 +236,29 @@ def _import_single_table(
     log(f"  ▶ Import 중 ({requested_mode_text} 모드)...")
 
     if preserve_existing_schema:
-        _replace_existing_rows_in_transaction(df, table_name, engine, desired_collation, log)
+        if retry:
+            retry.run(
+                lambda: _replace_existing_rows_in_transaction(df, table_name, engine, desired_collation, log),
+                engine=engine, label=table_name,
+            )
+        else:
+            _replace_existing_rows_in_transaction(df, table_name, engine, desired_collation, log)
         return
 
     method = _insert_ignore if (if_exists == "append" and table_existed) else "multi"
-    df.to_sql(name=table_name, con=engine, index=False, if_exists=if_exists, method=method)
-    _apply_table_collation(engine, table_name, desired_collation, table_existed, if_exists, log)
+    load_dataframe_in_chunks(
+        df,
+        table_name,
+        engine,
+        if_exists,
+        method,
+        chunk_size=chunk_size,
+        start_offset=start_offset,
+        on_table_ready=lambda: _apply_table_collation(engine, table_name, desired_collation, table_existed, if_exists, log),
+        on_chunk_committed=on_chunk_committed,
+        log=log,
+        retry=retry,
+    )
     log(f"  ✅ {len(df)} rows Import 완료")
 
 
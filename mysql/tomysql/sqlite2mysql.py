@@ -0,0 +1,235 @@
+import sqlite3
+import pandas as pd
+from sqlalchemy import inspect, types
+from mysql.services.engine_factory import create_mysql_engine, dispose_mysql_engine
+from mysql.services.resilience import TransferRetry
+from mysql.tomysql.chunked_loader import DEFAULT_CHUNK_SIZE, load_dataframe_in_chunks
+from mysql.tomysql.pkl2mysql import (
+    _apply_table_collation,
+    _configure_engine_collation,
+    _delete_all_rows,
+    _get_schema_collation,
+    _insert_ignore,
+    _normalize_collation,
+    _report_collation_mismatch,
+    _report_existing_table_collation,
+)
+
+
+def import_from_sqlite(db_config, file_path, import_scope="all", source_name=None, target_table=None, if_exists="replace", collation="server_default", stop_on_mismatch=True, excluded_columns=None, logger=None, chunk_size=DEFAULT_CHUNK_SIZE, recover=None):
+    """
+    Imports SQLite table(s) to MySQL without an intermediate Pickle file.
+
+    Each table is read with a chunked cursor (`chunk_size` rows at a time)
+    and every chunk goes straight to the chunked MySQL loader, so only one
+    chunk is in memory. Excluded columns are left out of the SELECT itself.
+
+    Args:
+        db_config (dict): Dictionary with keys 'host', 'port', 'user', 'password', 'database'.
+        file_path (str): Path to the SQLite database file.
+        import_scope (str): 'single' for specific table, 'all' for every table.
+        source_name (str, optional): SQLite table to import (for single mode).
+        target_table (str, optional): Target table name (for single mode, defaults to source_name).
+        if_exists (str): 'replace' to drop existing table, 'append' to add to existing table.
+        collation (str): Target collation, or 'server_default'.
+        stop_on_mismatch (bool): Stop import when collation mismatch is detected.
+        excluded_columns (dict, optional): {table_name: [col_names_to_exclude]}.
+        logger (callable, optional): Logging function. Defaults to print.
+        chunk_size (int): Rows read from SQLite and committed to MySQL per chunk.
+        recover (callable, optional): Called before retrying a chunk after a connection drop.
+    """
+    log = logger or print
+    engine = None
+    source = None
+    retry = TransferRetry(recover=recover, log=log)
+    try:
+        source = sqlite3.connect(f"file:{file_path}?mode=ro", uri=True)
+        source_tables = _list_tables(source)
+
+        if import_scope == "single":
+            if not source_name:
+                raise ValueError("특정 테이블 Import 모드에서는 소스 테이블 지정이 필요합니다.")
+            if source_name not in source_tables:
+                raise ValueError(f"테이블 '{source_name}'을 찾을 수 없습니다. 사용 가능한 테이블: {', '.join(source_tables)}")
+            tables_to_import = {target_table or source_name: source_name}
+        else:
+            if not source_tables:
+                raise ValueError("SQLite 파일에 테이블이 없습니다.")
+            tables_to_import = {name: name for name in source_tables}
+        log(f"✅ [sqlite2mysql] SQLite 파일 열기 완료: {len(tables_to_import)}개 테이블")
+
+        db_url = (
+            f"mysql+pymysql://{db_config['user']}:{db_config['password']}"
+            f"@{db_config['host']}:{int(db_config['port'])}/{db_config['database']}?charset=utf8mb4"
+        )
+        engine = create_mysql_engine(db_url)
+        desired_collation = _normalize_collation(collation)
+        _configure_engine_collation(engine, desired_collation)
+        schema_collation = _get_schema_collation(engine, db_config['database'])
+        selected_text = desired_collation or "server_default"
+        if schema_collation:
+            log(f"ℹ️ [sqlite2mysql] 선택 콜레이션: {selected_text} (DB 기본: {schema_collation})")
+        else:
+            log(f"ℹ️ [sqlite2mysql] 선택 콜레이션: {selected_text}")
+        log(f"✅ [sqlite2mysql] 데이터베이스 연결 성공!")
+
+        existing_tables = set(inspect(engine).get_table_names())
+        for tbl_name, src_table in tables_to_import.items():
+            total = source.execute(f"SELECT COUNT(*) FROM {_quote(src_table)}").fetchone()[0]
+            log(f"\n▶ [sqlite2mysql] 테이블 '{src_table}' -> '{tbl_name}' 처리 중... ({total:,} rows)")
+
+            columns = _source_columns(source, src_table)
+            excluded = set()
+            if excluded_columns:
+                excluded = set(excluded_columns.get(tbl_name) or excluded_columns.get(_clean_name(tbl_name)) or [])
+            cols_to_drop = [c["clean"] for c in columns if c["clean"] in excluded]
+            columns = [c for c in columns if c["clean"] not in excluded]
+            if cols_to_drop:
+                log(f"  ⏭️ 제외된 컬럼: {', '.join(cols_to_drop)}")
+            if not columns:
+                raise ValueError(f"테이블 '{src_table}'에 Import할 컬럼이 없습니다.")
+
+            table_existed = tbl_name in existing_tables
+            if table_existed:
+                _report_existing_table_collation(engine, db_config['database'], tbl_name, log)
+                if desired_collation:
+                    mismatch = _report_collation_mismatch(engine, db_config['database'], tbl_name, desired_collation, schema_collation, log)
+                    if mismatch and stop_on_mismatch:
+                        raise ValueError(f"콜레이션 불일치로 중단: 테이블 '{tbl_name}'")
+            elif import_scope == "single":
+                log(f"  ℹ️ 대상 테이블 '{tbl_name}' 미존재: 신규 생성 예정")
+
+            chunks = _read_chunks(source, src_table, columns, chunk_size)
+            # Replace + existing table + excluded columns → transactional delete + append
+            if if_exists == "replace" and table_existed and cols_to_drop:
+                log(f"  ♻️ 기존 테이블 '{tbl_name}' 구조를 유지한 채 데이터를 교체")
+                written = _replace_existing_rows_streaming(chunks, tbl_name, engine, desired_collation, total, log)
+            else:
+                written = _stream_into_table(
+                    chunks, tbl_name, engine, if_exists, desired_collation, table_existed,
+                    _column_dtypes(columns), total, log, retry,
+                )
+            log(f"  ✅ {written:,} rows Import 완료")
+
+        scope_text = f"'{next(iter(tables_to_import))}'" if import_scope == "single" else f"{len(tables_to_import)}개 테이블"
+        log(f"\n🎉 [sqlite2mysql] {scope_text} Import 완료!")
+        return True
+
+    except Exception as e:
+        log(f"❌ [sqlite2mysql] 오류 발생: {e}")
+        raise e
+    finally:
+        if source:
+            source.close()
+        dispose_mysql_engine(engine, logger=log, label="sqlite2mysql")
+
+
+def list_sqlite_tables(file_path):
+    """User tables of a SQLite file with their cleaned column names: {table: [col, ...]}."""
+    conn = sqlite3.connect(f"file:{file_path}?mode=ro", uri=True)
+    try:
+        return {table: [c["clean"] for c in _source_columns(conn, table)] for table in _list_tables(conn)}
+    finally:
+        conn.close()
+
+
+def _stream_into_table(chunks, table_name, engine, if_exists, desired_collation, table_existed, dtype, total, log, retry):
+    """Feed SQLite chunks to the chunked loader; the first chunk creates/replaces the table."""
+    method = _insert_ignore if (if_exists == "append" and table_existed) else "multi"
+    written = 0
+    for index, chunk in enumerate(chunks):
+        first = index == 0
+        load_dataframe_in_chunks(
+            chunk,
+            table_name,
+            engine,
+            if_exists if first else "append",
+            method,
+            chunk_size=max(1, len(chunk)),
+            on_table_ready=(
+                lambda: _apply_table_collation(engine, table_name, desired_collation, table_existed, if_exists, log)
+            ) if first else None,
+            log=log,
+            retry=retry,
+            dtype=dtype,
+            # Plain INSERT only targets a new or replaced table, so it holds exactly what this run wrote
+            stored_rows=written,
+        )
+        written += len(chunk)
+        if total > len(chunk):
+            log(f"    · {written:,}/{total:,} rows ({written * 100 // total}%)")
+    return written
+
+
+def _replace_existing_rows_streaming(chunks, table_name, engine, desired_collation, total, log):
+    """Replace table data chunk by chunk inside one transaction, keeping the existing schema."""
+    written = 0
+    with engine.begin() as conn:
+        _delete_all_rows(conn, table_name)
+        log(f"  🗑️ 기존 테이블 '{table_name}' 데이터 삭제 (트랜잭션 적용)")
+        for chunk in chunks:
+            chunk.to_sql(name=table_name, con=conn, index=False, if_exists="append", method=_insert_ignore)
+            written += len(chunk)
+            if total > len(chunk):
+                log(f"    · {written:,}/{total:,} rows ({written * 100 // total}%)")
+        _apply_table_collation(conn, table_name, desired_collation, True, "append", log)
+    return written
+
+
+def _read_chunks(source, table_name, columns, chunk_size):
+    """Yield DataFrames of at most `chunk_size` rows with cleaned column names."""
+    select_list = ", ".join(_quote(c["name"]) for c in columns)
+    renames = {c["name"]: c["clean"] for c in columns}
+    for chunk in pd.read_sql_query(
+        f"SELECT {select_list} FROM {_quote(table_name)}", source,
+        chunksize=max(1, int(chunk_size or DEFAULT_CHUNK_SIZE)),
+    ):
+        chunk = chunk.rename(columns=renames)
+        # _x000D_ 처리 (pkl2mysql과 동일하게 정리)
+        # SQLite columns may mix str with bytes/numbers: only str values are touched
+        for col in chunk.select_dtypes(include=['object', 'string']).columns:
+            chunk[col] = chunk[col].map(_strip_x000d)
+        yield chunk
+
+
+def _strip_x000d(value):
+    return value.replace('_x000D_', '') if isinstance(value, str) else value
+
+
+def _list_tables(conn):
+    rows = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+    ).fetchall()
+    return [r[0] for r in rows]
+
+
+def _source_columns(conn, table_name):
+    return [
+        {"name": r[1], "clean": _clean_name(r[1]), "type": (r[2] or "").upper()}
+        for r in conn.execute(f"PRAGMA table_info({_quote(table_name)})").fetchall()
+    ]
+
+
+def _column_dtypes(columns):
+    """
+    MySQL types for columns whose SQLite affinity is INTEGER or REAL.
+
+    A chunk whose integer column contains NULLs arrives as float64, and a
+    column that is entirely NULL in the first chunk arrives as object;
+    declaring the type keeps the created table independent of the first chunk.
+    """
+    dtype = {}
+    for c in columns:
+        if "INT" in c["type"]:
+            dtype[c["clean"]] = types.BigInteger()
+        elif any(t in c["type"] for t in ("REAL", "FLOA", "DOUB")):
+            dtype[c["clean"]] = types.Float(precision=53)
+    return dtype
+
+
+def _clean_name(name):
+    return str(name).strip().replace(" ", "_").lower()
+
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
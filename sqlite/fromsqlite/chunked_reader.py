@@ -0,0 +1,75 @@
+"""
+chunked_reader.py
+------------------------
+SQLite Export용 읽기 유틸리티 (읽기 전용 + mmap 연결, 청크 단위 조회)
+"""
+
+import sqlite3
+
+import pandas as pd
+
+from storage.frame_concat import concat_by_column
+
+
+DEFAULT_CHUNK_SIZE = 50000
+DEFAULT_MMAP_MB = 256
+
+
+def open_readonly(db_path, mmap_mb=DEFAULT_MMAP_MB):
+    """
+    Open db_path read-only with memory-mapped I/O for faster full-table scans.
+
+    mode=ro fails instead of creating an empty file for a wrong path, and
+    query_only blocks writes from custom queries.
+    """
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    conn.execute(f"PRAGMA mmap_size={int(mmap_mb) * 1048576}")
+    conn.execute("PRAGMA query_only=ON")
+    return conn
+
+
+def list_tables(conn):
+    rows = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+    ).fetchall()
+    return [r[0] for r in rows]
+
+
+def table_query(table_name):
+    return f'SELECT * FROM "{str(table_name).replace(chr(34), chr(34) * 2)}"'
+
+
+def iter_row_chunks(conn, sql, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Execute sql and yield (columns, rows) with at most `chunk_size` rows per chunk.
+
+    A query without rows still yields one empty chunk so callers get the columns.
+    """
+    cursor = conn.execute(sql)
+    columns = [d[0] for d in cursor.description or ()]
+    chunk_size = max(1, int(chunk_size or DEFAULT_CHUNK_SIZE))
+    rows = cursor.fetchmany(chunk_size)
+    yield columns, rows
+    while len(rows) == chunk_size:
+        rows = cursor.fetchmany(chunk_size)
+        if rows:
+            yield columns, rows
+
+
+def read_frame(conn, sql, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Read a query into one DataFrame, converting `chunk_size` rows at a time.
+
+    Only one chunk exists as Python row tuples at any moment (a plain
+    read_sql_query holds every row as tuples before building the frame),
+    and chunks are merged column by column as they arrive instead of being
+    collected first. Each chunk infers its own dtypes, so a chunk whose
+    INTEGER/REAL column is all NULL comes back as object and turns the
+    concatenated column into object; those columns are re-inferred to match
+    a single full read.
+    """
+    df = concat_by_column(pd.read_sql_query(sql, conn, chunksize=max(1, int(chunk_size or DEFAULT_CHUNK_SIZE))))
+    for i, dtype in enumerate(df.dtypes):
+        if dtype == object:
+            df.isetitem(i, df.iloc[:, i].infer_objects())  # by position: query columns may repeat
+    return df
@@ -1,11 +1,21 @@
-
-import pandas as pd
-import sqlite3
 import os
+import re
+
+from storage.pickle_codec import write_pickle
+from sqlite.fromsqlite.chunked_reader import DEFAULT_CHUNK_SIZE, list_tables, open_readonly, read_frame, table_query
+
+_UNSAFE_FILENAME_CHARS = re.compile(r'[\\/:*?"<>|]')
+
 
-def export_to_pkl(db_path, export_scope, table_name=None, query=None, output_path=None):
+def export_to_pkl(db_path, export_scope, table_name=None, query=None, output_path=None, compression="none", chunk_size=DEFAULT_CHUNK_SIZE):
     """
     Exports SQLite data to a Pickle file.
+
+    The DB is opened read-only with mmap and every table is converted to a
+    DataFrame `chunk_size` rows at a time. A Pickle file is a single object,
+    so one DataFrame is still held in memory; 'database' scope therefore
+    writes one '<output>.<table>.pkl' file per table instead of a dict of
+    every table, keeping the peak at the largest table.
     
     Args:
         db_path (str): Path to SQLite DB file.
@@ -13,21 +23,23 @@ def export_to_pkl(db_path, export_scope, table_name=None, query=None, output_pat
         table_name (str): Table name (for 'table' scope).
         query (str): Custom SQL query (for 'query' scope).
         output_path (str): Output Pickle file path.
+        compression (str): 'none', 'zstd', 'lz4' or 'gzip'.
+        chunk_size (int): Rows converted per chunk.
     """
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
-        print(f"✅ SQLite 연결 성공: {db_path}")
+        conn = open_readonly(db_path)
+        print(f"✅ SQLite 연결 성공 (읽기 전용): {db_path}")
         
         if export_scope == "query":
             if not query:
                 raise ValueError("Query required for query scope")
             
             print(f"▶ 사용자 정의 쿼리 실행 중...")
-            df = pd.read_sql_query(query, conn)
+            df = read_frame(conn, query, chunk_size)
             print(f"✅ 쿼리 실행 완료: {df.shape[0]} rows")
             
-            df.to_pickle(output_path)
+            write_pickle(df, output_path, compression)
             print(f"🎉 Pickle 저장 완료: {output_path}")
             
         elif export_scope == "table":
@@ -35,17 +47,14 @@ def export_to_pkl(db_path, export_scope, table_name=None, query=None, output_pat
                 raise ValueError("Table name required for table scope")
             
             print(f"▶ 테이블 '{table_name}' 조회 중...")
-            df = pd.read_sql_query(f"SELECT * FROM {table_name}", conn)
+            df = read_frame(conn, table_query(table_name), chunk_size)
             print(f"✅ 조회 완료: {df.shape[0]} rows")
             
-            df.to_pickle(output_path)
+            write_pickle(df, output_path, compression)
             print(f"🎉 Pickle 저장 완료: {output_path}")
             
         elif export_scope == "database":
-            # Get all tables
-            cursor = conn.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = [r[0] for r in cursor.fetchall()]
+            tables = list_tables(conn)
             
             if not tables:
                 print("⚠️ 데이터베이스에 테이블이 없습니다.")
@@ -53,15 +62,15 @@ def export_to_pkl(db_path, export_scope, table_name=None, query=None, output_pat
                 
             print(f"✅ 발견된 테이블: {len(tables)}개 ({', '.join(tables)})")
             
-            all_tables = {}
             for table in tables:
                 print(f"▶ 테이블 '{table}' 추출 중...")
-                df = pd.read_sql_query(f"SELECT * FROM {table}", conn)
-                all_tables[table] = df
-                print(f"   ✓ {df.shape[0]} rows")
+                df = read_frame(conn, table_query(table), chunk_size)
+                table_path = table_output_path(output_path, table)
+                write_pickle(df, table_path, compression)
+                print(f"   ✓ {df.shape[0]} rows → {os.path.basename(table_path)}")
+                del df
             
-            pd.to_pickle(all_tables, output_path)
-            print(f"🎉 전체 DB Pickle 저장 완료: {output_path}")
+            print(f"🎉 전체 DB Pickle 저장 완료: 테이블별 {len(tables)}개 파일 ({os.path.splitext(output_path)[0]}.<테이블>.pkl)")
             
         return True
 
@@ -70,3 +79,10 @@ def export_to_pkl(db_path, export_scope, table_name=None, query=None, output_pat
         raise e
     finally:
         if conn: conn.close()
+
+
+def table_output_path(output_path, table):
+    """'<dir>/data.pkl' -> '<dir>/data.<table>.pkl' (characters invalid in file names replaced)."""
+    stem, ext = os.path.splitext(output_path)
+    safe_table = _UNSAFE_FILENAME_CHARS.sub("_", str(table))
+    return f"{stem}.{safe_table}{ext or '.pkl'}"
@@ -1,11 +1,19 @@
 
-import pandas as pd
-import sqlite3
-import os
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from sqlite.fromsqlite.chunked_reader import DEFAULT_CHUNK_SIZE, iter_row_chunks, list_tables, open_readonly, table_query
 
-def export_to_xlsx(db_path, export_scope, table_name=None, query=None, output_path=None):
+# Data rows per sheet (Excel limit 1,048,576 minus the header row)
+EXCEL_MAX_ROWS = 1048575
+
+def export_to_xlsx(db_path, export_scope, table_name=None, query=None, output_path=None, chunk_size=DEFAULT_CHUNK_SIZE):
     """
     Exports SQLite data to an Excel file.
+
+    Rows are fetched `chunk_size` at a time and appended to a write-only
+    workbook, so memory stays bounded by one chunk. A table larger than an
+    Excel sheet continues on '<sheet>_2', '<sheet>_3', ...
     
     Args:
         db_path (str): Path to SQLite DB file.
@@ -13,21 +21,23 @@ def export_to_xlsx(db_path, export_scope, table_name=None, query=None, output_pa
         table_name (str): Table name (for 'table' scope).
         query (str): Custom SQL query (for 'query' scope).
         output_path (str): Output Excel file path.
+        chunk_size (int): Rows fetched per chunk.
     """
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
-        print(f"✅ SQLite 연결 성공: {db_path}")
+        conn = open_readonly(db_path)
+        print(f"✅ SQLite 연결 성공 (읽기 전용): {db_path}")
+        workbook = Workbook(write_only=True)
         
         if export_scope == "query":
             if not query:
                 raise ValueError("Query required for query scope")
             
             print(f"▶ 사용자 정의 쿼리 실행 중...")
-            df = pd.read_sql_query(query, conn)
-            print(f"✅ 쿼리 실행 완료: {df.shape[0]} rows")
+            rows = _write_sheet(workbook, "Sheet1", conn, query, chunk_size)
+            print(f"✅ 쿼리 실행 완료: {rows} rows")
             
-            df.to_excel(output_path, index=False)
+            workbook.save(output_path)
             print(f"🎉 엑셀 저장 완료: {output_path}")
             
         elif export_scope == "table":
@@ -35,17 +45,14 @@ def export_to_xlsx(db_path, export_scope, table_name=None, query=None, output_pa
                 raise ValueError("Table name required for table scope")
             
             print(f"▶ 테이블 '{table_name}' 조회 중...")
-            df = pd.read_sql_query(f"SELECT * FROM {table_name}", conn)
-            print(f"✅ 조회 완료: {df.shape[0]} rows")
+            rows = _write_sheet(workbook, "Sheet1", conn, table_query(table_name), chunk_size)
+            print(f"✅ 조회 완료: {rows} rows")
             
-            df.to_excel(output_path, index=False)
+            workbook.save(output_path)
             print(f"🎉 엑셀 저장 완료: {output_path}")
             
         elif export_scope == "database":
-            # Get all tables
-            cursor = conn.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = [r[0] for r in cursor.fetchall()]
+            tables = list_tables(conn)
             
             if not tables:
                 print("⚠️ 데이터베이스에 테이블이 없습니다.")
@@ -53,15 +60,13 @@ def export_to_xlsx(db_path, export_scope, table_name=None, query=None, output_pa
                 
             print(f"✅ 발견된 테이블: {len(tables)}개 ({', '.join(tables)})")
             
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                for table in tables:
-                    print(f"▶ 테이블 '{table}' 추출 중...")
-                    df = pd.read_sql_query(f"SELECT * FROM {table}", conn)
-                    
-                    sheet_name = table[:31]  # Excel limits
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
-                    print(f"   ✓ {df.shape[0]} rows")
+            for table in tables:
+                print(f"▶ 테이블 '{table}' 추출 중...")
+                sheet_name = table[:31]  # Excel limits
+                rows = _write_sheet(workbook, sheet_name, conn, table_query(table), chunk_size)
+                print(f"   ✓ {rows} rows")
             
+            workbook.save(output_path)
             print(f"🎉 전체 DB 엑셀 저장 완료: {output_path}")
             
         return True
@@ -71,3 +76,34 @@ def export_to_xlsx(db_path, export_scope, table_name=None, query=None, output_pa
         raise e
     finally:
         if conn: conn.close()
+
+def _write_sheet(workbook, title, conn, sql, chunk_size):
+    """Stream the result of sql into one or more write-only sheets; returns the row count."""
+    written = 0
+    sheet = None
+    sheet_rows = 0
+    part = 1
+    for columns, rows in iter_row_chunks(conn, sql, chunk_size):
+        if sheet is None:
+            sheet = _new_sheet(workbook, title, columns)
+        for row in rows:
+            if sheet_rows == EXCEL_MAX_ROWS:
+                part += 1
+                suffix = f"_{part}"
+                sheet = _new_sheet(workbook, title[:31 - len(suffix)] + suffix, columns)
+                sheet_rows = 0
+                print(f"   ↪ 시트 행 수 제한으로 '{sheet.title}' 에 이어서 저장")
+            sheet.append([v.hex() if isinstance(v, bytes) else v for v in row])
+            sheet_rows += 1
+        written += len(rows)
+    return written
+
+def _new_sheet(workbook, title, columns):
+    sheet = workbook.create_sheet(title)
+    header = []
+    for name in columns:
+        cell = WriteOnlyCell(sheet, value=name)
+        cell.font = Font(bold=True)
+        header.append(cell)
+    sheet.append(header)
+    return sheet
@@ -1,6 +1,6 @@
 
 import tkinter as tk
-from tkinter import filedialog, messagebox, scrolledtext
+from tkinter import filedialog, messagebox, scrolledtext, ttk
 import os
 import sys
 
@@ -10,6 +10,10 @@ from sqlite.tosqlite.pkl2sqlite import import_from_pkl
 from sqlite.fromsqlite.sqlite2xlsx import export_to_xlsx
 from sqlite.fromsqlite.sqlite2pkl import export_to_pkl
 from sqlite.utils.convert_db_to_base64 import convert_db_to_js
+from sqlite.utils.db_chunker import DEFAULT_CHUNK_BYTES, OUTPUT_MODES
+from sqlite.utils.db_packager import COMPRESSIONS, DEFAULT_PAGE_SIZE, PAGE_SIZES
+from storage.pickle_codec import CODECS
+from ui.log_sink import create_log_sink
 
 def create_sqlite_tab(notebook):
     """
@@ -76,6 +80,7 @@ def create_sqlite_tab(notebook):
     
     logic.txt_log = scrolledtext.ScrolledText(lb_log_frame, height=20)
     logic.txt_log.pack(fill="both", expand=True)
+    logic.log_sink = create_log_sink(logic.txt_log, "sqlite")
     
     # Initial Update
     logic.update_ui()
@@ -88,8 +93,7 @@ class SQLiteTabLogic:
         self.widgets = {} # config widgets
         
     def log(self, message):
-        self.txt_log.insert(tk.END, message + "\n")
-        self.txt_log.see(tk.END)
+        self.log_sink.log(message)
         
     def browse_db(self):
         f = filedialog.askopenfilename(filetypes=[("SQLite DB", "*.db"), ("All Files", "*.*")])
@@ -132,6 +136,13 @@ class SQLiteTabLogic:
             tk.Radiobutton(self.lb_settings_frame, text="Append", 
                            variable=self.widgets['var_if_exists'], value="append").pack(anchor="w")
 
+            tk.Label(self.lb_settings_frame, text="Indexes (blank = skip ANALYZE):").pack(anchor="w")
+            self.widgets['entry_indexes'] = tk.Entry(self.lb_settings_frame)
+            self.widgets['entry_indexes'].insert(0, "auto")
+            self.widgets['entry_indexes'].pack(fill="x")
+            tk.Label(self.lb_settings_frame, text="auto = id/*_id 컬럼, 예) auto; orders: status+created_at, email",
+                     fg="gray", font=("Arial", 8)).pack(anchor="w")
+
         elif mode in ["sqlite2xlsx", "sqlite2pkl"]:
             # Export UI
             tk.Label(self.lb_settings_frame, text="Export Scope:").pack(anchor="w")
@@ -149,12 +160,52 @@ class SQLiteTabLogic:
             self.widgets['entry_table'].pack(fill="x")
             
             tk.Label(self.lb_settings_frame, text="Query (Write in Right Panel):").pack(anchor="w")
+
+            if mode == "sqlite2pkl":
+                tk.Label(self.lb_settings_frame, text="Compression:").pack(anchor="w")
+                self.widgets['var_compression'] = tk.StringVar(value="none")
+                ttk.Combobox(self.lb_settings_frame, textvariable=self.widgets['var_compression'],
+                             values=list(CODECS), state="readonly", width=10).pack(anchor="w")
             
         elif mode == "db2js":
             tk.Label(self.lb_settings_frame, text="Convert DB to Base64 JS for Web").pack()
 
+            self.widgets['var_optimize'] = tk.BooleanVar(value=True)
+            tk.Checkbutton(self.lb_settings_frame, text="Optimize (VACUUM INTO, 빈 페이지 제거)",
+                           variable=self.widgets['var_optimize']).pack(anchor="w")
+
+            tk.Label(self.lb_settings_frame, text="Page Size:").pack(anchor="w")
+            self.widgets['var_page_size'] = tk.StringVar(value=str(DEFAULT_PAGE_SIZE))
+            ttk.Combobox(self.lb_settings_frame, textvariable=self.widgets['var_page_size'],
+                         values=[str(p) for p in PAGE_SIZES], state="readonly", width=10).pack(anchor="w")
+
+            tk.Label(self.lb_settings_frame, text="Strip Tables (comma separated):").pack(anchor="w")
+            self.widgets['entry_strip_tables'] = tk.Entry(self.lb_settings_frame)
+            self.widgets['entry_strip_tables'].pack(fill="x")
+
+            tk.Label(self.lb_settings_frame, text="Compression:").pack(anchor="w")
+            self.widgets['var_js_compression'] = tk.StringVar(value="none")
+            ttk.Combobox(self.lb_settings_frame, textvariable=self.widgets['var_js_compression'],
+                         values=list(COMPRESSIONS), state="readonly", width=10).pack(anchor="w")
+            tk.Label(self.lb_settings_frame, text="* 압축 시 JS에서 await dataset.loadDatabaseBinary() 사용",
+                     fg="gray", font=("Arial", 8)).pack(anchor="w")
+            tk.Label(self.lb_settings_frame, text="* brotli: 페이지에 window.BrotliDecode 디코더를 먼저 로드해야 함",
+                     fg="gray", font=("Arial", 8)).pack(anchor="w")
+
+            tk.Label(self.lb_settings_frame, text="Output Mode:").pack(anchor="w")
+            self.widgets['var_output_mode'] = tk.StringVar(value="single")
+            ttk.Combobox(self.lb_settings_frame, textvariable=self.widgets['var_output_mode'],
+                         values=list(OUTPUT_MODES), state="readonly", width=10).pack(anchor="w")
+
+            tk.Label(self.lb_settings_frame, text="Chunk Size (MB, chunked/sidecar):").pack(anchor="w")
+            self.widgets['entry_chunk_mb'] = tk.Entry(self.lb_settings_frame, width=8)
+            self.widgets['entry_chunk_mb'].insert(0, str(DEFAULT_CHUNK_BYTES // 1048576))
+            self.widgets['entry_chunk_mb'].pack(anchor="w")
+            tk.Label(self.lb_settings_frame, text="* sidecar: .partNNN.bin 파일을 JS와 같은 위치에 배포",
+                     fg="gray", font=("Arial", 8)).pack(anchor="w")
+
     def browse_file_import(self, mode):
-        ft = [("Excel", "*.xlsx *.xls")] if mode == "xlsx2sqlite" else [("Pickle", "*.pkl")]
+        ft = [("Excel", "*.xlsx *.xls")] if mode == "xlsx2sqlite" else [("Pickle", "*.pkl *.pkl.zst *.pkl.lz4 *.pkl.gz"), ("All Files", "*.*")]
         f = filedialog.askopenfilename(filetypes=ft)
         if f:
             self.widgets['entry_file'].delete(0, tk.END)
@@ -175,6 +226,7 @@ class SQLiteTabLogic:
                 
                 table = self.widgets['entry_table'].get().strip()
                 if_exists = self.widgets['var_if_exists'].get()
+                index_spec = self.widgets['entry_indexes'].get().strip() or None
                 
                 # Logic: if table name is given, scope='single', else 'all'
                 scope = "single" if table else "all"
@@ -182,9 +234,9 @@ class SQLiteTabLogic:
                 self.log(f"Starting Import: {src_file} -> {db_path} ({scope})")
                 
                 if mode == "xlsx2sqlite":
-                    import_from_xlsx(db_path, src_file, scope, target_table=table, if_exists=if_exists)
+                    import_from_xlsx(db_path, src_file, scope, target_table=table, if_exists=if_exists, index_spec=index_spec)
                 else:
-                    import_from_pkl(db_path, src_file, scope, target_table=table, if_exists=if_exists)
+                    import_from_pkl(db_path, src_file, scope, target_table=table, if_exists=if_exists, index_spec=index_spec)
                     
                 self.log("Import Success!")
                 messagebox.showinfo("Success", "SQLite Import Completed.")
@@ -203,7 +255,7 @@ class SQLiteTabLogic:
                 if mode == "sqlite2xlsx":
                     export_to_xlsx(db_path, scope, table, query, f)
                 else:
-                    export_to_pkl(db_path, scope, table, query, f)
+                    export_to_pkl(db_path, scope, table, query, f, compression=self.widgets['var_compression'].get())
                     
                 self.log("Export Success!")
                 messagebox.showinfo("Success", "SQLite Export Completed.")
@@ -213,7 +265,18 @@ class SQLiteTabLogic:
                 if not f: return
                 
                 self.log("Converting DB to JS...")
-                convert_db_to_js(db_path, f)
+                if self.widgets['var_js_compression'].get() == "brotli":
+                    self.log("⚠️ brotli: 생성된 JS보다 먼저 window.BrotliDecode를 정의하는 디코더(예: google/brotli의 js/decode.js)를 로드해야 합니다.")
+                strip_tables = [t.strip() for t in self.widgets['entry_strip_tables'].get().split(",") if t.strip()]
+                convert_db_to_js(
+                    db_path, f,
+                    optimize=self.widgets['var_optimize'].get(),
+                    page_size=int(self.widgets['var_page_size'].get()),
+                    strip_tables=strip_tables,
+                    compression=self.widgets['var_js_compression'].get(),
+                    output_mode=self.widgets['var_output_mode'].get(),
+                    chunk_bytes=int(float(self.widgets['entry_chunk_mb'].get() or 4) * 1048576),
+                )
                 self.log("Conversion Success!")
                 messagebox.showinfo("Success", "DB Converted to JS.")
                 
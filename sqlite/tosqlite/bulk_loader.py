@@ -0,0 +1,180 @@
+"""
+bulk_loader.py
+------------------------
+SQLite 대량 적재 유틸리티 (PRAGMA 튜닝 + executemany, 청크 단위 트랜잭션)
+"""
+
+import datetime
+import decimal
+from contextlib import contextmanager
+
+import pandas as pd
+
+
+DEFAULT_CHUNK_SIZE = 50000
+DEFAULT_CACHE_MB = 256
+
+
+@contextmanager
+def bulk_load_pragmas(conn, journal_mode=None, cache_mb=DEFAULT_CACHE_MB):
+    """
+    Relax durability on `conn` for a bulk load and put the previous settings back afterwards.
+
+    Sets synchronous=OFF, cache_size=-<cache_mb MB>, temp_store=MEMORY and
+    the given journal_mode. By default the journal is turned OFF for an
+    empty database (a failed load loses nothing) and set to WAL otherwise.
+    """
+    saved = {
+        name: conn.execute(f"PRAGMA {name}").fetchone()[0]
+        for name in ("journal_mode", "synchronous", "cache_size", "temp_store")
+    }
+    if journal_mode is None:
+        journal_mode = "OFF" if conn.execute("PRAGMA page_count").fetchone()[0] == 0 else "WAL"
+
+    conn.commit()
+    conn.execute(f"PRAGMA journal_mode={journal_mode}")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute(f"PRAGMA cache_size=-{int(cache_mb) * 1024}")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    try:
+        yield conn
+    finally:
+        conn.commit()
+        conn.execute(f"PRAGMA journal_mode={saved['journal_mode']}")
+        conn.execute(f"PRAGMA synchronous={saved['synchronous']}")
+        conn.execute(f"PRAGMA cache_size={saved['cache_size']}")
+        conn.execute(f"PRAGMA temp_store={saved['temp_store']}")
+
+
+def bulk_load_dataframe(conn, df, table_name, if_exists="replace", chunk_size=DEFAULT_CHUNK_SIZE, log=print):
+    """
+    Write a DataFrame into SQLite with executemany, one transaction per chunk.
+
+    The table is created from pandas' SQLite schema for `df` ('replace'
+    drops it first; 'append' creates it only when missing). Rows are fed
+    to executemany as tuples of native Python values built column-wise.
+
+    Returns:
+        int: Number of rows written.
+    """
+    table = _quote(table_name)
+    if if_exists == "replace":
+        conn.execute(f"DROP TABLE IF EXISTS {table}")
+    if if_exists == "replace" or not _table_exists(conn, table_name):
+        conn.execute(pd.io.sql.get_schema(df, table_name, con=conn))
+    conn.commit()
+
+    total = len(df)
+    if not total:
+        return 0
+    chunk_size = max(1, int(chunk_size or DEFAULT_CHUNK_SIZE))
+    insert_sql = _insert_sql(table_name, df.columns)
+
+    for offset in range(0, total, chunk_size):
+        chunk = df.iloc[offset:offset + chunk_size]
+        try:
+            conn.executemany(insert_sql, _row_tuples(chunk))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        done = offset + len(chunk)
+        if total > chunk_size:
+            log(f"    · {done:,}/{total:,} rows ({done * 100 // total}%)")
+    return total
+
+
+def bulk_load_rows(conn, table_name, columns, chunks, log=print):
+    """
+    Insert an iterable of row chunks (e.g. from a server-side cursor) into an existing table.
+
+    Each chunk is a list of row sequences in `columns` order and is written
+    in its own transaction with executemany. Values sqlite3 cannot bind are
+    adapted the same way as in bulk_load_dataframe.
+
+    Returns:
+        int: Number of rows written.
+    """
+    insert_sql = _insert_sql(table_name, columns)
+    written = 0
+    for rows in chunks:
+        try:
+            conn.executemany(insert_sql, (tuple(map(_adapt, row)) for row in rows))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        written += len(rows)
+        log(f"    · {written:,} rows")
+    return written
+
+
+def _insert_sql(table_name, columns):
+    placeholders = ", ".join("?" for _ in columns)
+    return f"INSERT INTO {_quote(table_name)} ({', '.join(_quote(c) for c in columns)}) VALUES ({placeholders})"
+
+
+def _row_tuples(df):
+    """Iterate df as tuples of values sqlite3 can bind (None for NA, ISO strings for datetimes)."""
+    return zip(*(_column_values(df.iloc[:, i]) for i in range(df.shape[1])))
+
+
+def _column_values(series):
+    if pd.api.types.is_bool_dtype(series) and not series.hasnans:
+        return series.astype(int).tolist()
+    if pd.api.types.is_integer_dtype(series) and not series.hasnans:
+        return series.tolist()
+    if pd.api.types.is_float_dtype(series):
+        return series.astype(object).where(series.notna(), None).tolist()
+    if pd.api.types.is_datetime64_any_dtype(series):
+        text = series.dt.strftime("%Y-%m-%d %H:%M:%S.%f").str.removesuffix(".000000")
+        if isinstance(series.dtype, pd.DatetimeTZDtype):
+            # Keep the UTC offset like to_sql does: '+0900' -> '+09:00'
+            text = text + series.dt.strftime("%z").str.replace(r"(\d\d)$", r":\1", regex=True)
+        return text.astype(object).where(series.notna(), None).tolist()
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(object)
+    if pd.api.types.infer_dtype(series, skipna=True) in ("string", "bytes", "empty"):
+        return series.astype(object).where(series.notna(), None).tolist()
+    return [_adapt(v) for v in series.tolist()]
+
+
+def _adapt(value):
+    if value is None or isinstance(value, (str, int, float, bytes)):
+        return None if isinstance(value, float) and value != value else value
+    if value is pd.NaT or value is pd.NA:
+        return None
+    if isinstance(value, decimal.Decimal):
+        # Bound as text: NUMERIC affinity converts it exactly, float() would round
+        return str(value)
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, datetime.timedelta):
+        return _format_timedelta(value)
+    if hasattr(value, "item"):  # numpy scalar
+        return _adapt(value.item())
+    return str(value)
+
+
+def _format_timedelta(value):
+    """MySQL TIME style [-]HH:MM:SS[.ffffff] (hours may exceed 24), not str()'s '-1 day, 23:00:00'."""
+    micros = (value.days * 86400 + value.seconds) * 1000000 + value.microseconds
+    sign = "-" if micros < 0 else ""
+    seconds, micros = divmod(abs(micros), 1000000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    text = f"{sign}{hours:02d}:{minutes:02d}:{seconds:02d}"
+    return f"{text}.{micros:06d}" if micros else text
+
+
+def _table_exists(conn, table_name):
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (table_name,)
+    ).fetchone()
+    return row is not None
+
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
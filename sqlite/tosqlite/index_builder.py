@@ -0,0 +1,142 @@
+"""
+index_builder.py
+------------------------
+적재 후 SQLite 인덱스 생성 및 ANALYZE / PRAGMA optimize 유틸리티
+"""
+
+import hashlib
+import re
+
+
+AUTO = "auto"
+
+
+def parse_index_spec(text):
+    """
+    Parse an index specification.
+
+    Format: entries separated by ';'. 'auto' indexes every `id` / `*_id`
+    column of the loaded tables; 'table: a, b+c' adds an index on `a` and a
+    composite index on (`b`, `c`) for that table.
+
+    Example: "auto; orders: status+created_at, customer_email"
+
+    Returns:
+        dict: {'auto': bool, 'tables': {table: [[col, ...], ...]}}
+    """
+    spec = {"auto": False, "tables": {}}
+    for entry in (text or "").split(";"):
+        entry = entry.strip()
+        if not entry:
+            continue
+        if entry.lower() == AUTO:
+            spec["auto"] = True
+            continue
+        if ":" not in entry:
+            raise ValueError(f"인덱스 지정 형식 오류: '{entry}' (예: 'orders: customer_id, status+created_at')")
+        table, columns = entry.split(":", 1)
+        indexes = spec["tables"].setdefault(table.strip(), [])
+        for group in columns.split(","):
+            cols = [c.strip() for c in group.split("+") if c.strip()]
+            if cols:
+                indexes.append(cols)
+    return spec
+
+
+def auto_index_columns(conn, table):
+    """Columns named `id` or ending in `_id` (case-insensitive), in table order."""
+    return [
+        [name] for name in _table_columns(conn, table)
+        if name.lower() == "id" or name.lower().endswith("_id")
+    ]
+
+
+def build_indexes(conn, tables, spec, log=print):
+    """
+    Create the indexes from `spec` for the loaded `tables`, then ANALYZE and PRAGMA optimize.
+
+    Tables named in the spec but not loaded in this run are indexed too if
+    they exist. Unknown columns are reported and skipped; an index whose
+    columns already lead an existing index is not created again.
+
+    Returns:
+        list: Names of the indexes created.
+    """
+    if isinstance(spec, str):
+        spec = parse_index_spec(spec)
+
+    wanted = {}
+    if spec["auto"]:
+        for table in tables:
+            wanted.setdefault(table, []).extend(auto_index_columns(conn, table))
+    for table, indexes in spec["tables"].items():
+        wanted.setdefault(table, []).extend(indexes)
+
+    created = []
+    for table, indexes in wanted.items():
+        columns = _table_columns(conn, table)
+        if not columns:
+            log(f"   ⚠️ 인덱스 대상 테이블 '{table}' 이(가) 없어 건너뜁니다.")
+            continue
+        existing = _index_prefixes(conn, table)
+        for cols in indexes:
+            missing = [c for c in cols if c not in columns]
+            if missing:
+                log(f"   ⚠️ '{table}' 에 컬럼 {', '.join(missing)} 이(가) 없어 인덱스를 건너뜁니다.")
+                continue
+            if tuple(cols) in existing:
+                continue
+            name = _index_name(table, cols)
+            existing.add(tuple(cols))
+            if _index_exists(conn, name):
+                log(f"   ⚠️ 인덱스 이름 '{name}' 이(가) 이미 사용 중이라 ({', '.join(cols)}) 인덱스를 건너뜁니다.")
+                continue
+            col_list = ", ".join(_quote(c) for c in cols)
+            conn.execute(f"CREATE INDEX {_quote(name)} ON {_quote(table)} ({col_list})")
+            created.append(name)
+            log(f"   🔎 인덱스 생성: {name} ({', '.join(cols)})")
+    conn.commit()
+
+    conn.execute("ANALYZE")
+    conn.execute("PRAGMA optimize")
+    conn.commit()
+    log(f"   ✓ 인덱스 {len(created)}개 생성, ANALYZE / PRAGMA optimize 완료")
+    return created
+
+
+def _table_columns(conn, table):
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({_quote(table)})").fetchall()]
+
+
+def _index_prefixes(conn, table):
+    """Every leading column tuple already covered by an index (or an INTEGER PRIMARY KEY rowid alias) on `table`."""
+    prefixes = set()
+    pk = [row for row in conn.execute(f"PRAGMA table_info({_quote(table)})").fetchall() if row[5]]
+    if len(pk) == 1 and pk[0][2].upper() == "INTEGER":
+        prefixes.add((pk[0][1],))
+    for index in conn.execute(f"PRAGMA index_list({_quote(table)})").fetchall():
+        cols = [row[2] for row in conn.execute(f"PRAGMA index_info({_quote(index[1])})").fetchall()]
+        for i in range(1, len(cols) + 1):
+            prefixes.add(tuple(cols[:i]))
+    return prefixes
+
+
+def _index_exists(conn, name):
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (name,)).fetchone() is not None
+
+
+def _index_name(table, cols):
+    """
+    ix_<table>__<col>__<col>; a short hash of the exact names is appended when
+    sanitising or a '__' inside a name could make two indexes collide.
+    """
+    raw = f"ix_{table}__{'__'.join(cols)}"
+    name = re.sub(r"\W", "_", raw)
+    if name != raw or any("__" in part for part in (table, *cols)):
+        digest = hashlib.sha1("\0".join((table, *cols)).encode("utf-8")).hexdigest()[:8]
+        name = f"{name}_{digest}"
+    return name
+
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
@@ -0,0 +1,117 @@
+"""
+base64_stream.py
+------------------------
+대용량 바이너리 파일을 일정한 메모리로 Base64 인코딩해 텍스트 파일에 바로 쓰는 유틸리티
+"""
+
+import base64
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+
+# Multiple of 3, so every block encodes without '=' padding except the last
+DEFAULT_BLOCK_SIZE = 3 * 1024 * 1024
+
+
+def encode_stream(src, dst, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Base64-encode binary file object `src` into text file object `dst`.
+
+    Reads `block_size` bytes at a time (rounded down to a multiple of 3);
+    short reads are carried over so only the final block can carry padding.
+    Peak memory is a few times block_size, independent of the input size.
+
+    Returns:
+        int: Number of Base64 characters written.
+    """
+    block_size = max(3, block_size - block_size % 3)
+    written = 0
+    carry = b""
+    while True:
+        block = src.read(block_size - len(carry))
+        if not block:
+            break
+        block = carry + block
+        usable = len(block) - len(block) % 3
+        carry = block[usable:]
+        if usable:
+            text = base64.b64encode(block[:usable]).decode("ascii")
+            dst.write(text)
+            written += len(text)
+    if carry:
+        text = base64.b64encode(carry).decode("ascii")
+        dst.write(text)
+        written += len(text)
+    return written
+
+
+def write_encoded_file(input_path, output_path, header="", footer="", block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Write `header`, the Base64 of input_path, then `footer` to output_path.
+
+    Returns:
+        int: Number of Base64 characters written (header/footer excluded).
+    """
+    with open(input_path, "rb") as src, open(output_path, "w", encoding="utf-8") as dst:
+        dst.write(header)
+        written = encode_stream(src, dst, block_size)
+        dst.write(footer)
+    return written
+
+
+def benchmark(input_path, block_sizes=(64 * 1024, 1024 * 1024, DEFAULT_BLOCK_SIZE)):
+    """
+    Compare the old read-all encoding with encode_stream at several block sizes.
+
+    Returns:
+        list[dict]: {'method', 'seconds', 'peak_mb', 'mb_per_s'} per run.
+    """
+    size_mb = os.path.getsize(input_path) / 1048576
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = os.path.join(tmp, "out.js")
+
+        def _run(method, fn):
+            tracemalloc.start()
+            started = time.perf_counter()
+            fn()
+            seconds = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            rows.append({
+                "method": method,
+                "seconds": seconds,
+                "peak_mb": peak / 1048576,
+                "mb_per_s": size_mb / seconds if seconds else 0.0,
+            })
+
+        def _read_all():
+            with open(input_path, "rb") as f:
+                encoded = base64.b64encode(f.read()).decode("utf-8")
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(f'const data = "{encoded}";')
+
+        _run("read-all", _read_all)
+        for block_size in block_sizes:
+            _run(
+                f"stream {block_size // 1024:,} KB",
+                lambda b=block_size: write_encoded_file(input_path, output_path, 'const data = "', '";', b),
+            )
+    return rows
+
+
+def format_benchmark(rows):
+    lines = [f"{'method':<18} {'time(s)':>8} {'peak(MB)':>9} {'MB/s':>8}"]
+    for r in rows:
+        lines.append(f"{r['method']:<18} {r['seconds']:>8.3f} {r['peak_mb']:>9.1f} {r['mb_per_s']:>8.1f}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        print(format_benchmark(benchmark(sys.argv[1])))
+    else:
+        print("Usage: python base64_stream.py <file>")
@@ -5,24 +5,57 @@ convert_db_to_base64.py
 SQLite 데이터베이스 파일을 Base64로 변환하여 JavaScript 파일로 저장하는 유틸리티
 """
 
-import base64
 import os
 import sys
+import tempfile
 
-def convert_db_to_js(db_file, output_js=None):
+if not __package__:  # run as a script: python sqlite/utils/convert_db_to_base64.py <db>
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlite.utils.base64_stream import write_encoded_file
+from sqlite.utils.db_chunker import DEFAULT_CHUNK_BYTES, write_chunked_output
+from sqlite.utils.db_packager import DEFAULT_PAGE_SIZE, format_package_report, pack_database, package_database
+
+def convert_db_to_js(db_file, output_js=None, optimize=False, page_size=DEFAULT_PAGE_SIZE,
+                     strip_tables=None, compression="none", output_mode="single",
+                     chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """
+    Embed a SQLite database in a JS file as Base64.
+
+    Args:
+        optimize (bool): Package the DB first (VACUUM INTO with `page_size`,
+            `strip_tables` dropped) instead of embedding the file as-is.
+        compression (str): 'none', 'gzip' or 'brotli'; applied to the packaged
+            DB before encoding (implies `optimize`). Compressed payloads are
+            inflated by Dataset.loadDatabaseBinary(); 'brotli' additionally needs
+            a decoder defining window.BrotliDecode on the page.
+        output_mode (str): 'single' (one Base64 string, as before), 'chunked'
+            (lazily decoded Base64 segments) or 'sidecar' (.partNNN.bin files
+            fetched by the JS); see db_chunker.write_chunked_output.
+        chunk_bytes (int): Chunk size for 'chunked' / 'sidecar'.
+    """
     if not output_js:
         output_js = os.path.splitext(db_file)[0] + '.js'
 
-    # SQLite DB 파일을 Base64로 변환
-    with open(db_file, "rb") as f:
-        encoded = base64.b64encode(f.read()).decode("utf-8")
+    if output_mode != "single":
+        return _convert_db_to_chunked_js(db_file, output_js, optimize, page_size, strip_tables,
+                                         compression, output_mode, chunk_bytes)
 
-    # JavaScript 파일 내용 구성 (Base64 + 복호화 함수 포함)
-    js_content = f"""class Dataset {{
-    databaseBase64 = "{encoded}";
+    # JavaScript 파일 내용 구성 (Base64 + 복호화 함수 포함); Base64는 header와 footer 사이에 스트리밍
+    header = """class Dataset {
+    databaseBase64 = \""""
+    footer = f"""";
+    databaseCompression = "{compression}";
 
-    // Base64를 바이너리로 변환하여 Uint8Array 반환
+    // Base64를 바이너리로 변환하여 Uint8Array 반환 (압축된 DB는 loadDatabaseBinary() 사용)
     getDatabaseBinary() {{
+        if (this.databaseCompression !== "none") {{
+            throw new Error("Database is " + this.databaseCompression + "-compressed: use await loadDatabaseBinary()");
+        }}
+        return this.decodeBase64();
+    }}
+
+    decodeBase64() {{
         const binaryString = atob(this.databaseBase64);
         const bytes = new Uint8Array(binaryString.length);
         for (let i = 0; i < binaryString.length; i++) {{
@@ -30,15 +63,62 @@ def convert_db_to_js(db_file, output_js=None):
         }}
         return bytes;
     }}
+
+    // sql.js에 넘길 DB 바이너리 (압축 해제 포함)
+    async loadDatabaseBinary() {{
+        const bytes = this.decodeBase64();
+        if (this.databaseCompression === "none") {{
+            return bytes;
+        }}
+        if (this.databaseCompression === "gzip") {{
+            const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+            return new Uint8Array(await new Response(stream).arrayBuffer());
+        }}
+        if (this.databaseCompression === "brotli") {{
+            if (!window.BrotliDecode) {{
+                throw new Error("Brotli-compressed database: load a decoder that defines window.BrotliDecode (e.g. google/brotli js/decode.js) before this script");
+            }}
+            return window.BrotliDecode(bytes);
+        }}
+        throw new Error("Unsupported database compression: " + this.databaseCompression);
+    }}
     }};
     
     window.Dataset = Dataset;
     """
 
-    # JavaScript 파일로 저장
-    with open(output_js, "w", encoding='utf-8') as f:
-        f.write(js_content)
-    
+    if optimize or compression != "none":
+        # VACUUM INTO (+ page_size, 테이블 제외) 후 압축한 임시 파일을 인코딩
+        with tempfile.TemporaryDirectory() as tmp:
+            payload_path = os.path.join(tmp, "payload")
+            report = package_database(db_file, payload_path, page_size, strip_tables, compression)
+            encoded_chars = write_encoded_file(payload_path, output_js, header, footer)
+    else:
+        # SQLite DB 파일을 블록 단위로 Base64 변환하여 JavaScript 파일로 저장
+        report = None
+        encoded_chars = write_encoded_file(db_file, output_js, header, footer)
+
+    if report:
+        report["encoded_bytes"] = encoded_chars
+        print(format_package_report(report))
+    print(f"✅ 변환 완료! {output_js} 파일이 생성되었습니다.")
+    return output_js
+
+def _convert_db_to_chunked_js(db_file, output_js, optimize, page_size, strip_tables,
+                              compression, output_mode, chunk_bytes):
+    with tempfile.TemporaryDirectory() as tmp:
+        source = db_file
+        if optimize:
+            # VACUUM INTO (+ page_size, 테이블 제외); 압축은 청크별로 적용
+            source = os.path.join(tmp, "packed.db")
+            print(format_package_report(pack_database(db_file, source, page_size, strip_tables)))
+        result = write_chunked_output(source, output_js, output_mode, chunk_bytes, compression)
+
+    print(
+        f"   청크 {result['chunks']}개 ({output_mode}, {compression}) | "
+        f"DB {result['total_bytes'] / 1048576:.2f} MB → 저장 {result['stored_bytes'] / 1048576:.2f} MB, "
+        f"출력 합계 {result['output_bytes'] / 1048576:.2f} MB"
+    )
     print(f"✅ 변환 완료! {output_js} 파일이 생성되었습니다.")
     return output_js
 
@@ -0,0 +1,178 @@
+"""
+db_chunker.py
+------------------------
+SQLite DB를 고정 크기 청크로 나눠 JS 세그먼트 또는 사이드카 바이너리 파일로 내보내는 유틸리티
+"""
+
+import base64
+import glob
+import json
+import os
+import re
+
+from sqlite.utils.db_packager import compress_bytes
+
+
+DEFAULT_CHUNK_BYTES = 4 * 1048576
+OUTPUT_MODES = ("single", "chunked", "sidecar")
+_PART_NAME = re.compile(r"\.part\d{3,}\.bin$")
+
+# Browser-side loader shared by both modes. __MANIFEST__ is replaced with the
+# JSON manifest; chunked mode defines SEGMENTS (Base64 strings) before it.
+_LOADER_JS = """
+const MANIFEST = __MANIFEST__;
+const BASE_URL = document.currentScript ? document.currentScript.src : location.href;
+
+const LOOKUP = new Uint8Array(128);
+const ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/";
+for (let i = 0; i < ALPHABET.length; i++) {
+    LOOKUP[ALPHABET.charCodeAt(i)] = i;
+}
+
+// Table-driven Base64 decode straight into a Uint8Array (no atob string copy)
+function decodeBase64(text) {
+    const padding = text.endsWith("==") ? 2 : text.endsWith("=") ? 1 : 0;
+    const out = new Uint8Array((text.length / 4) * 3 - padding);
+    let j = 0;
+    for (let i = 0; i < text.length; i += 4) {
+        const n = (LOOKUP[text.charCodeAt(i)] << 18) | (LOOKUP[text.charCodeAt(i + 1)] << 12)
+            | (LOOKUP[text.charCodeAt(i + 2)] << 6) | LOOKUP[text.charCodeAt(i + 3)];
+        out[j++] = n >> 16;
+        if (j < out.length) out[j++] = (n >> 8) & 255;
+        if (j < out.length) out[j++] = n & 255;
+    }
+    return out;
+}
+
+async function inflate(bytes) {
+    if (MANIFEST.compression === "none") {
+        return bytes;
+    }
+    if (MANIFEST.compression === "gzip") {
+        const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+        return new Uint8Array(await new Response(stream).arrayBuffer());
+    }
+    if (MANIFEST.compression === "brotli") {
+        if (!window.BrotliDecode) {
+            throw new Error("Brotli-compressed database: load a decoder that defines window.BrotliDecode (e.g. google/brotli js/decode.js) before this script");
+        }
+        return window.BrotliDecode(bytes);
+    }
+    throw new Error("Unsupported database compression: " + MANIFEST.compression);
+}
+
+async function loadChunk(index) {
+    if (MANIFEST.mode === "chunked") {
+        await new Promise((resolve) => setTimeout(resolve, 0));  // keep the page responsive
+        const text = SEGMENTS[index];
+        SEGMENTS[index] = null;  // release the Base64 string once decoded
+        return decodeBase64(text);
+    }
+    const response = await fetch(new URL(MANIFEST.chunks[index].file, BASE_URL));
+    if (!response.ok) {
+        throw new Error("Failed to load " + MANIFEST.chunks[index].file + ": " + response.status);
+    }
+    return new Uint8Array(await response.arrayBuffer());
+}
+
+// One assembled binary per page: chunked segments are released as they are decoded,
+// so later loadDatabaseBinary() calls (any Dataset instance) share the first result.
+let loading = null;
+
+async function assemble(onProgress) {
+    const out = new Uint8Array(MANIFEST.totalBytes);
+    let loaded = 0;
+    await Promise.all(MANIFEST.chunks.map(async (chunk, index) => {
+        const raw = await inflate(await loadChunk(index));
+        out.set(raw, chunk.offset);
+        loaded += chunk.bytes;
+        if (onProgress) onProgress(loaded, MANIFEST.totalBytes);
+    }));
+    return out;
+}
+
+class Dataset {
+    static manifest = MANIFEST;
+
+    // sql.js에 넘길 DB 바이너리. 청크는 도착/디코딩되는 순서대로 제자리에 복사됨 (두 번째 호출부터는 같은 결과 재사용)
+    loadDatabaseBinary(onProgress) {
+        if (!loading) {
+            loading = assemble(onProgress).catch((error) => {
+                if (MANIFEST.mode === "sidecar") loading = null;  // fetch failures can be retried
+                throw error;
+            });
+        } else if (onProgress) {
+            loading.then(() => onProgress(MANIFEST.totalBytes, MANIFEST.totalBytes), () => {});
+        }
+        return loading;
+    }
+}
+
+window.Dataset = Dataset;
+"""
+
+
+def write_chunked_output(db_path, output_js, mode="chunked", chunk_bytes=DEFAULT_CHUNK_BYTES, compression="none"):
+    """
+    Split db_path into `chunk_bytes` pieces, compress each on its own and emit them for the browser.
+
+    mode='chunked' writes one JS file with a Base64 segment per chunk,
+    decoded lazily one at a time. mode='sidecar' writes the chunks as
+    <name>.partNNN.bin next to output_js, which the JS fetches in parallel
+    with fetch().arrayBuffer(). Both JS files carry a manifest (offsets,
+    sizes, compression) so chunks are placed as soon as each one is ready.
+    Only one chunk is held in memory at a time.
+
+    Returns:
+        dict: {'chunks', 'total_bytes', 'stored_bytes', 'output_bytes'}
+    """
+    if mode not in ("chunked", "sidecar"):
+        raise ValueError(f"지원하지 않는 출력 방식입니다: {mode}")
+    chunk_bytes = max(3, int(chunk_bytes) - int(chunk_bytes) % 3)
+    base = os.path.splitext(output_js)[0]
+    for stale in glob.glob(glob.escape(base) + ".part[0-9]*.bin"):
+        if _PART_NAME.search(stale):
+            os.remove(stale)  # parts of an earlier, larger export (3+ digits past 999 chunks)
+
+    manifest = {
+        "version": 1,
+        "mode": mode,
+        "compression": compression,
+        "chunkBytes": chunk_bytes,
+        "totalBytes": 0,
+        "chunks": [],
+    }
+    output_bytes = 0
+    with open(db_path, "rb") as src, open(output_js, "w", encoding="utf-8") as js:
+        js.write("// Generated by sqlHandler db2js\n(function () {\n")
+        if mode == "chunked":
+            js.write("const SEGMENTS = [\n")
+
+        offset = 0
+        for index, block in enumerate(iter(lambda: src.read(chunk_bytes), b"")):
+            stored = compress_bytes(block, compression)
+            entry = {"offset": offset, "bytes": len(block), "storedBytes": len(stored)}
+            if mode == "chunked":
+                js.write('"' + base64.b64encode(stored).decode("ascii") + '",\n')
+            else:
+                part_path = f"{base}.part{index:03d}.bin"
+                with open(part_path, "wb") as part:
+                    part.write(stored)
+                entry["file"] = os.path.basename(part_path)
+                output_bytes += len(stored)
+            manifest["chunks"].append(entry)
+            offset += len(block)
+        manifest["totalBytes"] = offset
+
+        if mode == "chunked":
+            js.write("];\n")
+        js.write(_LOADER_JS.replace("__MANIFEST__", json.dumps(manifest)))
+        js.write("})();\n")
+    output_bytes += os.path.getsize(output_js)
+
+    return {
+        "chunks": len(manifest["chunks"]),
+        "total_bytes": manifest["totalBytes"],
+        "stored_bytes": sum(c["storedBytes"] for c in manifest["chunks"]),
+        "output_bytes": output_bytes,
+    }
@@ -0,0 +1,155 @@
+"""
+db_packager.py
+------------------------
+웹 배포용 SQLite 패키징 유틸리티 (VACUUM INTO, page_size 조정, 테이블 제외, gzip/brotli 압축)
+"""
+
+import gzip
+import importlib.util
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+
+
+PAGE_SIZES = (1024, 2048, 4096, 8192, 16384, 32768, 65536)
+DEFAULT_PAGE_SIZE = 4096
+COMPRESSIONS = ("none", "gzip", "brotli")
+
+
+def pack_database(db_file, output_db, page_size=DEFAULT_PAGE_SIZE, strip_tables=None):
+    """
+    Write a compacted copy of db_file for shipping to the browser.
+
+    VACUUM INTO rebuilds the database into output_db with `page_size`,
+    without free pages and without touching the source. Tables listed in
+    `strip_tables` (and their indexes) are then dropped from the copy and it
+    is vacuumed again. The copy uses journal_mode=DELETE, which sql.js needs.
+
+    Returns:
+        dict: {'source_bytes', 'source_free_pages', 'packed_bytes', 'page_size', 'stripped'}
+    """
+    if page_size not in PAGE_SIZES:
+        raise ValueError(f"page_size는 {', '.join(map(str, PAGE_SIZES))} 중 하나여야 합니다.")
+    if os.path.exists(output_db):
+        os.remove(output_db)  # VACUUM INTO refuses to overwrite
+
+    src = sqlite3.connect(f"file:{db_file}?mode=ro", uri=True)
+    try:
+        free_pages = src.execute("PRAGMA freelist_count").fetchone()[0]
+        tables = {r[0] for r in src.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        src.execute(f"PRAGMA page_size={int(page_size)}")
+        src.execute("VACUUM INTO ?", (output_db,))
+    finally:
+        src.close()
+
+    stripped = [t for t in (strip_tables or []) if t in tables]
+    missing = [t for t in (strip_tables or []) if t not in tables]
+    if missing:
+        print(f"⚠️ 제외할 테이블이 DB에 없습니다: {', '.join(missing)}")
+
+    out = sqlite3.connect(output_db)
+    try:
+        out.execute("PRAGMA journal_mode=DELETE")
+        if stripped:
+            for table in stripped:
+                out.execute(f'DROP TABLE "{table.replace(chr(34), chr(34) * 2)}"')
+            out.commit()
+            out.execute("VACUUM")
+    finally:
+        out.close()
+
+    return {
+        "source_bytes": os.path.getsize(db_file),
+        "source_free_pages": free_pages,
+        "packed_bytes": os.path.getsize(output_db),
+        "page_size": page_size,
+        "stripped": stripped,
+    }
+
+
+def compress_bytes(data, compression="gzip", level=None):
+    """Compress one in-memory block (used for per-chunk compression)."""
+    if compression == "none":
+        return data
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=9 if level is None else level, mtime=0)
+    if compression == "brotli":
+        _require_brotli()
+        import brotli
+        return brotli.compress(data, quality=11 if level is None else level)
+    raise ValueError(f"지원하지 않는 압축 방식입니다: {compression} (지원: {', '.join(COMPRESSIONS)})")
+
+
+def compress_file(src_path, dst_path, compression="gzip", level=None, block_size=1048576):
+    """Stream-compress src_path into dst_path; the browser inflates it before handing it to sql.js."""
+    if compression == "none":
+        shutil.copyfile(src_path, dst_path)
+        return
+    if compression == "gzip":
+        with open(src_path, "rb") as src, gzip.GzipFile(
+            dst_path, "wb", compresslevel=9 if level is None else level, mtime=0
+        ) as dst:
+            shutil.copyfileobj(src, dst, block_size)
+        return
+    if compression == "brotli":
+        _require_brotli()
+        import brotli
+        compressor = brotli.Compressor(quality=11 if level is None else level)
+        with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+            for block in iter(lambda: src.read(block_size), b""):
+                dst.write(compressor.process(block))
+            dst.write(compressor.finish())
+        return
+    raise ValueError(f"지원하지 않는 압축 방식입니다: {compression} (지원: {', '.join(COMPRESSIONS)})")
+
+
+def package_database(db_file, payload_path, page_size=DEFAULT_PAGE_SIZE, strip_tables=None, compression="gzip"):
+    """
+    Pack and compress db_file into payload_path for embedding, without loading it into memory.
+
+    Returns:
+        dict: pack_database's report plus 'compression' and 'compressed_bytes'.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        packed_path = os.path.join(tmp, "packed.db")
+        report = pack_database(db_file, packed_path, page_size, strip_tables)
+        compress_file(packed_path, payload_path, compression)
+    report["compression"] = compression
+    report["compressed_bytes"] = os.path.getsize(payload_path)
+    return report
+
+
+def _require_brotli():
+    if importlib.util.find_spec("brotli") is None:
+        raise ImportError("brotli 압축에는 'brotli' 패키지가 필요합니다. (pip install brotli)")
+
+
+def format_package_report(report):
+    def mb(n):
+        return f"{n / 1048576:.2f} MB"
+
+    source = report["source_bytes"]
+    lines = [
+        f"📦 원본 DB      : {mb(source)} (빈 페이지 {report['source_free_pages']:,}개)",
+        f"   VACUUM INTO  : {mb(report['packed_bytes'])} (page_size {report['page_size']:,})",
+    ]
+    if report.get("stripped"):
+        lines.append(f"   제외 테이블  : {', '.join(report['stripped'])}")
+    if report.get("compression", "none") != "none":
+        lines.append(f"   {report['compression']:<12} : {mb(report['compressed_bytes'])}")
+    if "encoded_bytes" in report:
+        ratio = report["encoded_bytes"] / source if source else 1.0
+        lines.append(f"   Base64 JS    : {mb(report['encoded_bytes'])} (원본 대비 {ratio:.1%})")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        with tempfile.TemporaryDirectory() as tmp:
+            compression = sys.argv[2] if len(sys.argv) > 2 else "gzip"
+            report = package_database(sys.argv[1], os.path.join(tmp, "payload"), compression=compression)
+        print(format_package_report(report))
+    else:
+        print("Usage: python db_packager.py <db_file> [none|gzip|brotli]")
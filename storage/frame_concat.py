@@ -0,0 +1,39 @@
+"""
+frame_concat.py
+------------------------
+청크/구간 DataFrame을 컬럼 단위로 이어 붙여 최대 메모리를 줄이는 유틸리티
+"""
+
+import pandas as pd
+
+
+def concat_by_column(frames):
+    """
+    Concatenate an iterable of DataFrames (same columns) as they arrive.
+
+    Each frame is split into per-column copies and dropped right away, and
+    each column's pieces are released once merged, so the peak is about the
+    result plus one column instead of every frame plus the concatenated copy.
+    Columns are handled by position, so repeated column names are kept.
+
+    Returns:
+        pd.DataFrame: The concatenated frame (empty if there were no frames).
+    """
+    columns, pieces = None, None
+    for frame in frames:
+        if pieces is None:
+            columns = frame.columns
+            pieces = [[] for _ in columns]
+        for i, column_pieces in enumerate(pieces):
+            column_pieces.append(frame.iloc[:, i].copy())
+        del frame
+    if pieces is None:
+        return pd.DataFrame()
+
+    merged = []
+    for i in range(len(pieces)):
+        merged.append(pd.concat(pieces[i], ignore_index=True))
+        pieces[i] = None
+    df = pd.concat(merged, axis=1, ignore_index=True) if merged else pd.DataFrame()
+    df.columns = columns
+    return df
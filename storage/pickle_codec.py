@@ -0,0 +1,184 @@
+"""
+pickle_codec.py
+------------------------
+Pickle 파일 압축 코덱 (zstd / lz4 / gzip) 쓰기 및 자동 감지 읽기 유틸리티
+"""
+
+import importlib.util
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+
+CODECS = ("none", "zstd", "lz4", "gzip")
+
+# Leading bytes of each compressed container
+_MAGIC = (
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+    (b"\x04\x22\x4d\x18", "lz4"),
+    (b"\x1f\x8b", "gzip"),
+)
+
+_REQUIRED_MODULES = {"zstd": "zstandard", "lz4": "lz4"}
+
+_DEFAULT_LEVELS = {"zstd": 3, "lz4": 0, "gzip": 6}
+
+
+def normalize_codec(codec):
+    if not codec or codec == "none":
+        return "none"
+    codec = codec.lower()
+    if codec not in CODECS:
+        raise ValueError(f"지원하지 않는 압축 방식입니다: {codec} (지원: {', '.join(CODECS)})")
+    return codec
+
+
+def available_codecs():
+    """Return the codecs whose optional modules are importable."""
+    return [c for c in CODECS if c not in _REQUIRED_MODULES or importlib.util.find_spec(_REQUIRED_MODULES[c])]
+
+
+def write_pickle(obj, path, codec="none", level=None):
+    """
+    Pickle obj to path using the given codec.
+
+    zstd runs with all available cores (threads=-1) when the zstandard build
+    supports multithreading. 'none' keeps the previous pd.to_pickle output.
+    """
+    codec = normalize_codec(codec)
+    _require_module(codec)
+    level = _DEFAULT_LEVELS.get(codec) if level is None else level
+
+    if codec == "none":
+        pd.to_pickle(obj, path, compression=None)
+    elif codec == "zstd":
+        pd.to_pickle(obj, path, compression={"method": "zstd", "level": level, "threads": -1})
+    elif codec == "gzip":
+        pd.to_pickle(obj, path, compression={"method": "gzip", "compresslevel": level})
+    elif codec == "lz4":
+        import lz4.frame
+        with lz4.frame.open(path, "wb", compression_level=level) as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def read_pickle(path):
+    """Read a pickle written by write_pickle (or a plain pickle), detecting the codec."""
+    codec = detect_codec(path)
+    _require_module(codec)
+
+    if codec == "lz4":
+        import lz4.frame
+        with lz4.frame.open(path, "rb") as f:
+            return pickle.load(f)
+    if codec == "none":
+        return pd.read_pickle(path)
+    return pd.read_pickle(path, compression=codec)
+
+
+def compress_bytes(data, codec="none", level=None):
+    """Compress an in-memory payload with the given codec (same containers as write_pickle)."""
+    codec = normalize_codec(codec)
+    _require_module(codec)
+    level = _DEFAULT_LEVELS.get(codec) if level is None else level
+
+    if codec == "zstd":
+        import zstandard
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    if codec == "lz4":
+        import lz4.frame
+        return lz4.frame.compress(data, compression_level=level)
+    if codec == "gzip":
+        import gzip
+        return gzip.compress(data, compresslevel=level)
+    return data
+
+
+def decompress_bytes(data):
+    """Inverse of compress_bytes; the codec is detected from the leading bytes."""
+    codec = _codec_from_head(data[:4])
+    _require_module(codec)
+
+    if codec == "zstd":
+        import zstandard
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    if codec == "lz4":
+        import lz4.frame
+        return lz4.frame.decompress(data)
+    if codec == "gzip":
+        import gzip
+        return gzip.decompress(data)
+    return data
+
+
+def detect_codec(path):
+    with open(path, "rb") as f:
+        return _codec_from_head(f.read(4))
+
+
+def _codec_from_head(head):
+    for magic, codec in _MAGIC:
+        if head.startswith(magic):
+            return codec
+    return "none"
+
+
+def _require_module(codec):
+    module = _REQUIRED_MODULES.get(codec)
+    if module and importlib.util.find_spec(module) is None:
+        raise ImportError(f"{codec} 압축에는 '{module}' 패키지가 필요합니다. (pip install {module})")
+
+
+def benchmark_codecs(obj, codecs=None, work_dir=None):
+    """
+    Write/read obj with each codec and return a size vs time matrix.
+    'ratio' is relative to the first codec ('none' by default).
+
+    Returns:
+        list[dict]: {'codec', 'size_bytes', 'ratio', 'write_s', 'read_s'} per codec.
+    """
+    codecs = codecs or available_codecs()
+    rows = []
+    baseline_size = None
+    with tempfile.TemporaryDirectory(dir=work_dir) as tmp:
+        for codec in codecs:
+            path = os.path.join(tmp, f"bench.{codec}.pkl")
+            started = time.perf_counter()
+            write_pickle(obj, path, codec)
+            write_s = time.perf_counter() - started
+
+            started = time.perf_counter()
+            read_pickle(path)
+            read_s = time.perf_counter() - started
+
+            size = os.path.getsize(path)
+            if baseline_size is None:
+                baseline_size = size
+            rows.append({
+                "codec": codec,
+                "size_bytes": size,
+                "ratio": size / baseline_size if baseline_size else 1.0,
+                "write_s": write_s,
+                "read_s": read_s,
+            })
+    return rows
+
+
+def format_benchmark(rows):
+    lines = [f"{'codec':<6} {'size(MB)':>10} {'ratio':>7} {'write(s)':>9} {'read(s)':>9}"]
+    for r in rows:
+        lines.append(
+            f"{r['codec']:<6} {r['size_bytes'] / 1048576:>10.2f} {r['ratio']:>7.3f} "
+            f"{r['write_s']:>9.3f} {r['read_s']:>9.3f}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        print(format_benchmark(benchmark_codecs(read_pickle(sys.argv[1]))))
+    else:
+        print("Usage: python pickle_codec.py <pickle_file>")
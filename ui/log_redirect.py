@@ -1,18 +1,10 @@
 import tkinter as tk
 
+from ui.log_sink import BufferedLogSink
 
-class TextRedirector:
-    """Redirects stdout to a tkinter Text widget."""
 
-    def __init__(self, widget: tk.Text):
-        self.widget = widget
-
-    def write(self, text: str):
-        self.widget.configure(state='normal')
-        self.widget.insert(tk.END, text)
-        self.widget.see(tk.END)
-        self.widget.configure(state='disabled')
-        self.widget.update_idletasks()
+class TextRedirector(BufferedLogSink):
+    """Redirects stdout to a tkinter Text widget (buffered, flushed from the main loop)."""
 
-    def flush(self):
-        pass
+    def __init__(self, widget: tk.Text):
+        super().__init__(widget)
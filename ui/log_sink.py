@@ -0,0 +1,117 @@
+import logging
+import logging.handlers
+import os
+import queue
+import tkinter as tk
+
+
+DEFAULT_FLUSH_MS = 100
+DEFAULT_MAX_LINES = 5000
+DEFAULT_FILE_BYTES = 5 * 1048576
+DEFAULT_FILE_BACKUPS = 3
+
+
+class BufferedLogSink:
+    """
+    Thread-safe log target for a tkinter Text widget.
+
+    write()/log() only put text on a queue, so they are cheap and safe from
+    worker threads. Every `flush_ms` the main loop drains the queue into the
+    widget with a single insert, trims it to `max_lines` and scrolls to the
+    end only if the user was already there. With `log_path`, the same lines
+    are also appended to a size-rotated file.
+    """
+
+    def __init__(
+        self,
+        widget: tk.Text,
+        flush_ms=DEFAULT_FLUSH_MS,
+        max_lines=DEFAULT_MAX_LINES,
+        log_path=None,
+        max_bytes=DEFAULT_FILE_BYTES,
+        backup_count=DEFAULT_FILE_BACKUPS,
+    ):
+        self.widget = widget
+        self.flush_ms = flush_ms
+        self.max_lines = max_lines
+        self._queue = queue.SimpleQueue()
+        self._file_logger = _rotating_logger(log_path, max_bytes, backup_count) if log_path else None
+        widget.after(self.flush_ms, self._poll)
+
+    def log(self, message: str):
+        self._queue.put(f"{message}\n")
+
+    def write(self, text: str):
+        """File-like write, so the sink can replace sys.stdout."""
+        if text:
+            self._queue.put(text)
+
+    def flush(self):
+        pass
+
+    def _poll(self):
+        try:
+            self._drain()
+        finally:
+            try:
+                self.widget.after(self.flush_ms, self._poll)
+            except tk.TclError:
+                pass  # widget destroyed
+
+    def _drain(self):
+        parts = []
+        while True:
+            try:
+                parts.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if not parts:
+            return
+
+        text = "".join(parts)
+        if self._file_logger:
+            for line in text.splitlines():
+                self._file_logger.info(line)
+
+        widget = self.widget
+        at_end = widget.yview()[1] >= 0.999
+        restore_state = widget.cget("state")
+        widget.configure(state="normal")
+        widget.insert(tk.END, text)
+        if self.max_lines:
+            lines = int(widget.index("end-1c").split(".")[0])
+            if lines > self.max_lines:
+                widget.delete("1.0", f"{lines - self.max_lines + 1}.0")
+        widget.configure(state=restore_state)
+        if at_end:
+            widget.see(tk.END)
+
+
+def create_log_sink(widget: tk.Text, name: str) -> BufferedLogSink:
+    """
+    Sink configured from the environment: GUI_LOG_MAX_LINES caps the widget
+    (default 5000) and GUI_LOG_DIR, when set, tees to <GUI_LOG_DIR>/<name>.log.
+    """
+    log_dir = os.getenv("GUI_LOG_DIR")
+    log_path = None
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+        log_path = os.path.join(log_dir, f"{name}.log")
+    return BufferedLogSink(
+        widget,
+        max_lines=int(os.getenv("GUI_LOG_MAX_LINES", DEFAULT_MAX_LINES)),
+        log_path=log_path,
+    )
+
+
+def _rotating_logger(path, max_bytes, backup_count):
+    logger = logging.getLogger(f"sqlhandler.gui.{os.path.abspath(path)}")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    if not logger.handlers:
+        handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        logger.addHandler(handler)
+    return logger